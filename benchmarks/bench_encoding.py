@@ -0,0 +1,92 @@
+"""Benchmark JSON encoding throughput of read_docs and get_metadata responses.
+
+Three paths are compared for each response:
+
+- dump: model_dump() (where the tool returns a model) followed by FastMCP's
+  pydantic-core encoding, as tools were served before the encoding layer
+- one-pass: services.json_encoding.to_json on the tool's return value
+- cached: ResponseEncoder.cached for an unchanged page or schema version
+
+Usage:
+    python -m benchmarks.bench_encoding --tables 1000 10000 --sections 12 48
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pydantic_core
+
+from evidence_mcp.models.schemas import MetadataResponse
+from evidence_mcp.services import json_encoding
+from evidence_mcp.services.doc_registry import DOC_REGISTRY, DocRegistry
+from evidence_mcp.services.json_encoding import ResponseEncoder, to_json
+from evidence_mcp.services.schema_store import SchemaStore
+
+from .fixtures import make_docs_tree, make_schema_manifest
+
+
+def dump_then_encode(result: Any) -> str:
+    """The previous path: a dict dump, then FastMCP's encoding of the dict."""
+    if hasattr(result, "model_dump"):
+        result = result.model_dump()
+    return pydantic_core.to_json(result, fallback=str, indent=2).decode()
+
+
+def throughput(fn: Callable[[], str], repeat: int) -> tuple[float, float]:
+    """Best time in milliseconds and the resulting MB/s of encoded output."""
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = fn()
+        best = min(best, time.perf_counter() - start)
+        size = len(text.encode("utf-8"))
+    return best * 1000, size / max(best, 1e-9) / 1e6
+
+
+def report(label: str, result: Any, repeat: int) -> None:
+    """Print the throughput of each path for one response."""
+    encoder = ResponseEncoder()
+    encoder.cached(result, lambda: result)
+    paths = [
+        ("dump", lambda: dump_then_encode(result)),
+        ("one-pass", lambda: to_json(result)),
+        ("cached", lambda: encoder.cached(result, lambda: result)),
+    ]
+    size = len(to_json(result).encode("utf-8"))
+    for name, fn in paths:
+        ms, rate = throughput(fn, repeat)
+        print(f"{label:<28} {size / 1024:>9.0f} {name:<9} {ms:>9.3f} {rate:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--sections", type=int, nargs="+", default=[12, 48])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-orjson", action="store_true", help="Encode dicts with pydantic-core")
+    args = parser.parse_args()
+    if args.no_orjson:
+        json_encoding._orjson = None
+    encoder = "pydantic-core" if json_encoding._get_orjson() is None else "orjson"
+    print(f"dict encoder: {encoder}")
+    print(f"{'response':<28} {'KiB':>9} {'path':<9} {'ms':>9} {'MB/s':>12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_sections in args.sections:
+            docs = make_docs_tree(Path(tmp) / f"docs_{n_sections}", DOC_REGISTRY, n_sections)
+            page = DocRegistry(docs).lookup("charts", "LineChart")
+            report(f"read_docs[sections={n_sections}]", page, args.repeat)
+
+    for n_tables in args.tables:
+        n_sources = 1 if n_tables < 100 else 10
+        store = SchemaStore(make_schema_manifest(n_sources, n_tables // n_sources))
+        payload = MetadataResponse.payload(store.tables_json(), schema_version=1)
+        report(f"get_metadata[tables={n_tables}]", payload, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark debug_code error classification against a growing rule table.
+
+Usage:
+    python -m benchmarks.bench_error_rules --messages 10000 --rules 25 200 1000
+"""
+
+import argparse
+import random
+import time
+
+from evidence_mcp.services.error_rules import (
+    DEFAULT_RULES_PATH,
+    ErrorRule,
+    ErrorRuleEngine,
+    load_rules,
+    parse_rules,
+)
+
+MESSAGES = [
+    "Catalog Error: Table with name orders does not exist!",
+    'Binder Error: Referenced column "amount" not found in FROM clause!',
+    "Conversion Error: Could not convert string 'n/a' to INT32",
+    "Cannot read properties of undefined (reading 'value')",
+    "<Details> was left open",
+    "Error in Bar Chart: Dataset is required",
+    "Unexpected token in expression",
+    "Something went wrong while rendering the page",
+]
+
+
+def _synthetic_rules(count: int) -> list[ErrorRule]:
+    """Rules on made-up keywords that never match, padding the table."""
+    return parse_rules(
+        {
+            "name": f"synthetic-{i}",
+            "keywords": [f"code{i}", "failure"],
+            "category": "test",
+            "description": "Synthetic rule",
+            "fix": "Nothing to fix",
+        }
+        for i in range(count)
+    )
+
+
+def _linear_classify(rules: list[ErrorRule], message: str):
+    """The substring chain the engine replaces: every rule is tried in turn."""
+    lowered = message.lower()
+    for rule in rules:
+        if all(keyword in lowered for keyword in rule.keywords):
+            if rule.pattern is None or rule.pattern.search(message):
+                return rule
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--rules", type=int, nargs="+", default=[25, 200, 1000])
+    args = parser.parse_args()
+
+    random.seed(0)
+    messages = [random.choice(MESSAGES) for _ in range(args.messages)]
+    builtin = load_rules(DEFAULT_RULES_PATH)
+
+    for total in args.rules:
+        # Padding goes first so matching messages still scan past it linearly
+        rules = _synthetic_rules(max(0, total - len(builtin))) + builtin
+        engine = ErrorRuleEngine(rules)
+
+        start = time.perf_counter()
+        for message in messages:
+            _linear_classify(rules, message)
+        linear = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for message in messages:
+            engine.classify(message)
+        indexed = time.perf_counter() - start
+
+        print(
+            f"rules={len(rules):<5} linear={linear * 1e6 / len(messages):7.2f} us/msg  "
+            f"indexed={indexed * 1e6 / len(messages):6.2f} us/msg  "
+            f"speedup={linear / indexed:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
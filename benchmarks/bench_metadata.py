@@ -0,0 +1,121 @@
+"""Benchmark get_metadata responses: pydantic models vs the columnar schema store.
+
+The model path is the previous implementation: MetadataResponse.from_manifest
+followed by model_dump(). The store path builds a SchemaStore once per schema
+(as EvidenceClient does when the schema changes) and serializes from it. The
+client row is everything an EvidenceClient keeps after loading a project of
+the same size from disk: its file caches, schema index and version history.
+
+Usage:
+    python -m benchmarks.bench_metadata --tables 1000 10000 --columns 12
+"""
+
+import argparse
+import asyncio
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from evidence_mcp.models.schemas import MetadataResponse
+from evidence_mcp.services.evidence_client import EvidenceClient
+from evidence_mcp.services.schema_store import SchemaStore
+
+from .fixtures import make_evidence_project, make_schema_manifest
+
+
+def model_response(manifest: dict) -> dict:
+    """Serialize through a Table and Column model per entry."""
+    return MetadataResponse.from_manifest(manifest).model_dump()
+
+
+def store_response(store: SchemaStore) -> dict:
+    """Serialize from the columnar store."""
+    return MetadataResponse.payload(store.tables_json())
+
+
+def best_ms(fn: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of a call in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def peak_kib(fn: Callable[[], Any]) -> float:
+    """Peak memory allocated during a call, in KiB."""
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def retained_kib(build: Callable[[], Any]) -> float:
+    """Memory still allocated by an object after it is built, in KiB."""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current / 1024
+
+
+def loaded_client(project: Path) -> EvidenceClient:
+    """A client that has loaded a project's schema and built its index."""
+    client = EvidenceClient(evidence_project_path=project, parse_workers=1)
+    asyncio.run(client.get_schema_index())
+    return client
+
+
+def report(n_tables: int, n_columns: int, repeat: int) -> None:
+    """Print one row per path for a schema of the given size."""
+    n_sources = 1 if n_tables < 100 else 10
+    manifest = make_schema_manifest(n_sources, n_tables // n_sources, n_columns)
+    store = SchemaStore(manifest)
+    assert store_response(store) == model_response(manifest)
+    rows = (
+        # The model path has nothing to build; it keeps the normalized dicts
+        ("model", 0.0, lambda: model_response(manifest), 0.0),
+        (
+            "store",
+            best_ms(lambda: SchemaStore(manifest), repeat),
+            lambda: store_response(store),
+            retained_kib(lambda: SchemaStore(manifest)),
+        ),
+    )
+    for name, build, respond, kept in rows:
+        print(
+            f"{n_tables:>7} {store.column_count:>8}  {name:<6} {build:>9.1f} "
+            f"{best_ms(respond, repeat):>12.1f} {peak_kib(respond):>10.0f} {kept:>10.0f}"
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = make_evidence_project(Path(tmp), n_sources, n_tables // n_sources, n_columns)
+        kept = retained_kib(lambda: loaded_client(project))
+    print(f"{n_tables:>7} {store.column_count:>8}  {'client':<6} {'':>33} {kept:>10.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--columns", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'tables':>7} {'columns':>8}  {'path':<6} {'build ms':>9} {'response ms':>12} "
+        f"{'peak KiB':>10} {'kept KiB':>10}"
+    )
+    for n_tables in args.tables:
+        report(n_tables, args.columns, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
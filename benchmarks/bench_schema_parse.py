@@ -0,0 +1,53 @@
+"""Benchmark cold and warm schema metadata loads on a synthetic project.
+
+Usage:
+    python -m benchmarks.bench_schema_parse --sources 10 --tables 500
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from evidence_mcp.services.evidence_client import EvidenceClient
+
+from .fixtures import make_evidence_project
+
+
+def _time_parse(project: Path, workers: int) -> tuple[float, float]:
+    """Return (cold, warm) seconds for parsing a project's schema files."""
+    client = EvidenceClient(evidence_project_path=project, parse_workers=workers)
+    data_dir = project / "static" / "data"
+
+    start = time.perf_counter()
+    client._parse_evidence_schema_files(data_dir)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    client._parse_evidence_schema_files(data_dir)
+    warm = time.perf_counter() - start
+
+    asyncio.run(client.close())
+    return cold, warm
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, default=10)
+    parser.add_argument("--tables", type=int, default=500)
+    parser.add_argument("--columns", type=int, default=12)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = make_evidence_project(Path(tmp), args.sources, args.tables, args.columns)
+        total = args.sources * args.tables
+        print(f"{total} tables x {args.columns} columns")
+        for workers in args.workers:
+            cold, warm = _time_parse(project, workers)
+            print(f"workers={workers:<3} cold={cold * 1000:8.1f} ms  warm={warm * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Benchmark server startup: time to first response over stdio, and import time.
+
+Each run spawns `python -m evidence_mcp.server` the way an MCP client does,
+sends `initialize` and then `tools/list`, and times each reply from the moment
+the process was started. Most of that is the interpreter and the mcp SDK, so
+the import cost of evidence_mcp on top of the SDK is measured separately. The
+medians are checked against STARTUP_TARGET_MS and OWN_IMPORT_TARGET_MS.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 10
+    python -m benchmarks.bench_startup --profile --top 15
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Optional
+
+# Median milliseconds from spawn to the initialize reply
+STARTUP_TARGET_MS = 1000.0
+# Median milliseconds to import evidence_mcp.server once the SDK is loaded
+OWN_IMPORT_TARGET_MS = 60.0
+
+# Imported before timing evidence_mcp, as the server cannot start without them
+_SDK_MODULES = ("mcp.server.fastmcp", "starlette.requests", "starlette.responses")
+
+PROTOCOL_VERSION = "2025-06-18"
+_IMPORT_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _request(request_id: Optional[int], method: str, params: Optional[dict] = None) -> bytes:
+    message: dict = {"jsonrpc": "2.0", "method": method}
+    if request_id is not None:
+        message["id"] = request_id
+    if params is not None:
+        message["params"] = params
+    return json.dumps(message).encode() + b"\n"
+
+
+def _server_env() -> dict[str, str]:
+    env = dict(os.environ)
+    # The benchmark speaks stdio; file watching would only add a thread
+    env["EVIDENCE_MCP_TRANSPORT"] = "stdio"
+    env["EVIDENCE_MCP_WATCH_FILES"] = "false"
+    return env
+
+
+def time_startup(python: str = sys.executable, timeout: float = 30.0) -> dict[str, float]:
+    """Start the server once and time its first replies.
+
+    Returns:
+        Milliseconds from spawn to the initialize and the tools/list replies
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [python, "-m", "evidence_mcp.server"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=_server_env(),
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        proc.stdin.write(
+            _request(
+                1,
+                "initialize",
+                {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "bench_startup", "version": "0"},
+                },
+            )
+        )
+        proc.stdin.flush()
+        if not proc.stdout.readline():
+            raise RuntimeError("Server exited before replying to initialize")
+        initialize = time.perf_counter() - start
+
+        proc.stdin.write(_request(None, "notifications/initialized"))
+        proc.stdin.write(_request(2, "tools/list"))
+        proc.stdin.flush()
+        if not proc.stdout.readline():
+            raise RuntimeError("Server exited before replying to tools/list")
+        tools_list = time.perf_counter() - start
+    finally:
+        proc.stdin.close()
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    return {"initialize_ms": initialize * 1000, "tools_list_ms": tools_list * 1000}
+
+
+def time_own_import(python: str = sys.executable) -> float:
+    """Import evidence_mcp.server in a fresh interpreter with the SDK loaded.
+
+    Returns:
+        Milliseconds spent importing evidence_mcp and what it pulls in
+    """
+    code = (
+        f"import time\nimport {', '.join(_SDK_MODULES)}\n"
+        "start = time.perf_counter()\nimport evidence_mcp.server\n"
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    result = subprocess.run(
+        [python, "-c", code], capture_output=True, text=True, check=True, env=_server_env()
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def import_profile(module: str = "evidence_mcp.server", python: str = sys.executable) -> list:
+    """Import a module in a fresh interpreter under -X importtime.
+
+    Returns:
+        (module, self microseconds, cumulative microseconds, depth) per import,
+        in import order
+    """
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=_server_env(),
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def print_profile(rows: list, top: int) -> None:
+    """Summarize an import profile by top-level package and slowest modules."""
+    packages: dict[str, int] = {}
+    for name, self_us, _, _ in rows:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    total = sum(packages.values())
+    print(f"Total import time: {total / 1000:.1f} ms")
+    print("\nBy package (self time):")
+    for package, us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {package:<32} {us / 1000:8.1f} ms")
+    print("\nSlowest modules (self time):")
+    for name, self_us, cumulative_us, _ in sorted(rows, key=lambda row: -row[1])[:top]:
+        print(f"  {name:<48} {self_us / 1000:8.1f} ms  (cumulative {cumulative_us / 1000:.1f})")
+    ours = [row for row in rows if row[0].split(".")[0] == "evidence_mcp"]
+    print("\nevidence_mcp modules loaded at import:")
+    for name, self_us, _, _ in ours:
+        print(f"  {name:<48} {self_us / 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--target-ms", type=float, default=STARTUP_TARGET_MS)
+    parser.add_argument("--own-target-ms", type=float, default=OWN_IMPORT_TARGET_MS)
+    parser.add_argument("--profile", action="store_true", help="Print an import-time profile")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    if args.profile:
+        print_profile(import_profile(), args.top)
+        return
+
+    # Warm the OS file cache so the first run is not an outlier
+    time_startup()
+    runs = [time_startup() for _ in range(args.runs)]
+    for run in runs:
+        run["own_import_ms"] = time_own_import()
+    failed = False
+    for key, target in (
+        ("initialize_ms", args.target_ms),
+        ("tools_list_ms", None),
+        ("own_import_ms", args.own_target_ms),
+    ):
+        values = [run[key] for run in runs]
+        median = statistics.median(values)
+        line = (
+            f"{key:<16} median {median:8.1f} ms  "
+            f"best {min(values):8.1f} ms  worst {max(values):8.1f} ms"
+        )
+        if target is not None:
+            line += f"  target {target:.0f} ms" + ("  EXCEEDED" if median > target else "")
+            failed = failed or median > target
+        print(line)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark validate_evidence_content on large synthetic pages.
+
+The "edit" rows re-validate a realistic page after a one-line change in its
+middle, as edit_page does within a session.
+
+Usage:
+    python -m benchmarks.bench_validate --lines 1000 5000 20000
+"""
+
+import argparse
+import time
+
+from evidence_mcp.services.page_validator import ValidatedPage, validate_evidence_content
+
+from .fixtures import make_evidence_page
+
+
+def make_unclosed_page(n_lines: int) -> str:
+    """Distinct never-closed tags among self-closing ones.
+
+    This was the quadratic case of the old validator: every open tag was
+    substring-searched against every self-closing tag.
+    """
+    lines = []
+    for i in range(n_lines):
+        if i % 2:
+            lines.append(f"<Value data={{q{i}}} column=c{i} />\n")
+        else:
+            lines.append(f"<Widget{i} id={i}>\n")
+    return "".join(lines)
+
+
+def _edit_middle(page: str) -> str:
+    lines = page.splitlines(keepends=True)
+    lines.insert(len(lines) // 2, "<Grid cols=3>\n")
+    return "".join(lines)
+
+
+def _best_of(func, *args, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[1000, 5000, 20000])
+    args = parser.parse_args()
+
+    for n_lines in args.lines:
+        for label, page in (
+            ("realistic", make_evidence_page(n_lines)),
+            ("unclosed", make_unclosed_page(n_lines)),
+        ):
+            seconds = _best_of(validate_evidence_content, page)
+            mb_per_s = len(page) / seconds / 1e6
+            print(f"{label:<10} lines={n_lines:<7} {seconds * 1000:8.2f} ms  {mb_per_s:6.1f} MB/s")
+
+        page = make_evidence_page(n_lines)
+        validated = ValidatedPage.from_content(page)
+        edited = _edit_middle(page)
+        full = _best_of(validate_evidence_content, edited)
+        incremental = _best_of(validated.revalidate, edited)
+        print(
+            f"{'edit':<10} lines={n_lines:<7} {incremental * 1000:8.2f} ms  "
+            f"(full pass {full * 1000:.2f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark validate_project on a synthetic project of many pages.
+
+Usage:
+    python -m benchmarks.bench_validate_project --pages 400 --lines 600
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from evidence_mcp.services.project_validator import ProjectValidator
+
+from .fixtures import make_evidence_page
+
+
+def _time_validate(project: Path, workers: int) -> tuple[float, float, float]:
+    """Return (cold, warm, one page changed) seconds for validating a project."""
+    validator = ProjectValidator(project, workers=workers)
+    if workers > 1:
+        # Start the worker processes outside the timed region
+        validator._get_executor().submit(int).result()
+
+    start = time.perf_counter()
+    validator.validate()
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    validator.validate()
+    warm = time.perf_counter() - start
+
+    page = project / "pages" / "page_0.md"
+    stat = page.stat()
+    os.utime(page, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    start = time.perf_counter()
+    validator.validate()
+    changed = time.perf_counter() - start
+
+    validator.close()
+    return cold, warm, changed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--lines", type=int, default=600)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp)
+        pages = project / "pages"
+        pages.mkdir()
+        content = make_evidence_page(args.lines)
+        for i in range(args.pages):
+            (pages / f"page_{i}.md").write_text(content)
+
+        print(f"{args.pages} pages x {args.lines} lines")
+        for workers in args.workers:
+            cold, warm, changed = _time_validate(project, workers)
+            print(
+                f"workers={workers:<3} cold={cold * 1000:8.1f} ms  warm={warm * 1000:6.1f} ms  "
+                f"one changed={changed * 1000:6.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Synthetic, deterministic fixtures for benchmarks."""
+
+import json
+from pathlib import Path
+
+EVIDENCE_TYPES = ("number", "string", "date", "boolean")
+
+
+def make_evidence_project(
+    root: Path, n_sources: int, n_tables: int, n_columns: int = 12
+) -> Path:
+    """Generate an Evidence project with N sources x M tables of schema files.
+
+    Files are laid out the way Evidence writes them: a manifest.json listing
+    rendered parquet files plus one {table}.schema.json per table under
+    static/data/{source}/{table}/.
+
+    Args:
+        root: Directory to create the project in
+        n_sources: Number of sources
+        n_tables: Number of tables per source
+        n_columns: Number of columns per table
+
+    Returns:
+        Path to the project root
+    """
+    data_dir = root / "static" / "data"
+    rendered_files: dict[str, list[str]] = {}
+
+    for s in range(n_sources):
+        source = f"source_{s}"
+        rendered_files[source] = []
+        for t in range(n_tables):
+            table = f"table_{t}"
+            table_dir = data_dir / source / table
+            table_dir.mkdir(parents=True, exist_ok=True)
+            columns = [
+                {"name": f"col_{c}", "evidenceType": EVIDENCE_TYPES[(s + t + c) % 4]}
+                for c in range(n_columns)
+            ]
+            (table_dir / f"{table}.schema.json").write_text(json.dumps(columns))
+            rendered_files[source].append(f"static/data/{source}/{table}/{table}.parquet")
+
+    (data_dir / "manifest.json").write_text(json.dumps({"renderedFiles": rendered_files}))
+    return root
+
+
+_PAGE_BLOCK = """## Section {i}
+
+Some narrative text for section {i} with a {{inline_value}} expression.
+
+```sql query_{i}
+select category, sum(sales) as total
+from source.orders_{i}
+where total > {i}
+group by 1
+```
+
+<Grid cols=2>
+    <LineChart
+        data={{query_{i}}}
+        x=category
+        y=total
+    />
+    <BigValue data={{query_{i}}} value=total/>
+</Grid>
+
+<DataTable data={{query_{i}}}>
+    <Column id=category/>
+    <Column id=total fmt=usd/>
+</DataTable>
+
+"""
+
+
+def make_evidence_page(n_lines: int) -> str:
+    """Generate a realistic Evidence page of roughly n_lines lines.
+
+    The page repeats a block with a named SQL query, nested layout components,
+    multi-line tags and self-closing components.
+    """
+    block_lines = _PAGE_BLOCK.count("\n")
+    blocks = max(1, n_lines // block_lines)
+    return "# Generated page\n\n" + "".join(_PAGE_BLOCK.format(i=i) for i in range(blocks))
+
+
+def make_schema_manifest(n_sources: int, n_tables: int, n_columns: int = 12) -> dict:
+    """Generate a normalized {"sources": ...} schema, as get_schema_metadata returns."""
+    sources = {}
+    for s in range(n_sources):
+        tables = {}
+        for t in range(n_tables):
+            tables[f"table_{t}"] = {
+                "columns": [
+                    {
+                        "name": f"col_{c}",
+                        "type": ("Float64", "String", "Date", "Bool")[(s + t + c) % 4],
+                    }
+                    for c in range(n_columns)
+                ]
+            }
+        sources[f"source_{s}"] = {"tables": tables}
+    return {"sources": sources}
+
+
+_DOC_SECTION = """## Section {i}
+
+Options for section {i} of {name}. Use the `value_{i}` prop to control the
+behaviour, or combine it with `format_{i}` for custom output.
+
+```markdown
+<{name} data={{query_name}} value_{i}=column />
+```
+
+| Name | Description | Options |
+|------|-------------|---------|
+| value_{i} | Column to use | column name |
+| format_{i} | Format code | format string |
+
+"""
+
+
+def make_docs_tree(root: Path, registry: dict[str, dict[str, str]], n_sections: int = 12) -> Path:
+    """Write a synthetic markdown page for every file in a doc registry mapping.
+
+    Args:
+        root: Directory to create the docs in
+        registry: doc_type -> component -> path relative to the docs directory
+        n_sections: Number of headed sections per page
+
+    Returns:
+        Path to the docs directory
+    """
+    for category in registry.values():
+        for component, rel_path in category.items():
+            path = root / rel_path
+            if path.exists():
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            name = component.lstrip("_")
+            body = "".join(_DOC_SECTION.format(i=i, name=name) for i in range(n_sections))
+            path.write_text(f"---\ntitle: {name}\n---\n\n# {name}\n\n{body}")
+    return root
@@ -0,0 +1,339 @@
+"""Benchmark suite covering the server's tool and service hot paths.
+
+Every case runs on synthetic, deterministic fixtures. Results are written as
+JSON; with --baseline, they are compared against a stored run and the exit
+status is 1 if any case got slower than the tolerance allows.
+
+Usage:
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --baseline baseline.json --tolerance 0.25
+    python -m benchmarks.suite --quick --filter validate
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+from evidence_mcp.models.schemas import MetadataResponse
+from evidence_mcp.services.doc_registry import DOC_REGISTRY, DocRegistry
+from evidence_mcp.services.evidence_client import EvidenceClient
+from evidence_mcp.services.line_index import get_line_index
+from evidence_mcp.services.page_validator import ValidatedPage, validate_evidence_content
+from evidence_mcp.services.schema_store import SchemaStore
+
+from .bench_validate import make_unclosed_page
+from .fixtures import (
+    make_docs_tree,
+    make_evidence_page,
+    make_evidence_project,
+    make_schema_manifest,
+)
+
+FORMAT_VERSION = 1
+SCHEMA_TABLES = (10, 100, 1000, 10000)
+PAGE_LINES = (100, 1000, 10000, 50000)
+ERROR_BATCHES = (100, 1000, 5000)
+# Quick runs stop at these sizes
+QUICK_LIMITS = {"tables": 1000, "lines": 10000, "errors": 1000}
+
+
+class Case(NamedTuple):
+    """A benchmark: setup runs untimed before each timed call of run."""
+
+    name: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+    repeat: int = 5
+
+
+def _shared(value: Any) -> Callable[[], Any]:
+    return lambda: value
+
+
+def doc_cases(tmp: Path) -> Iterator[Case]:
+    """DocRegistry.lookup of every registered page, cold and warm."""
+    docs = make_docs_tree(tmp / "docs", DOC_REGISTRY)
+    keys = [
+        (doc_type, None if component == "_index" else component)
+        for doc_type, category in DOC_REGISTRY.items()
+        for component in category
+    ]
+
+    def lookup_all(registry: DocRegistry) -> None:
+        for doc_type, component in keys:
+            registry.lookup(doc_type, component)
+
+    yield Case("doc_lookup.cold", lambda: DocRegistry(docs), lookup_all)
+    warm = DocRegistry(docs)
+    lookup_all(warm)
+    yield Case("doc_lookup.warm", _shared(warm), lookup_all)
+    yield Case(
+        "doc_lookup.section",
+        _shared(warm),
+        lambda registry: [
+            registry.lookup(doc_type, component, section="Section 7", max_chars=2000)
+            for doc_type, component in keys
+        ],
+    )
+
+
+def schema_cases(tmp: Path, quick: bool, clients: list[EvidenceClient]) -> Iterator[Case]:
+    """EvidenceClient schema parsing over projects of growing size, cold and warm."""
+    for n_tables in SCHEMA_TABLES:
+        if quick and n_tables > QUICK_LIMITS["tables"]:
+            continue
+        n_sources = 1 if n_tables < 100 else 10
+        project = make_evidence_project(
+            tmp / f"project_{n_tables}", n_sources, n_tables // n_sources
+        )
+        data_dir = project / "static" / "data"
+
+        def cold_client(project: Path = project) -> EvidenceClient:
+            client = EvidenceClient(evidence_project_path=project)
+            clients.append(client)
+            return client
+
+        def parse(client: EvidenceClient, data_dir: Path = data_dir) -> None:
+            client._parse_evidence_schema_files(data_dir)
+
+        repeat = 3 if n_tables >= 10000 else 5
+        yield Case(f"schema_parse.cold[tables={n_tables}]", cold_client, parse, repeat)
+        warm = cold_client()
+        parse(warm)
+        yield Case(f"schema_parse.warm[tables={n_tables}]", _shared(warm), parse, repeat)
+
+
+def metadata_cases(quick: bool) -> Iterator[Case]:
+    """get_metadata responses over schemas of growing size, via models and SchemaStore."""
+    for n_tables in SCHEMA_TABLES:
+        if quick and n_tables > QUICK_LIMITS["tables"]:
+            continue
+        n_sources = 1 if n_tables < 100 else 10
+        manifest = make_schema_manifest(n_sources, n_tables // n_sources)
+        yield Case(
+            f"metadata_from_manifest[tables={n_tables}]",
+            _shared(manifest),
+            MetadataResponse.from_manifest,
+        )
+        yield Case(f"schema_store.build[tables={n_tables}]", _shared(manifest), SchemaStore)
+        yield Case(
+            f"schema_store.response[tables={n_tables}]",
+            _shared(SchemaStore(manifest)),
+            lambda store: MetadataResponse.payload(store.tables_json()),
+        )
+
+
+def validate_cases(quick: bool) -> Iterator[Case]:
+    """Page validation: full passes, the unclosed-tag worst case and an edit."""
+    for n_lines in PAGE_LINES:
+        if quick and n_lines > QUICK_LIMITS["lines"]:
+            continue
+        page = make_evidence_page(n_lines)
+        yield Case(f"validate[lines={n_lines}]", _shared(page), validate_evidence_content)
+        yield Case(
+            f"validate.unclosed[lines={n_lines}]",
+            _shared(make_unclosed_page(n_lines)),
+            validate_evidence_content,
+        )
+        lines = page.splitlines(keepends=True)
+        lines.insert(len(lines) // 2, "<Grid cols=3>\n")
+        edited = "".join(lines)
+        yield Case(
+            f"validate.edit[lines={n_lines}]",
+            lambda page=page: ValidatedPage.from_content(page),
+            lambda validated, edited=edited: validated.revalidate(edited),
+        )
+
+
+def debug_cases(quick: bool, loop: asyncio.AbstractEventLoop) -> Iterator[Case]:
+    """debug_code with large error batches on a 5000-line page."""
+    from evidence_mcp.server import debug_code
+
+    page = make_evidence_page(5000)
+    n_lines = page.count("\n")
+    messages = (
+        "Catalog Error: Table with name orders does not exist!",
+        'Binder Error: Referenced column "total" not found in FROM clause!',
+        "Required prop 'data' is missing",
+        "query_3 is not defined",
+        "Something unexpected went wrong",
+    )
+    for n_errors in ERROR_BATCHES:
+        if quick and n_errors > QUICK_LIMITS["errors"]:
+            continue
+        errors = [
+            {"message": messages[i % len(messages)], "line": 1 + i * 37 % n_lines, "column": 3}
+            for i in range(n_errors)
+        ]
+        yield Case(
+            f"debug_code[errors={n_errors}]",
+            # Include indexing the page, as for a new page_content
+            get_line_index.cache_clear,
+            lambda _, errors=errors: loop.run_until_complete(debug_code(errors, page)),
+        )
+
+    # Query reference errors on a page with many undefined references, which
+    # all need the page's query graph issues
+    queries = "".join(f"```sql query_{i}\nselect {i}\n```\n" for i in range(30))
+    refs = "".join(f"<Value data={{query_{i}x}}/>\n" for i in range(200))
+    ref_page = queries + refs
+    ref_lines = ref_page.count("\n")
+    for n_errors in (500,):
+        errors = [
+            {"message": f"query_{i % 200}x is not defined", "line": 1 + i % ref_lines}
+            for i in range(n_errors)
+        ]
+        yield Case(
+            f"debug_code.undefined[refs=200,errors={n_errors}]",
+            get_line_index.cache_clear,
+            lambda _, errors=errors: loop.run_until_complete(debug_code(errors, ref_page)),
+        )
+
+
+def measure(case: Case, repeat: Optional[int] = None) -> dict:
+    """Time a case.
+
+    Returns:
+        best and median milliseconds over the repetitions
+    """
+    timings = []
+    for _ in range(repeat or case.repeat):
+        state = case.setup()
+        start = time.perf_counter()
+        case.run(state)
+        timings.append(time.perf_counter() - start)
+    return {
+        "best_ms": round(min(timings) * 1000, 4),
+        "median_ms": round(statistics.median(timings) * 1000, 4),
+        "repeat": len(timings),
+    }
+
+
+def run_suite(pattern: str = "", quick: bool = False, repeat: Optional[int] = None) -> dict:
+    """Run every case whose name matches a regular expression.
+
+    Returns:
+        JSON-serializable results with environment information
+    """
+    results: dict[str, dict] = {}
+    clients: list[EvidenceClient] = []
+    loop = asyncio.new_event_loop()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        groups = (
+            lambda: doc_cases(tmp),
+            lambda: schema_cases(tmp, quick, clients),
+            lambda: metadata_cases(quick),
+            lambda: validate_cases(quick),
+            lambda: debug_cases(quick, loop),
+        )
+        for group in groups:
+            for case in group():
+                if not re.search(pattern, case.name):
+                    continue
+                results[case.name] = measure(case, repeat)
+                print(
+                    f"{case.name:<42} {results[case.name]['median_ms']:10.3f} ms", file=sys.stderr
+                )
+        for client in clients:
+            loop.run_until_complete(client.close())
+    loop.close()
+
+    return {
+        "version": FORMAT_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    tolerance: float,
+    metric: str = "median_ms",
+    min_delta_ms: float = 0.05,
+    report_missing: bool = True,
+) -> tuple[list[str], bool]:
+    """Compare results against a baseline run.
+
+    Args:
+        current: Results of this run
+        baseline: Stored results
+        tolerance: Allowed slowdown as a fraction (0.25 allows 25% slower)
+        metric: Timing to compare, best_ms or median_ms
+        min_delta_ms: Slowdowns smaller than this are treated as noise
+        report_missing: List baseline cases this run did not include
+
+    Returns:
+        Report lines, and whether any case regressed
+    """
+    lines = []
+    regressed = False
+    base_results = baseline.get("results", {})
+    for name, result in current["results"].items():
+        base = base_results.get(name)
+        if base is None:
+            lines.append(f"{name:<42} {result[metric]:10.3f} ms  (new)")
+            continue
+        ratio = result[metric] / base[metric] if base[metric] else float("inf")
+        status = "ok"
+        if ratio > 1 + tolerance and result[metric] - base[metric] > min_delta_ms:
+            status = "REGRESSED"
+            regressed = True
+        elif ratio < 1 / (1 + tolerance):
+            status = "faster"
+        lines.append(
+            f"{name:<42} {result[metric]:10.3f} ms  baseline {base[metric]:10.3f} ms  "
+            f"x{ratio:5.2f}  {status}"
+        )
+    if report_missing:
+        for name in base_results:
+            if name not in current["results"]:
+                lines.append(f"{name:<42} (not run)")
+    return lines, regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="Write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="Compare against stored results")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--metric", choices=("best_ms", "median_ms"), default="median_ms")
+    parser.add_argument("--filter", default="", help="Regex over case names, e.g. '^validate'")
+    parser.add_argument("--quick", action="store_true", help="Skip the largest fixtures")
+    parser.add_argument("--repeat", type=int, help="Override repetitions per case")
+    args = parser.parse_args()
+
+    current = run_suite(args.filter, args.quick, args.repeat)
+
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+    elif not args.baseline:
+        print(json.dumps(current, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("version") != FORMAT_VERSION:
+            sys.exit(f"Unsupported baseline format: {baseline.get('version')}")
+        lines, regressed = compare(
+            current, baseline, args.tolerance, args.metric, report_missing=not args.filter
+        )
+        print("\n".join(lines))
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Configuration management for Evidence MCP server."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -17,14 +18,42 @@ class Settings(BaseSettings):
 
     # Evidence dev server settings
     evidence_dev_url: str = "http://localhost:3000"
+    evidence_connect_timeout: float = 0.5  # Seconds; keeps a stopped dev server cheap
+    evidence_request_timeout: float = 10.0
+    dev_manifest_ttl: float = 5.0  # Seconds a dev server manifest is reused
     evidence_project_path: Optional[Path] = None
+    schema_parse_workers: int = 8  # Threads used to read schema files on large projects
+    schema_snapshots: int = 16  # Schema versions kept for get_metadata_changes
+    validate_workers: Optional[int] = None  # Processes for validate_project (CPU count)
+    error_rules_path: Optional[Path] = None  # Extra debug_code rules, tried before built-ins
+
+    # Table sampling and profiling (needs the duckdb extra)
+    duckdb_connections: int = 4  # Pooled DuckDB connections
+    duckdb_threads: Optional[int] = None  # DuckDB threads per query (DuckDB default)
+    table_data_cache_size: int = 256  # Sample and profile results kept in memory (0 disables)
 
     # MCP server settings
     server_name: str = "Evidence AI Assistant"
     transport: str = "stdio"  # stdio, sse, or streamable-http
+    host: str = "127.0.0.1"  # Bind address for sse and streamable-http
+    port: int = 8000
+    response_cache_size: int = 32  # Encoded read_docs/get_metadata responses kept (0 disables)
+
+    # Production serving (streamable-http)
+    workers: int = 1  # Server processes; more than one implies stateless_http
+    stateless_http: bool = False  # No session state between requests
+    limit_concurrency: Optional[int] = None  # Connections per worker before 503s
+    graceful_shutdown_timeout: float = 30.0  # Seconds to finish requests on shutdown
+    metrics_dir: Optional[Path] = None  # Worker metrics snapshots (temporary directory)
 
     # Documentation settings
     docs_path: Path = Path(__file__).parent.parent.parent / "docs"
+    doc_cache_size: int = 128  # Parsed documents kept in memory (0 disables)
+    docs_bundle_path: Optional[Path] = None  # Defaults to docs.bundle next to docs_path
+
+    # File watching (keeps caches fresh in long-running deployments)
+    watch_files: bool = False
+    watch_interval: float = 2.0  # Seconds between polls
 
     def get_docs_path(self) -> Path:
         """Get the absolute path to the docs directory."""
@@ -32,5 +61,23 @@ class Settings(BaseSettings):
             return self.docs_path
         return Path(__file__).parent.parent.parent / self.docs_path
 
+    def get_docs_bundle_path(self) -> Path:
+        """Get the absolute path to the compiled documentation bundle."""
+        if self.docs_bundle_path is None:
+            return self.get_docs_path().parent / "docs.bundle"
+        if self.docs_bundle_path.is_absolute():
+            return self.docs_bundle_path
+        return Path(__file__).parent.parent.parent / self.docs_bundle_path
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load the settings (environment and .env) on first use."""
+    return Settings()
+
 
-settings = Settings()
+def __getattr__(name: str):
+    # `from .config import settings` keeps working, without reading .env at import
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,19 +3,65 @@
 from .schemas import (
     Column,
     Table,
+    ColumnStatistics,
+    TableStatistics,
     MetadataResponse,
+    ColumnTypeChange,
+    TableChange,
+    MetadataChangesResponse,
+    SampleTableResponse,
+    ValueCount,
+    HistogramBin,
+    ColumnProfileResponse,
     DocResponse,
+    SearchResult,
+    SearchResponse,
     EditPageResponse,
+    PageWarnings,
+    ValidateProjectResponse,
+    QueryNode,
+    QueryGraphIssue,
+    QueryGraphResponse,
+    ProjectQueryGraphResponse,
+    SourceBlock,
+    ErrorLocation,
     FixSuggestion,
     DebugResponse,
+    ToolMetrics,
+    CacheMetrics,
+    DevServerStatus,
+    ServerStatsResponse,
 )
 
 __all__ = [
     "Column",
     "Table",
+    "ColumnStatistics",
+    "TableStatistics",
     "MetadataResponse",
+    "ColumnTypeChange",
+    "TableChange",
+    "MetadataChangesResponse",
+    "SampleTableResponse",
+    "ValueCount",
+    "HistogramBin",
+    "ColumnProfileResponse",
     "DocResponse",
+    "SearchResult",
+    "SearchResponse",
     "EditPageResponse",
+    "PageWarnings",
+    "ValidateProjectResponse",
+    "QueryNode",
+    "QueryGraphIssue",
+    "QueryGraphResponse",
+    "ProjectQueryGraphResponse",
+    "SourceBlock",
+    "ErrorLocation",
     "FixSuggestion",
     "DebugResponse",
+    "ToolMetrics",
+    "CacheMetrics",
+    "DevServerStatus",
+    "ServerStatsResponse",
 ]
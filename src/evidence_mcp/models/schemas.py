@@ -1,29 +1,99 @@
 """Pydantic models for Evidence MCP server responses."""
 
-from typing import Literal, Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from ..services.parquet_footer import ParquetFooter
+    from ..services.schema_versions import SchemaChanges
+
+
+class _Model(BaseModel):
+    """Base for response models.
+
+    Validators and serializers are built on a model's first use rather than
+    at import, so server startup does not pay for tools that are never called.
+    """
+
+    model_config = ConfigDict(defer_build=True)
 
 
 # Metadata models
-class Column(BaseModel):
+class Column(_Model):
     """Represents a database column."""
 
     name: str
     type: str  # String|Int64|Float64|Date32|Decimal(p,s)
 
 
-class Table(BaseModel):
+class Table(_Model):
     """Represents a database table with its columns."""
 
     name: str  # format: source_name.table_name
     columns: list[Column]
 
 
-class MetadataResponse(BaseModel):
+class ColumnStatistics(_Model):
+    """Statistics of a column, read from its table's Parquet file."""
+
+    name: str
+    null_count: Optional[int] = None  # None if not recorded for every row group
+    min: Any = None
+    max: Any = None
+    compressed_bytes: int
+
+
+class TableStatistics(_Model):
+    """Row count and sizes of a table, read from its Parquet file's footer."""
+
+    row_count: int
+    file_bytes: int
+    row_groups: int
+    columns: list[ColumnStatistics]
+
+    @classmethod
+    def from_footer(cls, footer: "ParquetFooter") -> "TableStatistics":
+        """Create TableStatistics from a decoded Parquet footer."""
+        return cls(
+            row_count=footer.num_rows,
+            file_bytes=footer.file_size,
+            row_groups=footer.row_groups,
+            columns=[
+                ColumnStatistics(
+                    name=column.name,
+                    null_count=column.null_count,
+                    min=column.min,
+                    max=column.max,
+                    compressed_bytes=column.compressed_size,
+                )
+                for column in footer.columns
+            ],
+        )
+
+
+class MetadataResponse(_Model):
     """Response from get_metadata tool."""
 
     tables: list[Table]
+    # Populated only for filtered or paginated requests
+    total_tables: Optional[int] = None
+    next_cursor: Optional[str] = None
+    # Populated only when statistics are requested, keyed by table name
+    stats: Optional[dict[str, TableStatistics]] = None
+    # Pass to get_metadata_changes to fetch only what changed since this response
+    schema_version: Optional[int] = None
+
+    @classmethod
+    def payload(cls, tables: list[dict], **fields: Any) -> dict:
+        """The model_dump() of a response, built from plain table dicts.
+
+        Large schemas are served this way, without a Table and Column model
+        per entry (see SchemaStore). Other fields must already be dumped.
+        """
+        data = {name: field.default for name, field in cls.model_fields.items()}
+        data.update(fields, tables=tables)
+        return data
 
     @classmethod
     def from_manifest(cls, manifest: dict) -> "MetadataResponse":
@@ -58,6 +128,107 @@ class MetadataResponse(BaseModel):
         return cls(tables=tables)
 
 
+def _column(column: dict) -> Column:
+    return Column(name=column.get("name", ""), type=column.get("type", "unknown"))
+
+
+class ColumnTypeChange(_Model):
+    """A column whose type changed between two schema versions."""
+
+    name: str
+    old_type: str
+    new_type: str
+
+
+class TableChange(_Model):
+    """Column changes of a table present in both schema versions."""
+
+    name: str
+    added_columns: list[Column] = Field(default_factory=list)
+    removed_columns: list[str] = Field(default_factory=list)
+    changed_columns: list[ColumnTypeChange] = Field(default_factory=list)
+    reordered: bool = False  # Same columns as before, in a different order
+
+
+class MetadataChangesResponse(_Model):
+    """Response from get_metadata_changes tool."""
+
+    version: int
+    since_version: Optional[int] = None
+    # True if since_version is unknown or too old; call get_metadata instead
+    full_refresh: bool = False
+    added_tables: list[Table] = Field(default_factory=list)
+    removed_tables: list[str] = Field(default_factory=list)
+    changed_tables: list[TableChange] = Field(default_factory=list)
+
+    @classmethod
+    def from_changes(
+        cls, since_version: int, changes: "SchemaChanges"
+    ) -> "MetadataChangesResponse":
+        """Create MetadataChangesResponse from a diff between schema versions."""
+        return cls(
+            version=changes.version,
+            since_version=since_version,
+            added_tables=[
+                Table(name=name, columns=[_column(column) for column in columns])
+                for name, columns in changes.added
+            ],
+            removed_tables=changes.removed,
+            changed_tables=[
+                TableChange(
+                    name=diff.name,
+                    added_columns=[_column(column) for column in diff.added_columns],
+                    removed_columns=diff.removed_columns,
+                    changed_columns=[
+                        ColumnTypeChange(name=name, old_type=old, new_type=new)
+                        for name, old, new in diff.changed_types
+                    ],
+                    reordered=diff.reordered,
+                )
+                for diff in changes.altered
+            ],
+        )
+
+
+class SampleTableResponse(_Model):
+    """Response from sample_table tool."""
+
+    table: str
+    columns: list[str]
+    rows: list[list[Any]]  # values in the order of columns
+    total_rows: int
+
+
+class ValueCount(_Model):
+    """A value of a column and how often it occurs."""
+
+    value: Any
+    count: int
+
+
+class HistogramBin(_Model):
+    """An equal-width histogram bin of a numeric column."""
+
+    lower: float
+    upper: float
+    count: int
+
+
+class ColumnProfileResponse(_Model):
+    """Response from profile_column tool."""
+
+    table: str
+    column: str
+    type: str  # DuckDB type
+    row_count: int
+    null_count: int
+    distinct_count: int
+    min: Any = None
+    max: Any = None
+    top_values: list[ValueCount] = Field(default_factory=list)
+    histogram: Optional[list[HistogramBin]] = None  # numeric columns only
+
+
 # Documentation models
 DocType = Literal[
     "charts",
@@ -81,7 +252,7 @@ DocType = Literal[
 ]
 
 
-class DocResponse(BaseModel):
+class DocResponse(_Model):
     """Response from read_docs tool."""
 
     doc_type: DocType
@@ -89,10 +260,32 @@ class DocResponse(BaseModel):
     title: str
     content: str
     related_docs: list[str] = Field(default_factory=list)
+    # Populated only for partial reads (section and/or max_chars requested)
+    section: Optional[str] = None
+    sections: list[str] = Field(default_factory=list)
+    total_chars: Optional[int] = None
+    next_cursor: Optional[int] = None
+
+
+class SearchResult(_Model):
+    """A ranked documentation search hit."""
+
+    doc_type: DocType
+    component: Optional[str] = None
+    title: str
+    score: float
+    snippet: str
+
+
+class SearchResponse(_Model):
+    """Response from search_docs tool."""
+
+    query: str
+    results: list[SearchResult] = Field(default_factory=list)
 
 
 # Edit page models
-class EditPageResponse(BaseModel):
+class EditPageResponse(_Model):
     """Response from edit_page tool."""
 
     success: bool
@@ -101,19 +294,135 @@ class EditPageResponse(BaseModel):
     warnings: list[str] = Field(default_factory=list)
 
 
+# Project validation models
+class PageWarnings(_Model):
+    """Validation warnings for one page of a project."""
+
+    path: str
+    warnings: list[str] = Field(default_factory=list)
+
+
+class ValidateProjectResponse(_Model):
+    """Response from validate_project tool."""
+
+    pages_path: str
+    total_pages: int
+    pages_with_warnings: int
+    pages: list[PageWarnings] = Field(default_factory=list)
+
+
+# Query graph models
+class QueryNode(_Model):
+    """A query and its connections within a page."""
+
+    name: str
+    line: Optional[int] = None  # None for queries loaded from SQL files
+    depends_on: list[str] = Field(default_factory=list)
+    used_by: list[str] = Field(default_factory=list)
+    components: list[str] = Field(default_factory=list)
+
+
+class QueryGraphIssue(_Model):
+    """An undefined or cyclic query reference."""
+
+    kind: str
+    name: str
+    line: Optional[int] = None
+    message: str
+    suggestion: Optional[str] = None
+
+
+class QueryGraphResponse(_Model):
+    """Response from get_query_graph tool for a single page."""
+
+    page: Optional[str] = None
+    queries: list[QueryNode] = Field(default_factory=list)
+    issues: list[QueryGraphIssue] = Field(default_factory=list)
+
+
+class ProjectQueryGraphResponse(_Model):
+    """Response from get_query_graph tool for a whole project."""
+
+    total_pages: int
+    total_queries: int
+    pages_with_issues: list[QueryGraphResponse] = Field(default_factory=list)
+
+
 # Debug models
-class FixSuggestion(BaseModel):
+class SourceBlock(_Model):
+    """A SQL or code block, or a component, enclosing an error."""
+
+    kind: str  # "sql", "code" or "component"
+    name: str
+    line_range: tuple[int, int]
+
+
+class ErrorLocation(_Model):
+    """The source an error points at."""
+
+    line: int
+    column: Optional[int] = None
+    source_line: str
+    context: str
+    block: Optional[SourceBlock] = None
+
+
+class FixSuggestion(_Model):
     """A suggested fix for a validation error."""
 
     error_index: int
     description: str
     suggested_fix: str
     line_range: Optional[tuple[int, int]] = None
+    category: Optional[str] = None
+    doc_link: Optional[str] = None
+    location: Optional[ErrorLocation] = None
 
 
-class DebugResponse(BaseModel):
+class DebugResponse(_Model):
     """Response from debug_code tool."""
 
     analysis: str
     suggestions: list[FixSuggestion] = Field(default_factory=list)
     fixed_content: Optional[str] = None
+
+
+class ToolMetrics(_Model):
+    """Call statistics of one tool."""
+
+    name: str
+    calls: int
+    errors: int
+    latency_mean_ms: float
+    latency_p50_ms: float  # Estimated from histogram buckets
+    latency_p95_ms: float
+    response_bytes_total: int
+    response_bytes_mean: float
+
+
+class CacheMetrics(_Model):
+    """Hit statistics of one cache."""
+
+    name: str
+    hits: int
+    misses: int
+    hit_ratio: Optional[float] = None  # None before the first lookup
+    size: Optional[int] = None
+
+
+class DevServerStatus(_Model):
+    """Circuit breaker state of the Evidence dev server."""
+
+    status: str  # up, down or half-open
+    consecutive_failures: int
+    retry_in: float  # Seconds until the next probe while down
+
+
+class ServerStatsResponse(_Model):
+    """Response from server_stats tool."""
+
+    uptime_seconds: float
+    transport: str
+    tools: list[ToolMetrics] = Field(default_factory=list)
+    caches: list[CacheMetrics] = Field(default_factory=list)
+    dev_server: Optional[DevServerStatus] = None  # None until the Evidence client is used
@@ -0,0 +1,125 @@
+"""Production serving: streamable-http over uvicorn with several worker processes.
+
+Each worker is a separate process with its own event loop and services, so
+CPU-bound tool calls in one worker do not hold up clients of the others.
+Requests are stateless when there is more than one worker, as any worker may
+receive any request.
+
+Documentation is shared through the compiled docs bundle: the parent process
+rebuilds it if it is missing or out of date before the workers start, and
+every worker memory-maps the same read-only file, so the OS keeps a single
+copy of it. Schema state is parsed by each worker on first use and cached
+until the schema files change.
+
+Metrics are shared through snapshot files in a directory that every worker
+writes to (see Metrics.share), so /metrics reports all workers.
+"""
+
+import contextlib
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator
+
+from starlette.applications import Starlette
+
+from . import server
+from .config import settings
+from .services.doc_bundle import DocBundle, build_bundle, registry_paths
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_docs_bundle(docs_path: Path, bundle_path: Path) -> bool:
+    """Build the docs bundle unless it is current.
+
+    Args:
+        docs_path: Path to the directory containing documentation files
+        bundle_path: Bundle file the workers will map
+
+    Returns:
+        True if the bundle was (re)built
+    """
+    rel_paths = registry_paths()
+    bundle = DocBundle.open(bundle_path)
+    if bundle is not None:
+        current = bundle.is_current(docs_path, rel_paths)
+        bundle.close()
+        if current:
+            return False
+    try:
+        count = build_bundle(docs_path, bundle_path, rel_paths)
+    except OSError as e:
+        # Workers fall back to reading docs from disk
+        logger.warning(f"Could not build doc bundle {bundle_path}: {e}")
+        return False
+    logger.info(f"Built doc bundle {bundle_path} ({count} files)")
+    return True
+
+
+def prepare_metrics_dir(metrics_dir: Path) -> None:
+    """Create the shared metrics directory and clear snapshots of earlier runs."""
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    for path in metrics_dir.glob("worker-*.json"):
+        path.unlink(missing_ok=True)
+
+
+def create_app() -> Starlette:
+    """Create the streamable-http app of one worker (a uvicorn app factory).
+
+    The app's lifespan runs the MCP session manager and, on shutdown, closes
+    the services once in-flight requests are done. With a metrics directory
+    configured, the worker's metrics are shared through it.
+    """
+    if settings.metrics_dir is not None:
+        server.metrics.share(settings.metrics_dir)
+    mcp = server.get_mcp()
+    app = mcp.streamable_http_app()
+    session_manager = mcp.session_manager
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with session_manager.run():
+            try:
+                yield
+            finally:
+                await server.close_services()
+                server.metrics.flush()
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+def serve() -> None:
+    """Serve streamable-http with the configured workers and limits."""
+    import uvicorn
+
+    prepare_docs_bundle(settings.get_docs_path(), settings.get_docs_bundle_path())
+    metrics_dir = settings.metrics_dir
+    temporary = metrics_dir is None and settings.workers > 1
+    if temporary:
+        metrics_dir = Path(tempfile.mkdtemp(prefix="evidence-mcp-metrics-"))
+        # Workers are new processes and read their settings from the environment
+        os.environ["EVIDENCE_MCP_METRICS_DIR"] = str(metrics_dir)
+    if metrics_dir is not None:
+        prepare_metrics_dir(metrics_dir)
+    logger.info(
+        f"Serving streamable-http on {settings.host}:{settings.port} "
+        f"with {settings.workers} worker(s)"
+    )
+    try:
+        uvicorn.run(
+            f"{__name__}:create_app",
+            factory=True,
+            host=settings.host,
+            port=settings.port,
+            workers=settings.workers,
+            limit_concurrency=settings.limit_concurrency,
+            timeout_graceful_shutdown=settings.graceful_shutdown_timeout,
+            log_level="info",
+        )
+    finally:
+        if temporary:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
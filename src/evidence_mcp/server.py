@@ -1,22 +1,61 @@
 """Main MCP server for Evidence AI Assistant."""
 
+import asyncio
 import logging
 import re
 import sys
-from typing import Annotated, Optional
+import time
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Optional, Union
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 
-from .config import settings
+from .config import get_settings
 from .models.schemas import (
+    CacheMetrics,
+    ColumnProfileResponse,
     DebugResponse,
+    DevServerStatus,
     DocType,
     EditPageResponse,
+    ErrorLocation,
     FixSuggestion,
+    MetadataChangesResponse,
     MetadataResponse,
+    PageWarnings,
+    ProjectQueryGraphResponse,
+    QueryGraphIssue,
+    QueryGraphResponse,
+    QueryNode,
+    SampleTableResponse,
+    SearchResponse,
+    ServerStatsResponse,
+    SourceBlock,
+    TableStatistics,
+    ToolMetrics,
+    ValidateProjectResponse,
 )
-from .services.doc_registry import DocRegistry
-from .services.evidence_client import EvidenceClient
+from .services.metrics import Metrics, lru_cache_info
+
+# Services are imported where they are first used, so a stdio launch only
+# loads what its first tool calls need before answering `initialize`
+if TYPE_CHECKING:
+    from .services.doc_registry import DocRegistry
+    from .services.doc_search import DocSearchIndex
+    from .services.error_rules import ErrorRuleEngine
+    from .services.evidence_client import EvidenceClient
+    from .services.file_watcher import FileWatcher
+    from .services.json_encoding import ResponseEncoder
+    from .services.line_index import LineIndex
+    from .services.page_validator import PageValidationCache
+    from .services.project_validator import ProjectValidator
+    from .services.query_graph import PageQueryGraph, ProjectQueryGraph, QueryIssue
+    from .services.schema_index import SchemaIndex
+    from .services.table_data import TableDataReader
 
 # Configure logging to stderr (important for STDIO transport)
 logging.basicConfig(
@@ -26,53 +65,474 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize FastMCP server
-mcp = FastMCP(name=settings.server_name)
+# Tool and cache metrics, served by the server_stats tool and /metrics
+metrics = Metrics()
+
+
+def _response_size(result: Any) -> tuple[int, bool]:
+    """Size in bytes of a converted tool result, and whether it reports an error."""
+    if isinstance(result, tuple):
+        result = result[0]
+    size = 0
+    error = False
+    for block in result if isinstance(result, list) else ():
+        text = getattr(block, "text", None)
+        if text is None:
+            continue
+        # Tools report handled failures as {"error": ..., ...}
+        error = error or text.startswith('{\n  "error":')
+        size += len(text) if text.isascii() else len(text.encode("utf-8"))
+    return size, error
+
+
+class InstrumentedFastMCP(FastMCP):
+    """FastMCP server that records the latency, response size and errors of tool calls.
+
+    Tools return a dict, a response model or pre-encoded JSON text. Dicts and
+    models are encoded here in one pass (see services.json_encoding), so a
+    model is never dumped to a dict first; the client gets the same JSON in
+    every case.
+    """
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        """Call a tool by name with arguments, recording its metrics."""
+        tool = self._tool_manager.get_tool(name)
+        if tool is None:
+            # Keep arbitrary names from creating metric series
+            return await super().call_tool(name, arguments)
+        start = time.perf_counter()
+        try:
+            result = await tool.run(arguments, context=self.get_context())
+            if tool.fn_metadata.output_schema is None and isinstance(result, (dict, BaseModel)):
+                result = get_response_encoder().encode(result)
+            result = tool.fn_metadata.convert_result(result)
+        except Exception:
+            metrics.record(name, time.perf_counter() - start, 0, error=True)
+            raise
+        size, error = _response_size(result)
+        metrics.record(name, time.perf_counter() - start, size, error)
+        return result
+
+
+# Tools, registered on the FastMCP server when it is built
+_tools: list[Callable] = []
+_mcp: Optional[InstrumentedFastMCP] = None
+
+
+def _tool(fn: Callable) -> Callable:
+    """Register a function as a tool of the server built by get_mcp."""
+    _tools.append(fn)
+    return fn
+
+
+def get_mcp() -> InstrumentedFastMCP:
+    """Get the FastMCP server, built from the settings on first use."""
+    global _mcp
+    if _mcp is None:
+        settings = get_settings()
+        server = InstrumentedFastMCP(
+            name=settings.server_name,
+            host=settings.host,
+            port=settings.port,
+            # Sessions live in the process that created them, and requests are not
+            # routed back to it when several workers share the port
+            stateless_http=settings.stateless_http or settings.workers > 1,
+        )
+        for fn in _tools:
+            # Results are encoded by call_tool, not validated against an output schema
+            server.tool(structured_output=False)(fn)
+        server.custom_route("/metrics", methods=["GET"])(prometheus_metrics)
+        _mcp = server
+    return _mcp
+
 
 # Initialize services (lazy initialization)
-_evidence_client: Optional[EvidenceClient] = None
-_doc_registry: Optional[DocRegistry] = None
+_evidence_client: Optional["EvidenceClient"] = None
+_doc_registry: Optional["DocRegistry"] = None
+_doc_search_index: Optional["DocSearchIndex"] = None
+_file_watcher: Optional["FileWatcher"] = None
+_project_validator: Optional["ProjectValidator"] = None
+_project_query_graph: Optional["ProjectQueryGraph"] = None
+_error_rules: Optional["ErrorRuleEngine"] = None
+_table_data: Optional["TableDataReader"] = None
+_response_encoder: Optional["ResponseEncoder"] = None
+# Per-session validation state for edit_page, dropped with the session
+_page_caches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
+def _on_docs_changed(paths: set[Path]) -> None:
+    """Refresh cached docs and search postings for changed documentation files."""
+    if _doc_registry is None:
+        return
+    changed = _doc_registry.invalidate(paths)
+    if _doc_search_index is None:
+        return
+    for rel_path in changed:
+        entry = _doc_registry.get_index_entry(rel_path)
+        if entry is None:
+            _doc_search_index.remove_document(rel_path)
+        else:
+            doc_type, component, doc_id, title, content = entry
+            _doc_search_index.add_document(doc_id, doc_type, component, title, content)
+
+
+def ensure_file_watcher() -> None:
+    """Start the file watcher on the running event loop, if enabled."""
+    global _file_watcher
+    settings = get_settings()
+    if _file_watcher is not None or not settings.watch_files:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    from .services.file_watcher import FileWatcher
+
+    watcher = _file_watcher = FileWatcher(interval=settings.watch_interval)
+    watcher.watch(settings.get_docs_path(), _on_docs_changed, suffixes=(".md",))
+    client = get_evidence_client()
+    for data_dir in client.schema_data_dirs():
+        watcher.watch(data_dir, client.invalidate_schema, suffixes=(".json",))
+    watcher.start()
 
-def get_evidence_client() -> EvidenceClient:
+
+def get_evidence_client() -> "EvidenceClient":
     """Get or create the Evidence client."""
     global _evidence_client
+    ensure_file_watcher()
     if _evidence_client is None:
+        from .services.evidence_client import EvidenceClient
+
+        settings = get_settings()
         _evidence_client = EvidenceClient(
             base_url=settings.evidence_dev_url,
             evidence_project_path=settings.evidence_project_path,
+            parse_workers=settings.schema_parse_workers,
+            connect_timeout=settings.evidence_connect_timeout,
+            request_timeout=settings.evidence_request_timeout,
+            manifest_ttl=settings.dev_manifest_ttl,
+            schema_snapshots=settings.schema_snapshots,
         )
     return _evidence_client
 
 
-def get_doc_registry() -> DocRegistry:
+def get_doc_registry() -> "DocRegistry":
     """Get or create the doc registry."""
     global _doc_registry
+    ensure_file_watcher()
     if _doc_registry is None:
-        _doc_registry = DocRegistry(docs_path=settings.get_docs_path())
+        from .services.doc_registry import DocRegistry
+
+        settings = get_settings()
+        _doc_registry = DocRegistry(
+            docs_path=settings.get_docs_path(),
+            cache_size=settings.doc_cache_size,
+            bundle_path=settings.get_docs_bundle_path(),
+        )
     return _doc_registry
 
 
-@mcp.tool()
-async def get_metadata() -> dict:
+def get_doc_search_index() -> "DocSearchIndex":
+    """Get or build the documentation search index."""
+    global _doc_search_index
+    if _doc_search_index is None:
+        from .services.doc_search import DocSearchIndex
+
+        _doc_search_index = DocSearchIndex.build(get_doc_registry().iter_documents())
+    return _doc_search_index
+
+
+def get_project_validator() -> Optional["ProjectValidator"]:
+    """Get or create the project validator (None without a project path)."""
+    global _project_validator
+    settings = get_settings()
+    if _project_validator is None and settings.evidence_project_path is not None:
+        from .services.project_validator import ProjectValidator
+
+        _project_validator = ProjectValidator(
+            settings.evidence_project_path, workers=settings.validate_workers
+        )
+    return _project_validator
+
+
+def get_project_query_graph() -> Optional["ProjectQueryGraph"]:
+    """Get or create the project query graph (None without a project path)."""
+    global _project_query_graph
+    settings = get_settings()
+    if _project_query_graph is None and settings.evidence_project_path is not None:
+        from .services.query_graph import ProjectQueryGraph
+
+        _project_query_graph = ProjectQueryGraph(settings.evidence_project_path)
+    return _project_query_graph
+
+
+def get_error_rules() -> "ErrorRuleEngine":
+    """Get or create the debug_code rule engine (custom rules before built-ins)."""
+    global _error_rules
+    if _error_rules is None:
+        from .services.error_rules import DEFAULT_RULES_PATH, ErrorRuleEngine
+
+        settings = get_settings()
+        try:
+            _error_rules = ErrorRuleEngine.from_files(settings.error_rules_path, DEFAULT_RULES_PATH)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load error rules from {settings.error_rules_path}: {e}")
+            _error_rules = ErrorRuleEngine.from_files(DEFAULT_RULES_PATH)
+    return _error_rules
+
+
+def get_table_data_reader() -> "TableDataReader":
+    """Get or create the DuckDB reader for sample_table and profile_column."""
+    global _table_data
+    if _table_data is None:
+        from .services.table_data import TableDataReader
+
+        settings = get_settings()
+        _table_data = TableDataReader(
+            pool_size=settings.duckdb_connections,
+            threads=settings.duckdb_threads,
+            cache_size=settings.table_data_cache_size,
+        )
+    return _table_data
+
+
+def get_response_encoder() -> "ResponseEncoder":
+    """Get or create the tool response encoder."""
+    global _response_encoder
+    if _response_encoder is None:
+        from .services.json_encoding import ResponseEncoder
+
+        _response_encoder = ResponseEncoder(cache_size=get_settings().response_cache_size)
+    return _response_encoder
+
+
+metrics.register_cache(
+    "docs", lambda: _doc_registry.cache_info() if _doc_registry is not None else None
+)
+metrics.register_cache(
+    "schema",
+    lambda: _evidence_client.schema_cache_info() if _evidence_client is not None else None,
+)
+metrics.register_cache(
+    "parquet_footers",
+    lambda: _evidence_client.footer_cache_info() if _evidence_client is not None else None,
+)
+metrics.register_cache(
+    "table_data", lambda: _table_data.cache_info() if _table_data is not None else None
+)
+metrics.register_cache(
+    "encoded_responses",
+    lambda: _response_encoder.cache_info() if _response_encoder is not None else None,
+)
+
+
+def _lru_cache_stats(module: str, name: str) -> Callable[[], Optional[dict]]:
+    """Statistics of a service's lru_cache function, once its module is loaded."""
+
+    def info() -> Optional[dict]:
+        loaded = sys.modules.get(f"{__package__}.services.{module}")
+        return lru_cache_info(getattr(loaded, name))() if loaded is not None else None
+
+    return info
+
+
+metrics.register_cache("component_props", _lru_cache_stats("page_lexer", "parse_props"))
+metrics.register_cache("line_index", _lru_cache_stats("line_index", "get_line_index"))
+
+
+async def get_schema_index_if_available() -> Optional["SchemaIndex"]:
+    """Get the schema name index, or None if no schema can be loaded.
+
+    Validation then skips its schema checks, so a malformed or half-written
+    schema file never makes a page edit fail.
+    """
+    try:
+        return await get_evidence_client().get_schema_index()
+    except RuntimeError:
+        return None
+    except (ValueError, OSError) as e:
+        logger.warning(f"Could not read the project schema, skipping schema checks: {e}")
+        return None
+
+
+@_tool
+async def get_metadata(
+    source: Annotated[Optional[str], "Only include tables from this source"] = None,
+    table_pattern: Annotated[
+        Optional[str],
+        "Filter tables by 'source.table' name, case-insensitive. Plain text matches anywhere; "
+        "'*' and '?' are wildcards (e.g. 'orders', 'sales.fact_*')",
+    ] = None,
+    column_pattern: Annotated[
+        Optional[str],
+        "Only include tables with matching columns, and only those columns (e.g. 'date', '*_id')",
+    ] = None,
+    limit: Annotated[Optional[int], "Maximum number of tables to return"] = None,
+    cursor: Annotated[
+        Optional[str], "Continue from a previous response's 'next_cursor'"
+    ] = None,
+    include_stats: Annotated[
+        bool,
+        "Add row counts, file sizes and per-column null counts and min/max, read from "
+        "the tables' Parquet files (local projects only)",
+    ] = False,
+) -> Union[dict, str]:
     """Returns database schema from Evidence's DuckDB connection.
 
     Returns a JSON object with tables and their columns, including data types.
-    Use this to understand what data is available for queries.
+    Use this to understand what data is available for queries. On large
+    projects, narrow the result with 'source', 'table_pattern' or
+    'column_pattern' and page through it with 'limit' and 'cursor'.
+    With 'include_stats', 'stats' maps table names to row counts and column
+    statistics, which helps choose aggregations and limits without querying.
 
     Returns:
         Dictionary with 'tables' array, each containing 'name' and 'columns'
     """
+    if limit is not None and limit <= 0:
+        return {"error": f"'limit' must be a positive number, got {limit}", "tables": []}
+    if cursor is not None and not (cursor.isascii() and cursor.isdigit()):
+        return {
+            "error": f"Invalid cursor {cursor!r}: pass 'next_cursor' from a previous response",
+            "tables": [],
+        }
+
     client = get_evidence_client()
     try:
-        manifest = await client.get_schema_metadata()
-        response = MetadataResponse.from_manifest(manifest)
-        return response.model_dump()
+        index = await client.get_schema_index()
     except RuntimeError as e:
         return {"error": str(e), "tables": []}
 
+    fields = {"schema_version": client.schema_version}
+    paged = limit is not None or cursor is not None
+    if not (source or table_pattern or column_pattern or paged):
+        if not include_stats:
+            # The full schema is encoded once per schema version
+            return get_response_encoder().cached(
+                index,
+                lambda: MetadataResponse.payload(index.store.tables_json(), **fields),
+                client.schema_version,
+            )
+        tables = index.store.tables_json()
+    else:
+        matches = index.filter(source, table_pattern, column_pattern)
+        start = 0 if cursor is None else int(cursor)
+        end = len(matches) if limit is None else start + limit
+        tables = index.to_json(matches[start:end])
+        fields["total_tables"] = len(matches)
+        fields["next_cursor"] = str(end) if end < len(matches) else None
+
+    if include_stats:
+        footers = await client.get_table_stats(table["name"] for table in tables)
+        fields["stats"] = {
+            name: TableStatistics.from_footer(footer).model_dump()
+            for name, footer in footers.items()
+        }
+    return MetadataResponse.payload(tables, **fields)
+
+
+@_tool
+async def get_metadata_changes(
+    since_version: Annotated[
+        Optional[int], "'schema_version' of an earlier get_metadata or get_metadata_changes"
+    ] = None,
+) -> Union[dict, MetadataChangesResponse]:
+    """Returns only the tables and columns that changed since an earlier schema version.
+
+    After sources are rerun, call this instead of get_metadata to learn what
+    was added, removed or altered. Without 'since_version', only the current
+    version is returned. If 'full_refresh' is true, the version is too old or
+    unknown to the server: call get_metadata for the full schema.
+
+    Returns:
+        Dictionary with 'version', 'added_tables', 'removed_tables' and
+        'changed_tables' (added, removed and retyped columns per table)
+    """
+    client = get_evidence_client()
+    try:
+        if since_version is None:
+            await client.get_schema_metadata()
+            changes = None
+        else:
+            changes = await client.get_schema_changes(since_version)
+    except RuntimeError as e:
+        return {"error": str(e)}
+
+    if changes is not None:
+        return MetadataChangesResponse.from_changes(since_version, changes)
+    return MetadataChangesResponse(
+        version=client.schema_version,
+        since_version=since_version,
+        full_refresh=since_version is not None,
+    )
+
+
+async def _table_file(table: str) -> Path:
+    """Local Parquet file of a 'source.table'.
+
+    Raises:
+        ValueError: If the project has no rendered file for the table
+    """
+    path = await get_evidence_client().get_table_file(table)
+    if path is None:
+        raise ValueError(
+            f"No Parquet file found for table '{table}'. Use get_metadata for table names; "
+            "table data needs EVIDENCE_MCP_EVIDENCE_PROJECT_PATH and built sources."
+        )
+    return path
 
-@mcp.tool()
+
+@_tool
+async def sample_table(
+    table: Annotated[str, "Table as 'source.table', as listed by get_metadata"],
+    n: Annotated[int, "Number of rows to return (at most 100)"] = 10,
+    columns: Annotated[Optional[list[str]], "Only include these columns"] = None,
+) -> Union[dict, SampleTableResponse]:
+    """Returns example rows of a table, read from the project's Parquet files.
+
+    Use this to see real values before choosing chart axes, value formats or
+    filters. Rows are a repeatable random sample spread over the whole table.
+    Requires a local project path and the duckdb extra.
+
+    Returns:
+        Dictionary with 'columns', 'rows' (one list of values per row) and 'total_rows'
+    """
+    try:
+        path = await _table_file(table)
+        result = await asyncio.to_thread(get_table_data_reader().sample, path, n, columns)
+    except (RuntimeError, ValueError, OSError) as e:
+        return {"error": str(e)}
+    return SampleTableResponse(table=table, **result)
+
+
+@_tool
+async def profile_column(
+    table: Annotated[str, "Table as 'source.table', as listed by get_metadata"],
+    column: Annotated[str, "Column name"],
+    top_k: Annotated[int, "Number of most frequent values to return (at most 100)"] = 10,
+    bins: Annotated[int, "Histogram bins for numeric columns (at most 50)"] = 10,
+) -> Union[dict, ColumnProfileResponse]:
+    """Profiles a column: null and distinct counts, range, top values and a histogram.
+
+    Use this to pick aggregations, sort orders and limits, e.g. whether a
+    column suits a category axis (few distinct values) or needs binning.
+    Requires a local project path and the duckdb extra.
+
+    Returns:
+        Dictionary with counts, 'min'/'max', 'top_values' and, for numeric
+        columns, an equal-width 'histogram'
+    """
+    try:
+        path = await _table_file(table)
+        result = await asyncio.to_thread(
+            get_table_data_reader().profile, path, column, top_k, bins
+        )
+    except (RuntimeError, ValueError, OSError) as e:
+        return {"error": str(e)}
+    return ColumnProfileResponse(table=table, column=column, **result)
+
+
+@_tool
 async def read_docs(
     doc_type: Annotated[
         DocType,
@@ -82,7 +542,19 @@ async def read_docs(
         Optional[str],
         "Specific component name (e.g., 'LineChart', 'USMap', 'postgres'). If not provided, returns category overview.",
     ] = None,
-) -> dict:
+    section: Annotated[
+        Optional[str],
+        "Only return this section of the page (heading text, e.g. 'Props' or 'Examples')",
+    ] = None,
+    max_chars: Annotated[
+        Optional[int],
+        "Maximum characters of content to return. Use 'next_cursor' from the response to continue.",
+    ] = None,
+    cursor: Annotated[
+        Optional[int],
+        "Offset to continue from, taken from a previous response's 'next_cursor'",
+    ] = None,
+) -> str:
     """Retrieves Evidence documentation using hierarchical lookup.
 
     Categories:
@@ -100,55 +572,220 @@ async def read_docs(
     - plugins: source-plugins, component-plugins
     - getting-started: install-evidence, build-your-first-app
 
+    Long pages can be read one section at a time ('section') or in chunks
+    ('max_chars' and 'cursor'); partial responses list the page's 'sections'.
+
     Returns:
         Dictionary with 'title', 'content', and 'related_docs' for further exploration
     """
     registry = get_doc_registry()
-    response = registry.lookup(doc_type, component)
-    return response.model_dump()
+    response = registry.lookup(doc_type, component, section, max_chars, cursor)
+    if registry.is_cached(response):
+        # A whole page the registry keeps; its encoding is kept with it
+        return get_response_encoder().cached(response, lambda: response)
+    return get_response_encoder().encode(response)
+
 
+@_tool
+async def search_docs(
+    query: Annotated[str, "Free-text query (e.g., 'line chart series colors', 'dropdown default')"],
+    limit: Annotated[int, "Maximum number of results to return"] = 10,
+) -> SearchResponse:
+    """Searches the Evidence documentation by keyword.
 
-@mcp.tool()
+    Use this when you do not know the exact doc_type/component for read_docs.
+    Results are ranked by relevance across titles, headings and body text.
+
+    Returns:
+        Dictionary with 'query' and a ranked 'results' list, each containing
+        'doc_type', 'component', 'title', 'score' and a matching 'snippet'
+    """
+    index = get_doc_search_index()
+    return SearchResponse(query=query, results=index.search(query, limit))
+
+
+def get_page_cache(ctx: Optional[Context]) -> Optional["PageValidationCache"]:
+    """Get or create the page validation cache for the client session of a request."""
+    if ctx is None:
+        return None
+    try:
+        session = ctx.session
+    except ValueError:
+        # Context outside of a request
+        return None
+    cache = _page_caches.get(session)
+    if cache is None:
+        from .services.page_validator import PageValidationCache
+
+        cache = _page_caches[session] = PageValidationCache()
+    return cache
+
+
+@_tool
 async def edit_page(
     description: Annotated[str, "Brief description of the changes being made"],
     edit: Annotated[str, "Complete modified page content (full file replacement)"],
-) -> dict:
+    ctx: Optional[Context] = None,
+) -> EditPageResponse:
     """Proposes changes to the current Evidence markdown page.
 
     Validates the proposed content for common Evidence syntax issues and returns
-    the content with any warnings detected.
+    the content with any warnings detected. Tables and columns used in SQL
+    blocks are checked against the project schema when it is available. Within
+    a session, only the parts of the page that changed since the previous
+    proposal are re-lexed.
 
     Returns:
         Dictionary with 'success', 'description', 'content', and 'warnings' list
     """
-    warnings = validate_evidence_content(edit)
+    from .services.page_validator import validate_evidence_content
+
+    schema_index = await get_schema_index_if_available()
+    cache = get_page_cache(ctx)
+    if cache is not None:
+        warnings = cache.validate(edit, schema_index)
+    else:
+        warnings = validate_evidence_content(edit, schema_index)
 
     return EditPageResponse(
         success=True,
         description=description,
         content=edit,
         warnings=warnings,
-    ).model_dump()
+    )
+
+
+@_tool
+async def validate_project(
+    include_clean: Annotated[bool, "Also list pages without warnings"] = False,
+) -> Union[dict, ValidateProjectResponse]:
+    """Validates every page of the Evidence project in one call.
+
+    Runs the edit_page checks, including SQL table and column references,
+    over all markdown files under the project's pages/ directory. Results are
+    cached per file, so reruns after small changes only re-check modified pages.
+
+    Returns:
+        Dictionary with page counts and a 'pages' list of per-file warnings
+    """
+    validator = get_project_validator()
+    if validator is None:
+        return {"error": "Evidence project path is not configured", "pages": []}
+    if not validator.pages_path.is_dir():
+        return {"error": f"Pages directory not found: {validator.pages_path}", "pages": []}
+
+    schema_index = await get_schema_index_if_available()
+    results = await asyncio.to_thread(validator.validate, schema_index)
+    return ValidateProjectResponse(
+        pages_path=str(validator.pages_path),
+        total_pages=len(results),
+        pages_with_warnings=sum(1 for warnings in results.values() if warnings),
+        pages=[
+            PageWarnings(path=path, warnings=warnings)
+            for path, warnings in results.items()
+            if warnings or include_clean
+        ],
+    )
+
+
+def _query_graph_response(
+    graph: "PageQueryGraph", page: Optional[str] = None
+) -> QueryGraphResponse:
+    """Convert a page query graph to its response model."""
+    queries = []
+    for name, line in graph.definitions.items():
+        queries.append(
+            QueryNode(
+                name=name,
+                line=line,
+                depends_on=graph.dependencies[name],
+                used_by=graph.dependents(name),
+                components=[f"{ref.user} (line {ref.line})" for ref in graph.consumers(name)],
+            )
+        )
+    return QueryGraphResponse(
+        page=page,
+        queries=queries,
+        issues=[QueryGraphIssue(**issue._asdict()) for issue in graph.issues()],
+    )
+
 
+@_tool
+async def get_query_graph(
+    page_content: Annotated[
+        Optional[str], "Page content to analyze, e.g. an unsaved draft"
+    ] = None,
+    page: Annotated[
+        Optional[str], "Path of a project page relative to pages/ (e.g. 'sales/index.md')"
+    ] = None,
+) -> Union[dict, QueryGraphResponse, ProjectQueryGraphResponse]:
+    """Shows how queries on a page depend on each other and which components use them.
+
+    With 'page_content' or 'page', returns every query with its ${...}
+    dependencies, dependent queries and consuming components, plus undefined
+    or cyclic references. With neither, checks every page of the project and
+    lists the pages that have issues.
+
+    Returns:
+        Dictionary with 'queries' and 'issues', or project totals and 'pages_with_issues'
+    """
+    from .services.query_graph import PageQueryGraph
+
+    if page_content is not None:
+        return _query_graph_response(PageQueryGraph.from_content(page_content))
+
+    project_graph = get_project_query_graph()
+    if project_graph is None:
+        return {"error": "Evidence project path is not configured", "queries": [], "issues": []}
+    graphs = await asyncio.to_thread(project_graph.refresh)
+
+    if page is not None:
+        graph = graphs.get(page.strip("/"))
+        if graph is None:
+            return {"error": f"Page not found: {page}", "queries": [], "issues": []}
+        return _query_graph_response(graph, page.strip("/"))
+
+    pages_with_issues = []
+    for path, graph in graphs.items():
+        issues = graph.issues()
+        if issues:
+            pages_with_issues.append(
+                QueryGraphResponse(
+                    page=path, issues=[QueryGraphIssue(**issue._asdict()) for issue in issues]
+                )
+            )
+    return ProjectQueryGraphResponse(
+        total_pages=len(graphs),
+        total_queries=sum(len(graph.definitions) for graph in graphs.values()),
+        pages_with_issues=pages_with_issues,
+    )
 
-@mcp.tool()
+
+@_tool
 async def debug_code(
     errors: Annotated[
         list[dict],
         "Array of error objects with 'message', 'line' (optional), 'column' (optional), 'type' (optional)",
     ],
     page_content: Annotated[str, "Current page content containing errors"],
-) -> dict:
+) -> DebugResponse:
     """Analyzes validation errors and suggests fixes.
 
     Examines the provided errors and page content to identify issues and
-    generate actionable fix suggestions.
+    generate actionable fix suggestions. Each suggestion includes the source
+    line the error points at, the lines around it, and the enclosing SQL
+    block or component.
 
     Returns:
         Dictionary with 'analysis', 'suggestions' list, and optionally 'fixed_content'
     """
     suggestions = []
     analysis_parts = []
+    from .services.line_index import get_line_index
+    from .services.query_graph import PageQueryGraph
+
+    page = get_line_index(page_content) if page_content else None
+    graph = PageQueryGraph.from_content(page_content, page.tokens) if page else None
 
     for i, error in enumerate(errors):
         message = error.get("message", "Unknown error")
@@ -159,8 +796,13 @@ async def debug_code(
             analysis_parts.append(f"  Location: line {line}")
 
         # Generate suggestions based on error patterns
-        suggestion = analyze_error(error, page_content, i)
+        suggestion = analyze_error(error, page_content, i, graph)
         if suggestion:
+            if page is not None:
+                suggestion.location = locate_error(page, error, suggestion)
+                if suggestion.location and suggestion.location.block:
+                    block = suggestion.location.block
+                    analysis_parts.append(f"  In: {block.kind} '{block.name}'")
             suggestions.append(suggestion)
 
     analysis = "\n".join(analysis_parts) if analysis_parts else "No errors to analyze."
@@ -169,75 +811,69 @@ async def debug_code(
         analysis=analysis,
         suggestions=suggestions,
         fixed_content=None,  # Let the LLM decide on fixes
-    ).model_dump()
+    )
 
 
-def validate_evidence_content(content: str) -> list[str]:
-    """Validate Evidence markdown content for common issues.
+def locate_error(
+    page: "LineIndex", error: dict, suggestion: FixSuggestion
+) -> Optional[ErrorLocation]:
+    """Resolve where an error points on its page.
 
     Args:
-        content: The Evidence markdown content to validate
+        page: Line index of the page
+        error: Error object with line and optionally column
+        suggestion: Suggestion for the error, whose line is used if the error has none
 
     Returns:
-        List of warning messages
+        The location, or None if the error has no line on the page
     """
-    warnings = []
-
-    # Check for balanced code fences
-    fence_count = content.count("```")
-    if fence_count % 2 != 0:
-        warnings.append("Unbalanced code fences detected (odd number of ```)")
-
-    # Check for SQL queries without names
-    # Count all SQL blocks
-    all_sql_pattern = r"```sql\b"
-    sql_blocks = re.findall(all_sql_pattern, content)
-    # Count named SQL blocks (sql followed by space/tab and a name, not newline)
-    named_sql_pattern = r"```sql[ \t]+\w+"
-    named_sql_blocks = re.findall(named_sql_pattern, content)
-    if len(sql_blocks) > len(named_sql_blocks):
-        warnings.append(
-            "Some SQL code blocks may be missing query names. "
-            "Use format: ```sql query_name"
-        )
+    line, column = error.get("line"), error.get("column")
+    if not isinstance(line, int) and suggestion.line_range:
+        line, column = suggestion.line_range[0], None
+    if not isinstance(line, int):
+        return None
+    location = page.locate(line, column if isinstance(column, int) and column > 0 else None)
+    if location is None:
+        return None
+    block = location.block
+    return ErrorLocation(
+        line=location.line,
+        column=location.column,
+        source_line=location.source_line,
+        context=location.context,
+        block=(
+            SourceBlock(kind=block.kind, name=block.name, line_range=(block.line, block.end_line))
+            if block
+            else None
+        ),
+    )
 
-    # Check for markdown tables (should use DataTable instead)
-    if re.search(r"^\|.*\|.*\|$", content, re.MULTILINE):
-        warnings.append(
-            "Markdown table detected. Consider using <DataTable data={query} /> instead."
-        )
 
-    # Check for unclosed component tags
-    open_tags = re.findall(r"<(\w+)[^/>]*>", content)
-    close_tags = re.findall(r"</(\w+)>", content)
-    self_closing = re.findall(r"<\w+[^>]*/\s*>", content)
-
-    for tag in open_tags:
-        if tag not in close_tags and not any(tag in sc for sc in self_closing):
-            # Check if it's a known self-closing component
-            known_self_closing = {"Value", "BigValue", "Delta", "Sparkline"}
-            if tag not in known_self_closing:
-                warnings.append(f"Potentially unclosed <{tag}> tag")
-
-    # Check for common prop issues
-    if "data={" in content:
-        # Check for quoted query references
-        if re.search(r'data=\{["\']', content):
-            warnings.append(
-                "Query references in data prop should not be quoted. "
-                "Use data={query_name} not data={'query_name'}"
-            )
+def _find_query_issue(error: dict, graph: "PageQueryGraph") -> Optional["QueryIssue"]:
+    """Find the query graph issue an error message is about.
 
-    return warnings
+    Issues are matched by a query name mentioned in the message, then by line;
+    an error that matches neither is about something else.
+    """
+    if not graph.issues():
+        return None
+    issue = graph.issue_named(set(re.findall(r"\w+", error.get("message", ""))))
+    if issue is not None:
+        return issue
+    line = error.get("line")
+    return graph.issue_at(line) if isinstance(line, int) else None
 
 
-def analyze_error(error: dict, content: str, index: int) -> Optional[FixSuggestion]:
+def analyze_error(
+    error: dict, content: str, index: int, graph: Optional["PageQueryGraph"] = None
+) -> Optional[FixSuggestion]:
     """Analyze a single error and suggest a fix.
 
     Args:
         error: Error object with message, line, etc.
         content: Page content
         index: Error index
+        graph: Query graph of the page, used to pinpoint query reference errors
 
     Returns:
         FixSuggestion if a fix can be suggested, None otherwise
@@ -245,31 +881,36 @@ def analyze_error(error: dict, content: str, index: int) -> Optional[FixSuggesti
     message = error.get("message", "").lower()
     line = error.get("line")
 
-    # Query reference errors
-    if "undefined" in message and "query" in message:
-        return FixSuggestion(
-            error_index=index,
-            description="Query reference error - the referenced query may not exist",
-            suggested_fix="Ensure the query is defined in a ```sql query_name code block above the component",
-            line_range=(line, line) if line else None,
-        )
-
-    # Missing required prop
-    if "required" in message and "prop" in message:
-        return FixSuggestion(
-            error_index=index,
-            description="Missing required prop",
-            suggested_fix="Add the required prop to the component. Check documentation for required props.",
-            line_range=(line, line) if line else None,
-        )
+    # Undefined or cyclic query references the page graph can pinpoint
+    if graph is not None and any(
+        word in message for word in ("undefined", "not defined", "not found", "cycle", "circular")
+    ):
+        issue = _find_query_issue(error, graph)
+        if issue is not None:
+            if issue.kind == "cycle":
+                fix = "Break the cycle: a query cannot depend on itself through ${...} references"
+            elif issue.suggestion:
+                fix = f"Replace '{issue.name}' with '{issue.suggestion}'"
+            else:
+                fix = f"Define the query in a ```sql {issue.name} code block, or fix the reference"
+            return FixSuggestion(
+                error_index=index,
+                description=issue.message,
+                suggested_fix=fix,
+                line_range=(issue.line, issue.line) if issue.line else None,
+                category="query",
+            )
 
-    # Syntax errors
-    if "syntax" in message or "unexpected" in message:
+    # Known error patterns
+    match = get_error_rules().classify(error.get("message", ""))
+    if match is not None:
         return FixSuggestion(
             error_index=index,
-            description="Syntax error in component or expression",
-            suggested_fix="Check for typos, unclosed brackets, or invalid JavaScript expressions",
+            description=match.description,
+            suggested_fix=match.fix,
             line_range=(line, line) if line else None,
+            category=match.rule.category,
+            doc_link=match.rule.doc_link,
         )
 
     # Generic suggestion
@@ -277,17 +918,106 @@ def analyze_error(error: dict, content: str, index: int) -> Optional[FixSuggesti
         return FixSuggestion(
             error_index=index,
             description=f"Error: {error.get('message', 'Unknown error')}",
-            suggested_fix="Review the error message and check Evidence documentation for correct syntax",
+            suggested_fix=(
+                "Review the error message and check Evidence documentation for correct syntax"
+            ),
             line_range=(line, line) if line else None,
         )
 
     return None
 
 
+@_tool
+async def server_stats() -> ServerStatsResponse:
+    """Returns per-tool call counts, latency, response sizes and cache hit ratios.
+
+    Use this to see where time goes inside the server. With the SSE or
+    streamable-http transports the same metrics are served in Prometheus
+    format at /metrics.
+
+    Returns:
+        Dictionary with 'uptime_seconds', 'tools', 'caches' and the Evidence
+        dev server's breaker state in 'dev_server'
+    """
+    tools = []
+    for name, stats in sorted(metrics.tools.items()):
+        latency, size = stats.latency, stats.size
+        tools.append(
+            ToolMetrics(
+                name=name,
+                calls=stats.calls,
+                errors=stats.errors,
+                latency_mean_ms=latency.total / latency.count * 1000,
+                latency_p50_ms=latency.quantile(0.5) * 1000,
+                latency_p95_ms=latency.quantile(0.95) * 1000,
+                response_bytes_total=int(size.total),
+                response_bytes_mean=size.total / size.count,
+            )
+        )
+    caches = [
+        CacheMetrics(name=name, **info) for name, info in sorted(metrics.cache_stats().items())
+    ]
+    return ServerStatsResponse(
+        uptime_seconds=metrics.uptime,
+        transport=get_settings().transport,
+        tools=tools,
+        caches=caches,
+        dev_server=(
+            DevServerStatus(**_evidence_client.health.info())
+            if _evidence_client is not None
+            else None
+        ),
+    )
+
+
+async def prometheus_metrics(request: Request) -> Response:
+    """Serve the metrics in the Prometheus text format (SSE and HTTP transports)."""
+    return PlainTextResponse(
+        metrics.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+async def close_services() -> None:
+    """Stop the file watcher and release the Evidence client and worker pools."""
+    global _evidence_client, _file_watcher, _project_validator, _table_data
+    if _file_watcher is not None:
+        await _file_watcher.stop()
+        _file_watcher = None
+    if _evidence_client is not None:
+        await _evidence_client.close()
+        _evidence_client = None
+    if _project_validator is not None:
+        _project_validator.close()
+        _project_validator = None
+    if _table_data is not None:
+        _table_data.close()
+        _table_data = None
+
+
+def __getattr__(name: str):
+    # The server and settings are built on first access, not at import
+    if name == "mcp":
+        return get_mcp()
+    if name == "settings":
+        return get_settings()
+    # Re-exported for callers that validate pages without the MCP layer
+    if name == "validate_evidence_content":
+        from .services.page_validator import validate_evidence_content
+
+        return validate_evidence_content
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main():
     """Entry point for the MCP server."""
+    settings = get_settings()
     logger.info(f"Starting {settings.server_name}")
-    mcp.run(transport=settings.transport)
+    if settings.transport == "streamable-http":
+        from .production import serve
+
+        serve()
+        return
+    get_mcp().run(transport=settings.transport)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,22 @@
-"""Services for Evidence MCP server."""
+"""Services for Evidence MCP server.
 
-from .doc_registry import DocRegistry
-from .evidence_client import EvidenceClient
+The exported classes are imported on first access, so importing one service
+module does not load the others.
+"""
 
-__all__ = ["DocRegistry", "EvidenceClient"]
+import importlib
+
+_EXPORTS = {
+    "DocRegistry": "doc_registry",
+    "DocSearchIndex": "doc_search",
+    "EvidenceClient": "evidence_client",
+}
+
+__all__ = ["DocRegistry", "DocSearchIndex", "EvidenceClient"]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
@@ -0,0 +1,216 @@
+"""Precompiled documentation bundle for zero-parse doc lookups.
+
+The bundle is a single binary file laid out as::
+
+    MAGIC (8 bytes) | index length (uint32, little endian) | index (JSON) | blob
+
+The index maps each documentation file (relative to the docs directory) to the
+offset and length of its markdown body inside the blob, together with the
+frontmatter fields the registry needs and the source file's (mtime_ns, size)
+signature at build time. Bodies are sliced straight out of a read-only mmap.
+"""
+
+import argparse
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"EVMCPDB1"
+_HEADER = struct.Struct("<8sI")
+
+
+class BundledDoc(NamedTuple):
+    """A documentation file as stored in the bundle."""
+
+    title: Optional[str]
+    related: Optional[list[str]]
+    content: str
+    signature: tuple[int, int]
+
+
+class DocBundle:
+    """Read-only view over a compiled documentation bundle."""
+
+    def __init__(self, path: Path):
+        """Open and memory-map a bundle file.
+
+        Args:
+            path: Path to the bundle file
+
+        Raises:
+            ValueError: If the file is not a valid bundle
+            OSError: If the file cannot be opened
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"Truncated doc bundle: {path}")
+        magic, index_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a doc bundle: {path}")
+
+        index_start = _HEADER.size
+        self._blob_start = index_start + index_len
+        index = json.loads(self._mm[index_start : self._blob_start])
+        self._files: dict[str, list] = index["files"]
+
+    @classmethod
+    def open(cls, path: Optional[Path]) -> Optional["DocBundle"]:
+        """Open a bundle if it exists and is valid, otherwise return None."""
+        if path is None or not path.exists():
+            return None
+        try:
+            bundle = cls(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring doc bundle {path}: {e}")
+            return None
+        logger.info(f"Loaded doc bundle {path} ({len(bundle)} files)")
+        return bundle
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, rel_path: str) -> bool:
+        return rel_path in self._files
+
+    def get(self, rel_path: str) -> Optional[BundledDoc]:
+        """Return the bundled document for a path relative to the docs directory."""
+        entry = self._files.get(rel_path)
+        if entry is None:
+            return None
+        offset, length, mtime_ns, size, title, related = entry
+        start = self._blob_start + offset
+        content = self._mm[start : start + length].decode("utf-8")
+        return BundledDoc(title, related, content, (mtime_ns, size))
+
+    def is_current(self, docs_path: Path, rel_paths: Iterable[str]) -> bool:
+        """Check that the bundle holds each file as it is now on disk.
+
+        Args:
+            docs_path: Path to the directory containing documentation files
+            rel_paths: Documentation files, relative to docs_path; files missing
+                from disk must be missing from the bundle too
+
+        Returns:
+            True if no file was added, changed or removed since the build
+        """
+        for rel_path in rel_paths:
+            entry = self._files.get(rel_path)
+            try:
+                stat = (docs_path / rel_path).stat()
+            except OSError:
+                if entry is not None:
+                    return False
+                continue
+            if entry is None or (entry[2], entry[3]) != (stat.st_mtime_ns, stat.st_size):
+                return False
+        return True
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._mm.close()
+
+
+def build_bundle(docs_path: Path, output_path: Path, rel_paths: list[str]) -> int:
+    """Compile documentation files into a bundle.
+
+    Args:
+        docs_path: Path to the directory containing documentation files
+        output_path: Where to write the bundle
+        rel_paths: Documentation files to include, relative to docs_path
+
+    Returns:
+        Number of files written to the bundle
+    """
+    import frontmatter
+
+    files: dict[str, list] = {}
+    chunks: list[bytes] = []
+    offset = 0
+
+    for rel_path in sorted(set(rel_paths)):
+        file_path = docs_path / rel_path
+        try:
+            stat = file_path.stat()
+        except OSError:
+            logger.warning(f"Skipping missing doc file: {file_path}")
+            continue
+
+        try:
+            post = frontmatter.load(file_path)
+            title = post.get("title")
+            related = post.get("related")
+            content = post.content
+        except Exception as e:
+            logger.error(f"Error parsing {file_path}: {e}")
+            title = None
+            related = None
+            content = file_path.read_text()
+
+        if related is not None and not isinstance(related, list):
+            related = [related]
+
+        body = content.encode("utf-8")
+        files[rel_path] = [
+            offset,
+            len(body),
+            stat.st_mtime_ns,
+            stat.st_size,
+            str(title) if title is not None else None,
+            [str(r) for r in related] if related is not None else None,
+        ]
+        chunks.append(body)
+        offset += len(body)
+
+    index = json.dumps({"files": files}, separators=(",", ":")).encode("utf-8")
+
+    # Write atomically so a running server never maps a half-written file
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, output_path)
+
+    return len(files)
+
+
+def registry_paths() -> list[str]:
+    """Documentation files of the doc registry, relative to the docs directory."""
+    from .doc_registry import DOC_REGISTRY
+
+    return [path for category in DOC_REGISTRY.values() for path in category.values()]
+
+
+def main() -> None:
+    """Entry point for the evidence-mcp-build-docs console script."""
+    from ..config import settings
+
+    parser = argparse.ArgumentParser(
+        description="Compile the Evidence documentation into a bundle for fast startup."
+    )
+    parser.add_argument(
+        "--docs", type=Path, default=settings.get_docs_path(), help="Documentation directory"
+    )
+    parser.add_argument(
+        "--output", type=Path, default=settings.get_docs_bundle_path(), help="Bundle file to write"
+    )
+    args = parser.parse_args()
+
+    count = build_bundle(args.docs, args.output, registry_paths())
+    print(f"Wrote {count} documents to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,13 @@
 """Documentation registry service for hierarchical doc lookup."""
 
 import logging
+import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
-
-import frontmatter
+from typing import Iterable, Iterator, NamedTuple, Optional
 
 from ..models.schemas import DocResponse, DocType
+from .doc_bundle import DocBundle
 
 logger = logging.getLogger(__name__)
 
@@ -225,18 +226,135 @@ DOC_REGISTRY: dict[str, dict[str, str]] = {
 }
 
 
+# Markdown headings and code fence delimiters, matched in a single pass
+_HEADING_OR_FENCE_RE = re.compile(
+    r"^[ \t]*(?P<fence>```|~~~)|^(?P<hashes>#{1,6})[ \t]+(?P<title>.+?)[ \t#]*$",
+    re.MULTILINE,
+)
+
+
+class DocSection(NamedTuple):
+    """A heading-delimited section of a document, as character offsets."""
+
+    level: int
+    title: str
+    start: int
+    end: int
+
+
+def build_heading_index(content: str) -> list[DocSection]:
+    """Index the markdown headings of a document.
+
+    Headings inside fenced code blocks are ignored. Each section spans from its
+    heading to the next heading of the same or a higher level.
+
+    Args:
+        content: Markdown body
+
+    Returns:
+        Sections in document order
+    """
+    headings: list[tuple[int, str, int]] = []
+    in_fence = False
+    for match in _HEADING_OR_FENCE_RE.finditer(content):
+        if match.group("fence"):
+            in_fence = not in_fence
+        elif not in_fence:
+            headings.append((len(match.group("hashes")), match.group("title"), match.start()))
+
+    sections = []
+    for i, (level, title, start) in enumerate(headings):
+        end = len(content)
+        for next_level, _, next_start in headings[i + 1 :]:
+            if next_level <= level:
+                end = next_start
+                break
+        sections.append(DocSection(level, title, start, end))
+    return sections
+
+
+class _CachedDoc:
+    """A parsed document together with its lazily built heading index."""
+
+    __slots__ = ("file_path", "signature", "response", "_sections")
+
+    def __init__(
+        self,
+        file_path: Optional[Path],
+        signature: Optional[tuple[int, int]],
+        response: DocResponse,
+    ):
+        self.file_path = file_path
+        self.signature = signature
+        self.response = response
+        self._sections: Optional[list[DocSection]] = None
+
+    @property
+    def sections(self) -> list[DocSection]:
+        if self._sections is None:
+            self._sections = build_heading_index(self.response.content)
+        return self._sections
+
+
 class DocRegistry:
     """Service for looking up Evidence documentation."""
 
-    def __init__(self, docs_path: Path):
+    def __init__(
+        self,
+        docs_path: Path,
+        cache_size: int = 128,
+        bundle_path: Optional[Path] = None,
+    ):
         """Initialize the doc registry.
 
         Args:
             docs_path: Path to the directory containing documentation files
+            cache_size: Maximum number of parsed documents to keep in memory
+            bundle_path: Optional precompiled doc bundle to serve documents from
         """
         self.docs_path = docs_path
+        self._bundle = DocBundle.open(bundle_path)
+        self._index_keys = self._canonical_keys()
+        self.cache_size = cache_size
+        # (doc_type, component) -> parsed document, validated by (mtime_ns, size)
+        self._cache: OrderedDict[tuple[str, Optional[str]], _CachedDoc] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @staticmethod
+    def _file_signature(file_path: Path) -> Optional[tuple[int, int]]:
+        """Return the (mtime_ns, size) signature of a file, or None if it is gone."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def cache_info(self) -> dict:
+        """Return cache statistics for the parsed-document cache."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+            "maxsize": self.cache_size,
+        }
 
-    def _find_file(self, doc_type: DocType, component: Optional[str]) -> Optional[Path]:
+    def clear_cache(self) -> None:
+        """Drop all cached documents (counters are kept)."""
+        self._cache.clear()
+
+    def is_cached(self, response: DocResponse) -> bool:
+        """Return whether a response is the whole page of a cached document."""
+        cached = self._cache.get((response.doc_type, response.component))
+        return cached is not None and cached.response is response
+
+    def _exists(self, rel_path: str) -> bool:
+        """Check whether a documentation file is available (bundled or on disk)."""
+        if self._bundle is not None and rel_path in self._bundle:
+            return True
+        return (self.docs_path / rel_path).exists()
+
+    def _find_file(self, doc_type: DocType, component: Optional[str]) -> Optional[str]:
         """Find the documentation file for a given doc_type and component.
 
         Args:
@@ -244,30 +362,27 @@ class DocRegistry:
             component: Optional specific component name
 
         Returns:
-            Path to the documentation file, or None if not found
+            Path to the documentation file relative to docs_path, or None if not found
         """
         category = DOC_REGISTRY.get(doc_type, {})
 
         if component:
             # Try exact match
             if component in category:
-                file_path = self.docs_path / category[component]
-                if file_path.exists():
-                    return file_path
+                if self._exists(category[component]):
+                    return category[component]
 
             # Try case-insensitive match
             component_lower = component.lower()
             for key, path in category.items():
                 if key.lower() == component_lower:
-                    file_path = self.docs_path / path
-                    if file_path.exists():
-                        return file_path
+                    if self._exists(path):
+                        return path
 
         # Fallback to category index
         if "_index" in category:
-            file_path = self.docs_path / category["_index"]
-            if file_path.exists():
-                return file_path
+            if self._exists(category["_index"]):
+                return category["_index"]
 
         return None
 
@@ -285,33 +400,117 @@ class DocRegistry:
         related = [key for key in category.keys() if key != "_index" and key != component]
         return related[:5]  # Limit to 5 suggestions
 
-    def lookup(self, doc_type: DocType, component: Optional[str] = None) -> DocResponse:
-        """Look up documentation for a given doc_type and component.
+    def _load_document(
+        self, rel_path: str, doc_type: DocType, component: Optional[str]
+    ) -> tuple[Optional[tuple[int, int]], str, str, list[str]]:
+        """Load a documentation file from the bundle or from disk.
+
+        Returns:
+            Tuple of (file signature, title, content, related)
+        """
+        file_path = self.docs_path / rel_path
+        # Stat before reading so a concurrent edit invalidates the entry next time
+        signature = self._file_signature(file_path)
+
+        # Serve from the bundle unless the file on disk has changed since it was built
+        bundled = self._bundle.get(rel_path) if self._bundle is not None else None
+        if bundled is not None and signature in (None, bundled.signature):
+            title = bundled.title
+            if title is None:
+                title = component or doc_type.capitalize()
+            content = bundled.content
+            related = bundled.related
+            if related is None:
+                related = self._get_related_docs(doc_type, component)
+        else:
+            title, content, related = self._parse_file(file_path, doc_type, component)
+
+        return signature, title, content, related
+
+    @staticmethod
+    def _canonical_keys() -> dict[str, tuple[DocType, Optional[str]]]:
+        """Map each documentation file to the first (doc_type, component) key for it.
+
+        Legacy aliases therefore do not produce duplicates. Category indexes map
+        to a component of None.
+        """
+        keys: dict[str, tuple[DocType, Optional[str]]] = {}
+        for doc_type, category in DOC_REGISTRY.items():
+            for key, rel_path in category.items():
+                keys.setdefault(rel_path, (doc_type, None if key == "_index" else key))
+        return keys
+
+    def get_index_entry(
+        self, rel_path: str
+    ) -> Optional[tuple[DocType, Optional[str], str, str, str]]:
+        """Load one documentation file for indexing, bypassing the cache.
+
+        Returns:
+            Tuple of (doc_type, component, relative path, title, content), or None
+            if the file is not registered or not available
+        """
+        key = self._index_keys.get(rel_path)
+        if key is None or not self._exists(rel_path):
+            return None
+        doc_type, component = key
+        _, title, content, _ = self._load_document(rel_path, doc_type, component)
+        return doc_type, component, rel_path, str(title), content
+
+    def iter_documents(self) -> Iterator[tuple[DocType, Optional[str], str, str, str]]:
+        """Iterate over every available documentation file once, bypassing the cache.
+
+        Yields:
+            Tuples of (doc_type, component, relative path, title, content)
+        """
+        for rel_path in self._index_keys:
+            entry = self.get_index_entry(rel_path)
+            if entry is not None:
+                yield entry
+
+    def invalidate(self, paths: Iterable[Path]) -> set[str]:
+        """Drop cached documents affected by changed files.
+
+        A cached lookup is dropped if the file it resolved to changed, or if any
+        file it could resolve to was added or removed (which may change how the
+        lookup resolves).
 
         Args:
-            doc_type: Category of documentation
-            component: Optional specific component name
+            paths: Changed files (absolute, or relative to docs_path)
 
         Returns:
-            DocResponse containing the documentation content
+            Changed paths relative to docs_path that are part of the registry
         """
-        file_path = self._find_file(doc_type, component)
+        changed: set[str] = set()
+        for path in paths:
+            if path.is_absolute():
+                try:
+                    path = path.relative_to(self.docs_path)
+                except ValueError:
+                    continue
+            changed.add(path.as_posix())
 
-        if file_path is None:
-            # Return a helpful message if no docs found
-            available = list(DOC_REGISTRY.get(doc_type, {}).keys())
-            available = [a for a in available if a != "_index"]
+        for key in list(self._cache):
+            doc_type, component = key
+            category = DOC_REGISTRY.get(doc_type, {})
+            component_lower = (component or "").lower()
+            candidates = {
+                path
+                for name, path in category.items()
+                if name == "_index" or (component and name.lower() == component_lower)
+            }
+            if candidates & changed:
+                del self._cache[key]
 
-            return DocResponse(
-                doc_type=doc_type,
-                component=component,
-                title="Documentation not found",
-                content=f"No documentation found for '{component}' in '{doc_type}'.\n\n"
-                f"Available topics: {', '.join(available)}",
-                related_docs=available[:5],
-            )
+        return {path for path in changed if path in self._index_keys}
+
+    def _parse_file(
+        self, file_path: Path, doc_type: DocType, component: Optional[str]
+    ) -> tuple[str, str, list[str]]:
+        """Parse a markdown file with frontmatter into (title, content, related)."""
+        # Deferred: python-frontmatter pulls in PyYAML, which would otherwise
+        # load on every server start, even when all docs come from the bundle
+        import frontmatter
 
-        # Parse the markdown file with frontmatter
         try:
             post = frontmatter.load(file_path)
             title = post.get("title", component or doc_type.capitalize())
@@ -323,11 +522,127 @@ class DocRegistry:
             title = component or doc_type.capitalize()
             content = file_path.read_text()
             related = self._get_related_docs(doc_type, component)
+        return title, content, related
+
+    def _get_document(self, doc_type: DocType, component: Optional[str]) -> _CachedDoc:
+        """Resolve and parse a document, going through the parsed-document cache."""
+        key = (doc_type, component)
+        cached = self._cache.get(key)
+        if cached is not None:
+            if self._file_signature(cached.file_path) == cached.signature:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached
+            # File changed or disappeared since it was parsed
+            del self._cache[key]
+
+        self.cache_misses += 1
+        rel_path = self._find_file(doc_type, component)
+
+        if rel_path is None:
+            # Return a helpful message if no docs found
+            available = list(DOC_REGISTRY.get(doc_type, {}).keys())
+            available = [a for a in available if a != "_index"]
+
+            return _CachedDoc(
+                None,
+                None,
+                DocResponse(
+                    doc_type=doc_type,
+                    component=component,
+                    title="Documentation not found",
+                    content=f"No documentation found for '{component}' in '{doc_type}'.\n\n"
+                    f"Available topics: {', '.join(available)}",
+                    related_docs=available[:5],
+                ),
+            )
+
+        file_path = self.docs_path / rel_path
+        signature, title, content, related = self._load_document(rel_path, doc_type, component)
 
-        return DocResponse(
-            doc_type=doc_type,
-            component=component,
-            title=title,
-            content=content,
-            related_docs=related if isinstance(related, list) else [related],
+        doc = _CachedDoc(
+            file_path,
+            signature,
+            DocResponse(
+                doc_type=doc_type,
+                component=component,
+                title=title,
+                content=content,
+                related_docs=related if isinstance(related, list) else [related],
+            ),
         )
+
+        if signature is not None and self.cache_size > 0:
+            self._cache[key] = doc
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return doc
+
+    def lookup(
+        self,
+        doc_type: DocType,
+        component: Optional[str] = None,
+        section: Optional[str] = None,
+        max_chars: Optional[int] = None,
+        cursor: Optional[int] = None,
+    ) -> DocResponse:
+        """Look up documentation for a given doc_type and component.
+
+        Args:
+            doc_type: Category of documentation
+            component: Optional specific component name
+            section: Optional heading to return instead of the whole page
+                (case-insensitive; falls back to the first heading containing it)
+            max_chars: Optional maximum number of characters of content to return
+            cursor: Character offset to resume from, taken from a previous
+                response's next_cursor
+
+        Returns:
+            DocResponse containing the documentation content
+        """
+        doc = self._get_document(doc_type, component)
+        if section is None and max_chars is None and not cursor:
+            return doc.response
+
+        response = doc.response
+        content = response.content
+        sections = doc.sections
+        update: dict = {"sections": [s.title for s in sections]}
+
+        if section is not None:
+            match = self._find_section(sections, section)
+            if match is None:
+                update["content"] = (
+                    f"No section '{section}' found in '{response.title}'.\n\n"
+                    f"Available sections: {', '.join(update['sections'])}"
+                )
+                return response.model_copy(update=update)
+            content = content[match.start : match.end]
+            update["section"] = match.title
+
+        start = min(max(cursor or 0, 0), len(content))
+        end = len(content)
+        if max_chars is not None and start + max(max_chars, 1) < end:
+            end = start + max(max_chars, 1)
+            # Prefer to break at a line boundary in the second half of the window
+            newline = content.rfind("\n", start + (end - start) // 2, end)
+            if newline != -1:
+                end = newline + 1
+            update["next_cursor"] = end
+
+        update["content"] = content[start:end]
+        update["total_chars"] = len(content)
+        return response.model_copy(update=update)
+
+    @staticmethod
+    def _find_section(sections: list[DocSection], name: str) -> Optional[DocSection]:
+        """Find a section by exact (case-insensitive) title, then by substring."""
+        name_lower = name.strip().lower()
+        for candidate in sections:
+            if candidate.title.lower() == name_lower:
+                return candidate
+        for candidate in sections:
+            if name_lower in candidate.title.lower():
+                return candidate
+        return None
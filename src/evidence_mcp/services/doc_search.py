@@ -0,0 +1,194 @@
+"""Full-text search over the documentation corpus."""
+
+import logging
+import math
+import re
+from collections import defaultdict
+from typing import Iterable, NamedTuple, Optional
+
+from ..models.schemas import SearchResult
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+_HEADING_RE = re.compile(r"^#{1,6}[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Term-frequency weight of each field (a simplified BM25F)
+FIELD_WEIGHTS = {"title": 3.0, "headings": 2.0, "body": 1.0}
+
+SNIPPET_RADIUS = 80
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search terms.
+
+    CamelCase words are indexed both whole and split into their parts, so
+    "LineChart" matches queries for "linechart" as well as "line chart".
+    """
+    terms = []
+    for word in _WORD_RE.findall(text):
+        lower = word.lower()
+        terms.append(lower)
+        if lower != word and not word.isupper():
+            parts = _CAMEL_RE.findall(word)
+            if len(parts) > 1:
+                terms.extend(part.lower() for part in parts)
+    return terms
+
+
+class _IndexedDoc(NamedTuple):
+    doc_type: str
+    component: Optional[str]
+    title: str
+    content: str
+    length: float
+
+
+class DocSearchIndex:
+    """Inverted index with BM25 ranking over titles, headings and body text."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """Initialize an empty index.
+
+        Args:
+            k1: BM25 term-frequency saturation parameter
+            b: BM25 length normalization parameter
+        """
+        self.k1 = k1
+        self.b = b
+        # term -> {doc_id: weighted term frequency}
+        self._postings: dict[str, dict[str, float]] = defaultdict(dict)
+        # doc_id -> indexed terms, so a document can be removed without a scan
+        self._doc_terms: dict[str, tuple[str, ...]] = {}
+        self._docs: dict[str, _IndexedDoc] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add_document(
+        self,
+        doc_id: str,
+        doc_type: str,
+        component: Optional[str],
+        title: str,
+        content: str,
+    ) -> None:
+        """Index a document, replacing any previous version with the same id.
+
+        Args:
+            doc_id: Stable identifier for the document (e.g. its relative path)
+            doc_type: Category the document is reported under
+            component: Component name the document is reported under
+            title: Document title
+            content: Markdown body
+        """
+        if doc_id in self._docs:
+            self.remove_document(doc_id)
+
+        fields = {
+            "title": tokenize(title),
+            "headings": tokenize(" ".join(_HEADING_RE.findall(content))),
+            "body": tokenize(content),
+        }
+
+        frequencies: dict[str, float] = defaultdict(float)
+        length = 0.0
+        for field, terms in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            length += weight * len(terms)
+            for term in terms:
+                frequencies[term] += weight
+
+        for term, frequency in frequencies.items():
+            self._postings[term][doc_id] = frequency
+
+        self._doc_terms[doc_id] = tuple(frequencies)
+        self._docs[doc_id] = _IndexedDoc(doc_type, component, title, content, length)
+        self._total_length += length
+
+    def remove_document(self, doc_id: str) -> None:
+        """Remove a document and its postings from the index."""
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= doc.length
+
+    def search(self, query: str, limit: int = 10) -> list[SearchResult]:
+        """Rank documents against a free-text query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+
+        Returns:
+            Hits ordered by descending BM25 score
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._docs or limit <= 0:
+            return []
+
+        n_docs = len(self._docs)
+        avg_length = self._total_length / n_docs or 1.0
+        scores: dict[str, float] = defaultdict(float)
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                length = self._docs[doc_id].length
+                norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+                scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        hits = []
+        for doc_id, score in ranked:
+            doc = self._docs[doc_id]
+            hits.append(
+                SearchResult(
+                    doc_type=doc.doc_type,
+                    component=doc.component,
+                    title=doc.title,
+                    score=round(score, 4),
+                    snippet=_make_snippet(doc.content, terms),
+                )
+            )
+        return hits
+
+    @classmethod
+    def build(
+        cls, documents: Iterable[tuple[str, Optional[str], str, str, str]]
+    ) -> "DocSearchIndex":
+        """Build an index from (doc_type, component, doc_id, title, content) tuples."""
+        index = cls()
+        for doc_type, component, doc_id, title, content in documents:
+            index.add_document(doc_id, doc_type, component, title, content)
+        logger.info(f"Built doc search index ({len(index)} documents)")
+        return index
+
+
+def _make_snippet(content: str, terms: list[str]) -> str:
+    """Return a short excerpt of content around the first matching query term."""
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    match = pattern.search(content)
+    if match is None:
+        start, end = 0, 2 * SNIPPET_RADIUS
+    else:
+        start = max(0, match.start() - SNIPPET_RADIUS)
+        end = match.end() + SNIPPET_RADIUS
+
+    snippet = _WHITESPACE_RE.sub(" ", content[start:end]).strip()
+    if start > 0:
+        snippet = "..." + snippet
+    if end < len(content):
+        snippet += "..."
+    return snippet
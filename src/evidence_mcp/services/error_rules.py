@@ -0,0 +1,173 @@
+"""Rule table for classifying Evidence, Svelte and DuckDB error messages."""
+
+import json
+import re
+import string
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+DEFAULT_RULES_PATH = Path(__file__).parent / "error_rules.json"
+
+_WORD_RE = re.compile(r"\w+")
+_FORMATTER = string.Formatter()
+
+
+class ErrorRule(NamedTuple):
+    """A known error pattern and how to fix it.
+
+    A rule applies when every keyword starts a word of the message (so "prop"
+    also matches "props" and "syntax" matches "SyntaxError") and, if given,
+    its pattern also matches. Named groups of the pattern (and
+    {message}) can be used in the description and fix templates.
+    """
+
+    name: str
+    keywords: tuple[str, ...]
+    category: str
+    description: str
+    fix: str
+    doc_link: Optional[str] = None
+    pattern: Optional[re.Pattern] = None
+
+
+class ErrorMatch(NamedTuple):
+    """A rule applied to a message, with its templates filled in."""
+
+    rule: ErrorRule
+    description: str
+    fix: str
+
+
+class _Fields(dict):
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def _stem(word: str) -> str:
+    # "queries" -> "query", so the singular keyword is a prefix of the plural
+    return word[:-3] + "y" if len(word) > 4 and word.endswith("ies") else word
+
+
+def _words(text: str) -> list[str]:
+    return [_stem(word) for word in _WORD_RE.findall(text.lower())]
+
+
+def parse_rules(data: Iterable[dict], source: str = "rules") -> list[ErrorRule]:
+    """Build rules from their JSON representation.
+
+    Args:
+        data: Rule objects with name, keywords, category, description and fix,
+            and optionally doc_link and pattern (a case-insensitive regex)
+        source: Where the rules came from, for error messages
+
+    Returns:
+        Rules in table order
+
+    Raises:
+        ValueError: If a rule is missing a field or has an invalid template or pattern
+    """
+    rules = []
+    for i, item in enumerate(data):
+        try:
+            keywords = tuple(dict.fromkeys(word for kw in item["keywords"] for word in _words(kw)))
+            if not keywords:
+                raise ValueError("at least one keyword is required")
+            for template in (item["description"], item["fix"]):
+                list(_FORMATTER.parse(template))
+            pattern = item.get("pattern")
+            rules.append(
+                ErrorRule(
+                    name=item["name"],
+                    keywords=keywords,
+                    category=item["category"],
+                    description=item["description"],
+                    fix=item["fix"],
+                    doc_link=item.get("doc_link"),
+                    pattern=re.compile(pattern, re.IGNORECASE) if pattern else None,
+                )
+            )
+        except (KeyError, TypeError, ValueError, re.error) as e:
+            name = item.get("name", "?") if isinstance(item, dict) else "?"
+            raise ValueError(f"Invalid error rule {i} ({name}) in {source}: {e!r}") from e
+    return rules
+
+
+def load_rules(path: Path) -> list[ErrorRule]:
+    """Load a rule table from a JSON file holding a list of rule objects."""
+    return parse_rules(json.loads(path.read_text(encoding="utf-8")), str(path))
+
+
+class ErrorRuleEngine:
+    """Classifies error messages against a rule table in one pass per message.
+
+    Rules are indexed by keyword, so classifying a message splits it into
+    words once, looks up each word's prefixes of keyword length and only
+    visits the rules those keywords can complete, however long the table
+    grows. Earlier rules win when several apply.
+    """
+
+    def __init__(self, rules: list[ErrorRule]):
+        """Initialize the engine.
+
+        Args:
+            rules: Rules in priority order
+        """
+        self.rules = rules
+        # keyword -> ids of the rules that need it
+        self._index: dict[str, list[int]] = {}
+        for rule_id, rule in enumerate(rules):
+            for keyword in rule.keywords:
+                self._index.setdefault(keyword, []).append(rule_id)
+        self._lengths = sorted({len(keyword) for keyword in self._index})
+
+    @classmethod
+    def from_files(cls, *paths: Optional[Path]) -> "ErrorRuleEngine":
+        """Create an engine from rule files; rules in earlier files take priority.
+
+        Args:
+            paths: Rule files; None entries are skipped
+        """
+        rules: list[ErrorRule] = []
+        for path in paths:
+            if path is not None:
+                rules.extend(load_rules(path))
+        return cls(rules)
+
+    def classify(self, message: str) -> Optional[ErrorMatch]:
+        """Find the first rule that applies to a message.
+
+        Args:
+            message: Error message
+
+        Returns:
+            The matching rule with its templates filled in, or None
+        """
+        index = self._index
+        keywords = set()
+        for word in set(_words(message)):
+            for length in self._lengths:
+                if length > len(word):
+                    break
+                if word[:length] in index:
+                    keywords.add(word[:length])
+
+        hits: dict[int, int] = {}
+        for keyword in keywords:
+            for rule_id in index[keyword]:
+                hits[rule_id] = hits.get(rule_id, 0) + 1
+
+        rules = self.rules
+        for rule_id in sorted(hits):
+            rule = rules[rule_id]
+            if hits[rule_id] != len(rule.keywords):
+                continue
+            fields = _Fields(message=message)
+            if rule.pattern is not None:
+                match = rule.pattern.search(message)
+                if match is None:
+                    continue
+                fields.update((k, v) for k, v in match.groupdict().items() if v is not None)
+            return ErrorMatch(
+                rule, rule.description.format_map(fields), rule.fix.format_map(fields)
+            )
+        return None
@@ -1,14 +1,26 @@
 """Evidence dev server integration client."""
 
+import asyncio
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import httpx
 
+from .health import DevServerHealth
+from .parquet_footer import ParquetFooter, read_parquet_footer
+from .schema_index import SchemaIndex
+from .schema_store import ColumnList
+from .schema_versions import SchemaChanges, SchemaVersions
+
 logger = logging.getLogger(__name__)
 
+# Schema files handed to each worker task; amortizes scheduling overhead
+SCHEMA_PARSE_BATCH_SIZE = 64
+
 
 class EvidenceClient:
     """Client for interacting with Evidence dev server and project files."""
@@ -17,23 +29,159 @@ class EvidenceClient:
         self,
         base_url: str = "http://localhost:3000",
         evidence_project_path: Optional[Path] = None,
+        parse_workers: int = 8,
+        connect_timeout: float = 0.5,
+        request_timeout: float = 10.0,
+        manifest_ttl: float = 5.0,
+        schema_snapshots: int = 16,
     ):
         """Initialize the Evidence client.
 
         Args:
             base_url: URL of the Evidence dev server
             evidence_project_path: Optional path to the Evidence project directory
+            parse_workers: Maximum threads used to read and decode schema files
+            connect_timeout: Seconds to wait when connecting to the dev server
+            request_timeout: Seconds to wait for a dev server response
+            manifest_ttl: Seconds a dev server manifest is reused before refetching
+            schema_snapshots: Schema versions kept for get_schema_changes
         """
         self.base_url = base_url.rstrip("/")
         self.project_path = evidence_project_path
         self._client: Optional[httpx.AsyncClient] = None
+        self.connect_timeout = connect_timeout
+        self.request_timeout = request_timeout
+        self.manifest_ttl = manifest_ttl
+        self.health = DevServerHealth()
+        # (monotonic fetch time, manifest) from the dev server
+        self._dev_manifest: Optional[tuple[float, dict]] = None
+        # (renderedFiles key, normalized result) for schemas fetched over HTTP
+        self._dev_schema: Optional[tuple[str, dict]] = None
+
+        # Schema caches, revalidated with (mtime_ns, size) stat signatures:
+        # data_dir -> (manifest signature, [(source, table, schema path, parquet path)])
+        self._manifest_cache: dict[
+            Path, tuple[tuple[int, int], list[tuple[str, str, Path, Path]]]
+        ] = {}
+        # schema path -> (schema file signature or None if missing, columns)
+        self._table_cache: dict[Path, tuple[Optional[tuple[int, int]], ColumnList]] = {}
+        # data_dir -> assembled {"sources": ...} result
+        self._result_cache: dict[Path, dict] = {}
+        self.schema_cache_hits = 0
+        self.schema_cache_misses = 0
+        self.schema_files_parsed = 0
+        # parquet path -> (file signature, footer or None if unreadable)
+        self._footer_cache: dict[Path, tuple[tuple[int, int], Optional[ParquetFooter]]] = {}
+        self.footer_cache_hits = 0
+        self.footer_cache_misses = 0
+
+        self.parse_workers = max(1, parse_workers)
+        self._parse_executor: Optional[ThreadPoolExecutor] = None
+        # Serializes schema refreshes so concurrent tool calls share one parse
+        self._schema_lock: Optional[asyncio.Lock] = None
+        # Name index for the most recent schema result, rebuilt when it changes
+        self._schema_index: Optional[tuple[dict, SchemaIndex]] = None
+        # Versioned per-table hashes of recent schema results
+        self.schema_versions = SchemaVersions(schema_snapshots)
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.request_timeout, connect=self.connect_timeout)
+            )
         return self._client
 
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+        """Return the (mtime_ns, size) signature of a file, or None if it is missing."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _rendered_files(manifest: dict) -> list[tuple[str, str, str]]:
+        """List (source, table, file path) for each rendered file in an Evidence manifest."""
+        files = []
+        for source_name, file_paths in manifest.get("renderedFiles", {}).items():
+            for file_path in file_paths:
+                # Extract table name from path like "static/data/source/table/table.parquet"
+                parts = Path(file_path).parts
+                if len(parts) >= 2:
+                    # e.g., "orders" from ".../orders/orders.parquet"
+                    files.append((source_name, parts[-2], file_path))
+        return files
+
+    @classmethod
+    def _rendered_tables(cls, manifest: dict) -> list[tuple[str, str]]:
+        """List (source, table) for each rendered file in an Evidence manifest."""
+        return [(source, table) for source, table, _ in cls._rendered_files(manifest)]
+
+    def _read_manifest_tables(self, data_dir: Path) -> list[tuple[str, str, Path, Path]]:
+        """Read manifest.json and list (source, table, schema path, parquet path) per file."""
+        manifest = json.loads((data_dir / "manifest.json").read_text())
+        entries = []
+        for source_name, table_name, file_path in self._rendered_files(manifest):
+            table_dir = data_dir / source_name / table_name
+            # Rendered paths are relative to the directory holding static/data
+            parts = Path(file_path).parts
+            if parts[:2] == ("static", "data"):
+                parquet_path = data_dir.joinpath(*parts[2:])
+            else:
+                parquet_path = table_dir / parts[-1]
+            entries.append(
+                (source_name, table_name, table_dir / f"{table_name}.schema.json", parquet_path)
+            )
+        return entries
+
+    def _manifest_entries(
+        self, data_dir: Path
+    ) -> Optional[tuple[list[tuple[str, str, Path, Path]], bool]]:
+        """Rendered tables of a data directory, re-reading the manifest only when it changed.
+
+        Returns:
+            Tuple of (entries, whether the manifest was re-read), or None without a manifest
+        """
+        manifest_signature = self._file_signature(data_dir / "manifest.json")
+        if manifest_signature is None:
+            self._manifest_cache.pop(data_dir, None)
+            return None
+        cached_manifest = self._manifest_cache.get(data_dir)
+        if cached_manifest is not None and cached_manifest[0] == manifest_signature:
+            return cached_manifest[1], False
+        entries = self._read_manifest_tables(data_dir)
+        self._manifest_cache[data_dir] = (manifest_signature, entries)
+        return entries, True
+
+    def _parse_schema_file(self, schema_path: Path) -> ColumnList:
+        """Parse a per-table {table}.schema.json into normalized columns."""
+        return self._normalize_columns(json.loads(schema_path.read_text()))
+
+    def _parse_schema_batch(self, schema_paths: list[Path]) -> list[ColumnList]:
+        """Parse a batch of schema files (runs on a worker thread)."""
+        return [self._parse_schema_file(schema_path) for schema_path in schema_paths]
+
+    def _parse_schema_files(self, schema_paths: list[Path]) -> list[ColumnList]:
+        """Parse schema files, fanning out over the worker pool for large projects."""
+        self.schema_files_parsed += len(schema_paths)
+        if len(schema_paths) <= SCHEMA_PARSE_BATCH_SIZE or self.parse_workers == 1:
+            return self._parse_schema_batch(schema_paths)
+
+        if self._parse_executor is None:
+            self._parse_executor = ThreadPoolExecutor(
+                max_workers=self.parse_workers, thread_name_prefix="schema-parse"
+            )
+        batches = [
+            schema_paths[i : i + SCHEMA_PARSE_BATCH_SIZE]
+            for i in range(0, len(schema_paths), SCHEMA_PARSE_BATCH_SIZE)
+        ]
+        results: list[ColumnList] = []
+        for batch_result in self._parse_executor.map(self._parse_schema_batch, batches):
+            results.extend(batch_result)
+        return results
+
     def _parse_evidence_schema_files(self, data_dir: Path) -> dict:
         """Parse Evidence's actual schema structure.
 
@@ -41,44 +189,162 @@ class EvidenceClient:
         - manifest.json: {"renderedFiles": {"source_name": ["path/to/table.parquet"]}}
         - Per-table schema: static/data/{source}/{table}/{table}.schema.json
 
+        Results are cached. Each call only stats the manifest and the schema
+        files, and re-parses the ones whose signature changed.
+
         Returns:
-            Dictionary in normalized format with sources/tables/columns
+            Dictionary in normalized format with sources/tables/columns; each
+            table's columns are a ColumnList
         """
-        manifest_path = data_dir / "manifest.json"
-        if not manifest_path.exists():
+        manifest = self._manifest_entries(data_dir)
+        if manifest is None:
+            self._result_cache.pop(data_dir, None)
             return {"sources": {}}
+        entries, changed = manifest
 
-        manifest = json.loads(manifest_path.read_text())
-        rendered_files = manifest.get("renderedFiles", {})
+        stale: list[tuple[Path, tuple[int, int]]] = []
+        for _, _, schema_path, _ in entries:
+            signature = self._file_signature(schema_path)
+            cached_table = self._table_cache.get(schema_path)
+            if cached_table is not None and cached_table[0] == signature:
+                continue
+            changed = True
+            if signature is None:
+                logger.warning(f"Schema file not found: {schema_path}")
+                self._table_cache[schema_path] = (None, ColumnList())
+            else:
+                stale.append((schema_path, signature))
 
-        sources = {}
-        for source_name, file_paths in rendered_files.items():
-            tables = {}
-            for file_path in file_paths:
-                # Extract table name from path like "static/data/source/table/table.parquet"
-                parts = Path(file_path).parts
-                if len(parts) >= 2:
-                    table_name = parts[-2]  # e.g., "orders" from ".../orders/orders.parquet"
-
-                    # Look for schema file
-                    schema_path = data_dir / source_name / table_name / f"{table_name}.schema.json"
-                    if schema_path.exists():
-                        schema_data = json.loads(schema_path.read_text())
-                        columns = []
-                        for col in schema_data:
-                            columns.append({
-                                "name": col.get("name", ""),
-                                "type": self._map_evidence_type(col.get("evidenceType", "unknown")),
-                            })
-                        tables[table_name] = {"columns": columns}
-                    else:
-                        logger.warning(f"Schema file not found: {schema_path}")
-                        tables[table_name] = {"columns": []}
-
-            if tables:
-                sources[source_name] = {"tables": tables}
-
-        return {"sources": sources}
+        if stale:
+            parsed = self._parse_schema_files([schema_path for schema_path, _ in stale])
+            for (schema_path, signature), columns in zip(stale, parsed):
+                self._table_cache[schema_path] = (signature, columns)
+
+        if not changed and data_dir in self._result_cache:
+            self.schema_cache_hits += 1
+            return self._result_cache[data_dir]
+        self.schema_cache_misses += 1
+
+        sources: dict[str, dict] = {}
+        for source_name, table_name, schema_path, _ in entries:
+            tables = sources.setdefault(source_name, {"tables": {}})["tables"]
+            tables[table_name] = {"columns": self._table_cache[schema_path][1]}
+
+        result = {"sources": sources}
+        self._result_cache[data_dir] = result
+        return result
+
+    def schema_data_dirs(self) -> list[Path]:
+        """Return the directories Evidence writes schema files to, in priority order."""
+        if not self.project_path:
+            return []
+        return [
+            self.project_path / ".evidence" / "template" / "static" / "data",
+            self.project_path / "static" / "data",
+        ]
+
+    def invalidate_schema(self, paths: Iterable[Path]) -> None:
+        """Drop cached schema state for changed manifest or schema files."""
+        for path in paths:
+            if path.name == "manifest.json":
+                self._manifest_cache.pop(path.parent, None)
+                self._result_cache.pop(path.parent, None)
+            elif self._table_cache.pop(path, None) is not None:
+                for data_dir in list(self._result_cache):
+                    if data_dir in path.parents:
+                        del self._result_cache[data_dir]
+
+    def schema_cache_info(self) -> dict:
+        """Return statistics for the schema metadata cache."""
+        return {
+            "hits": self.schema_cache_hits,
+            "misses": self.schema_cache_misses,
+            "files_parsed": self.schema_files_parsed,
+            "tables": len(self._table_cache),
+        }
+
+    def footer_cache_info(self) -> dict:
+        """Return statistics for the Parquet footer cache."""
+        return {
+            "hits": self.footer_cache_hits,
+            "misses": self.footer_cache_misses,
+            "size": len(self._footer_cache),
+        }
+
+    def _read_footer(self, parquet_path: Path) -> Optional[ParquetFooter]:
+        """Read a Parquet footer, reusing the cached one while the file is unchanged."""
+        signature = self._file_signature(parquet_path)
+        if signature is None:
+            self._footer_cache.pop(parquet_path, None)
+            return None
+        cached = self._footer_cache.get(parquet_path)
+        if cached is not None and cached[0] == signature:
+            self.footer_cache_hits += 1
+            return cached[1]
+        self.footer_cache_misses += 1
+        try:
+            footer: Optional[ParquetFooter] = read_parquet_footer(parquet_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read Parquet footer: {e}")
+            footer = None
+        self._footer_cache[parquet_path] = (signature, footer)
+        return footer
+
+    def _table_files(self) -> dict[str, Path]:
+        """Map 'source.table' to the table's Parquet file, in data directory priority."""
+        files: dict[str, Path] = {}
+        for data_dir in self.schema_data_dirs():
+            manifest = self._manifest_entries(data_dir)
+            if manifest is None:
+                continue
+            for source_name, table_name, _, parquet_path in manifest[0]:
+                files.setdefault(f"{source_name}.{table_name}", parquet_path)
+        return files
+
+    def _read_table_stats(self, tables: list[str]) -> dict[str, ParquetFooter]:
+        """Read the Parquet footers of tables named 'source.table'."""
+        files = self._table_files()
+        stats = {}
+        for name in tables:
+            parquet_path = files.get(name)
+            footer = self._read_footer(parquet_path) if parquet_path is not None else None
+            if footer is not None:
+                stats[name] = footer
+        return stats
+
+    async def get_table_stats(self, tables: Iterable[str]) -> dict[str, ParquetFooter]:
+        """Read row counts, sizes and column statistics from the tables' Parquet files.
+
+        Only each file's footer is read, and footers are cached until the file
+        changes. Tables without a readable local Parquet file are left out.
+
+        Args:
+            tables: Table names as 'source.table'
+
+        Returns:
+            Footer of each table that has one
+        """
+        # Shares the manifest cache with schema refreshes
+        if self._schema_lock is None:
+            self._schema_lock = asyncio.Lock()
+        async with self._schema_lock:
+            return await asyncio.to_thread(self._read_table_stats, list(tables))
+
+    async def get_table_file(self, table: str) -> Optional[Path]:
+        """Find the local Parquet file of a table.
+
+        Args:
+            table: Table name as 'source.table'
+
+        Returns:
+            Path of the file, or None if the project has no such rendered table
+        """
+        if self._schema_lock is None:
+            self._schema_lock = asyncio.Lock()
+        async with self._schema_lock:
+            files = await asyncio.to_thread(self._table_files)
+        parquet_path = files.get(table)
+        return parquet_path if parquet_path is not None and parquet_path.exists() else None
 
     def _map_evidence_type(self, evidence_type: str) -> str:
         """Map Evidence types to SQL-like types."""
@@ -90,12 +356,124 @@ class EvidenceClient:
         }
         return type_map.get(evidence_type, evidence_type)
 
+    def _normalize_columns(self, schema_data: list[dict]) -> ColumnList:
+        """Normalize the columns of an Evidence {table}.schema.json."""
+        return ColumnList(
+            (col.get("name", "") for col in schema_data),
+            (self._map_evidence_type(col.get("evidenceType", "unknown")) for col in schema_data),
+        )
+
+    def _load_schema_from_files(self) -> Optional[dict]:
+        """Load schema from the first data directory that has any sources."""
+        for data_dir in self.schema_data_dirs():
+            if data_dir.exists():
+                result = self._parse_evidence_schema_files(data_dir)
+                if result.get("sources"):
+                    logger.debug(f"Loaded schema from {data_dir}")
+                    return result
+        return None
+
+    async def _request(self, url: str) -> Optional[httpx.Response]:
+        """GET a dev server URL, unless the health breaker says the server is down.
+
+        Returns:
+            The response, or None if the request was skipped or failed to connect
+        """
+        if not self.health.allow_request():
+            return None
+        try:
+            client = await self._get_client()
+            response = await client.get(url)
+        except httpx.RequestError as e:
+            self.health.record_failure()
+            logger.debug(f"Could not connect to Evidence dev server: {e}")
+            return None
+        self.health.record_success()
+        return response
+
+    async def _get_dev_manifest(self) -> Optional[dict]:
+        """Fetch the dev server's manifest, reusing it for manifest_ttl seconds."""
+        now = time.monotonic()
+        if self._dev_manifest is not None and now - self._dev_manifest[0] < self.manifest_ttl:
+            return self._dev_manifest[1]
+
+        response = await self._request(f"{self.base_url}/_evidence/manifest.json")
+        if response is None or response.status_code != 200:
+            return None
+        try:
+            manifest = response.json()
+        except ValueError:
+            logger.warning("Evidence dev server returned an invalid manifest")
+            return None
+        self._dev_manifest = (now, manifest)
+        return manifest
+
+    async def _fetch_schema_file(
+        self, source_name: str, table_name: str
+    ) -> Optional[ColumnList]:
+        """Fetch a table's schema file from the dev server's static data route.
+
+        Returns None if the file could not be fetched.
+        """
+        url = f"{self.base_url}/data/{source_name}/{table_name}/{table_name}.schema.json"
+        response = await self._request(url)
+        try:
+            if response is None or response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code if response else 'unavailable'}")
+            schema_data = response.json()
+        except ValueError as e:
+            logger.warning(f"Schema file not available from dev server: {url} ({e})")
+            return None
+        return self._normalize_columns(schema_data)
+
+    async def _load_schema_from_dev_server(self) -> Optional[dict]:
+        """Load schema via the dev server's manifest and static schema files.
+
+        Schema files are only refetched when the manifest's rendered files
+        change. A schema with tables that could not be fetched is returned
+        without their columns but not kept, so the next call retries them.
+        """
+        manifest = await self._get_dev_manifest()
+        if not manifest:
+            return None
+
+        key = json.dumps(manifest.get("renderedFiles", {}), sort_keys=True)
+        if self._dev_schema is not None and self._dev_schema[0] == key:
+            return self._dev_schema[1]
+
+        tables = self._rendered_tables(manifest)
+        semaphore = asyncio.Semaphore(self.parse_workers)
+
+        async def fetch(source_name: str, table_name: str) -> Optional[ColumnList]:
+            async with semaphore:
+                return await self._fetch_schema_file(source_name, table_name)
+
+        columns = await asyncio.gather(*(fetch(source, table) for source, table in tables))
+
+        sources: dict[str, dict] = {}
+        for (source_name, table_name), table_columns in zip(tables, columns):
+            sources.setdefault(source_name, {"tables": {}})["tables"][table_name] = {
+                "columns": table_columns or ColumnList()
+            }
+        result = {"sources": sources}
+        missing = sum(table_columns is None for table_columns in columns)
+        if missing:
+            logger.warning(f"Schema incomplete: {missing} table(s) unavailable from dev server")
+        else:
+            self._dev_schema = (key, result)
+            logger.info("Loaded schema from Evidence dev server")
+        return result
+
     async def get_schema_metadata(self) -> dict:
         """Retrieve schema metadata from Evidence.
 
         Strategy:
-        1. Try HTTP endpoint if dev server is running
-        2. Fallback to reading schema files from project directory
+        1. Read schema files from the project directory (cached, revalidated by stat)
+        2. Otherwise use the dev server's manifest, if the server is up
+
+        The dev server is only contacted when the project files yield nothing,
+        and never while its health breaker is open, so tool latency does not
+        depend on whether a dev server happens to be running.
 
         Returns:
             Dictionary containing table and column metadata
@@ -103,30 +481,17 @@ class EvidenceClient:
         Raises:
             RuntimeError: If unable to retrieve metadata from any source
         """
-        # Try live dev server first
-        try:
-            client = await self._get_client()
-            response = await client.get(f"{self.base_url}/_evidence/manifest.json")
-            if response.status_code == 200:
-                logger.info("Retrieved manifest from Evidence dev server")
-                # Dev server returns same format, need to parse schema files
-                # Fall through to file-based parsing
-        except httpx.RequestError as e:
-            logger.debug(f"Could not connect to Evidence dev server: {e}")
-
-        # Parse from file system (works for both dev and built projects)
-        if self.project_path:
-            data_dirs = [
-                self.project_path / ".evidence" / "template" / "static" / "data",
-                self.project_path / "static" / "data",
-            ]
-
-            for data_dir in data_dirs:
-                if data_dir.exists():
-                    result = self._parse_evidence_schema_files(data_dir)
-                    if result.get("sources"):
-                        logger.info(f"Parsed schema from {data_dir}")
-                        return result
+        # Parse from file system (works for both dev and built projects).
+        # File I/O and JSON decoding run off the event loop.
+        if self._schema_lock is None:
+            self._schema_lock = asyncio.Lock()
+        async with self._schema_lock:
+            result = await asyncio.to_thread(self._load_schema_from_files)
+            if result is None:
+                result = await self._load_schema_from_dev_server()
+        if result is not None and result.get("sources"):
+            self.schema_versions.record(result)
+            return result
 
         raise RuntimeError(
             "Unable to retrieve Evidence schema metadata. "
@@ -134,21 +499,59 @@ class EvidenceClient:
             f"Checked project path: {self.project_path}"
         )
 
+    async def get_schema_index(self) -> SchemaIndex:
+        """Retrieve schema metadata as a name index for filtered lookups.
+
+        The index is rebuilt only when the underlying schema changes.
+
+        Raises:
+            RuntimeError: If unable to retrieve metadata from any source
+        """
+        schema = await self.get_schema_metadata()
+        if self._schema_index is None or self._schema_index[0] is not schema:
+            self._schema_index = (schema, SchemaIndex(schema))
+        return self._schema_index[1]
+
+    @property
+    def schema_version(self) -> Optional[int]:
+        """Version of the most recently retrieved schema, or None before the first."""
+        return self.schema_versions.current
+
+    async def get_schema_changes(self, since_version: int) -> Optional[SchemaChanges]:
+        """Tables added, removed or altered since an earlier schema version.
+
+        The current schema is retrieved first, so changes on disk since the
+        last call are included.
+
+        Args:
+            since_version: A version from an earlier response
+
+        Returns:
+            The changes, or None if the version is unknown or no longer kept
+
+        Raises:
+            RuntimeError: If unable to retrieve metadata from any source
+        """
+        await self.get_schema_metadata()
+        return self.schema_versions.changes(since_version)
+
     async def check_health(self) -> bool:
         """Check if Evidence dev server is running.
 
+        While the health breaker is open (the server recently failed to
+        connect), this returns False immediately without a request.
+
         Returns:
             True if the server is accessible, False otherwise
         """
-        try:
-            client = await self._get_client()
-            response = await client.get(self.base_url)
-            return response.status_code == 200
-        except httpx.RequestError:
-            return False
+        response = await self._request(self.base_url)
+        return response is not None and response.status_code == 200
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and the schema parsing pool."""
         if self._client:
             await self._client.aclose()
             self._client = None
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=False)
+            self._parse_executor = None
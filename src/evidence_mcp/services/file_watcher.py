@@ -0,0 +1,119 @@
+"""Polling file watcher for keeping in-memory caches fresh."""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+Snapshot = dict[Path, tuple[int, int]]
+
+
+class _Watch:
+    """A watched directory tree and the callback to notify."""
+
+    def __init__(
+        self, root: Path, suffixes: tuple[str, ...], callback: Callable[[set[Path]], None]
+    ):
+        self.root = root
+        self.suffixes = suffixes
+        self.callback = callback
+        self.snapshot: Optional[Snapshot] = None
+
+    def scan(self) -> Snapshot:
+        """Stat every matching file under the root."""
+        snapshot: Snapshot = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if self.suffixes and not filename.endswith(self.suffixes):
+                    continue
+                path = Path(dirpath) / filename
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> set[Path]:
+    """Return paths that were added, removed or modified between two snapshots."""
+    changed = {path for path, signature in new.items() if old.get(path) != signature}
+    changed.update(path for path in old if path not in new)
+    return changed
+
+
+class FileWatcher:
+    """Watches directory trees by polling and reports changed files.
+
+    Directory scans run in a worker thread; callbacks always run on the event
+    loop, so they can safely mutate caches that tool handlers read.
+    """
+
+    def __init__(self, interval: float = 2.0):
+        """Initialize the watcher.
+
+        Args:
+            interval: Seconds between scans
+        """
+        self.interval = interval
+        self._watches: list[_Watch] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def watch(
+        self,
+        root: Path,
+        callback: Callable[[set[Path]], None],
+        suffixes: tuple[str, ...] = (),
+    ) -> None:
+        """Register a directory tree to watch.
+
+        Args:
+            root: Directory to watch recursively (it may not exist yet)
+            callback: Called with the set of changed paths (added, modified or removed)
+            suffixes: Only watch files with these suffixes (all files if empty)
+        """
+        self._watches.append(_Watch(root, suffixes, callback))
+
+    async def poll(self) -> None:
+        """Scan all watched trees once and notify callbacks of changes.
+
+        The first scan of each tree only records a baseline.
+        """
+        for watch in self._watches:
+            snapshot = await asyncio.to_thread(watch.scan)
+            previous, watch.snapshot = watch.snapshot, snapshot
+            if previous is None:
+                continue
+            changed = diff_snapshots(previous, snapshot)
+            if changed:
+                logger.info(f"Detected {len(changed)} changed file(s) under {watch.root}")
+                try:
+                    watch.callback(changed)
+                except Exception as e:
+                    logger.error(f"File watcher callback for {watch.root} failed: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await self.poll()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start polling in the background on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"Watching {len(self._watches)} path(s) every {self.interval}s for changes"
+            )
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,86 @@
+"""Health tracking for the Evidence dev server."""
+
+import time
+from typing import Callable, Literal
+
+HealthStatus = Literal["up", "down", "half-open"]
+
+
+class DevServerHealth:
+    """Circuit breaker over dev server requests.
+
+    - up: requests are allowed.
+    - down: requests are skipped until the backoff expires. Each consecutive
+      failure doubles the backoff, up to max_backoff.
+    - half-open: the backoff has expired. One probe request is allowed; its
+      outcome moves the breaker to up or back to down.
+
+    The breaker starts half-open, so the first request acts as the probe.
+    """
+
+    def __init__(
+        self,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            base_backoff: Seconds to wait after the first failure
+            max_backoff: Upper bound on the wait between probes
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._state: HealthStatus = "half-open"
+        self._failures = 0
+        self._retry_at = 0.0
+        self._probing = False
+
+    @property
+    def status(self) -> HealthStatus:
+        """Current breaker state."""
+        if self._state == "down" and self._clock() >= self._retry_at:
+            return "half-open"
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now.
+
+        In the half-open state only one probe is allowed at a time. The caller
+        must report its outcome with record_success or record_failure.
+        """
+        status = self.status
+        if status == "up":
+            return True
+        if status == "down" or self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful request; the server is up."""
+        self._state = "up"
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a failed request; back off exponentially before the next probe."""
+        self._state = "down"
+        self._failures += 1
+        self._probing = False
+        backoff = min(self.base_backoff * 2 ** (self._failures - 1), self.max_backoff)
+        self._retry_at = self._clock() + backoff
+
+    def info(self) -> dict:
+        """Return the breaker state for diagnostics."""
+        status = self.status
+        return {
+            "status": status,
+            "consecutive_failures": self._failures,
+            "retry_in": max(0.0, round(self._retry_at - self._clock(), 3))
+            if status == "down"
+            else 0.0,
+        }
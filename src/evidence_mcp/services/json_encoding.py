@@ -0,0 +1,116 @@
+"""One-pass JSON encoding of tool responses, with a cache of encoded text.
+
+Tools return pydantic models or plain dicts. Models are serialized straight
+to JSON with ``model_dump_json``, instead of being dumped to dicts and then
+walked again by FastMCP's encoder. Plain dicts use orjson when it is
+installed (``pip install 'evidence-mcp[fast-json]'``) and pydantic-core
+otherwise. The output matches FastMCP's own conversion: 2-space indented
+JSON, with values JSON cannot represent written as strings.
+
+Responses that only change with an object a service keeps, such as a cached
+documentation page or the index of an unchanged schema, can be cached as
+encoded text keyed by that object, so repeating them costs no encoding.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import pydantic_core
+from pydantic import BaseModel
+
+_UNSET = object()
+_orjson: Any = _UNSET
+
+
+def _get_orjson():
+    """The orjson module, or None if it is not installed."""
+    global _orjson
+    if _orjson is _UNSET:
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        _orjson = orjson
+    return _orjson
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def to_json(result: Any) -> str:
+    """Encode a tool result as indented JSON text in one pass."""
+    if isinstance(result, BaseModel):
+        return result.model_dump_json(indent=2, fallback=str)
+    orjson = _get_orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                result,
+                default=_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            # Integers beyond 64 bits and other values orjson rejects
+            pass
+    return pydantic_core.to_json(result, indent=2, fallback=str).decode()
+
+
+class EncodedJson(str):
+    """JSON text of a tool result, sent to the client as is."""
+
+
+class ResponseEncoder:
+    """Cache of encoded tool results, keyed by the objects they were built from."""
+
+    def __init__(self, cache_size: int = 32):
+        """Initialize the encoder.
+
+        Args:
+            cache_size: Encoded results kept in memory (0 disables caching)
+        """
+        self.cache_size = cache_size
+        # (id(owner), *key) -> (owner, text); holding the owner keeps its id unique
+        self._cache: OrderedDict[tuple, tuple[Any, EncodedJson]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_info(self) -> dict:
+        """Return statistics for the encoded-response cache."""
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self._cache)}
+
+    @staticmethod
+    def encode(result: Any) -> EncodedJson:
+        """Encode a result that is built anew for each call."""
+        return EncodedJson(to_json(result))
+
+    def cached(self, owner: Any, build: Callable[[], Any], *key: Hashable) -> EncodedJson:
+        """Encoded result for an owner object, built and encoded once.
+
+        Args:
+            owner: Object the result depends on; it must not change while alive
+            build: Returns the result to encode on a cache miss
+            *key: Further arguments the result depends on
+
+        Returns:
+            The result's JSON text
+        """
+        cache_key = (id(owner), *key)
+        with self._lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None and entry[0] is owner:
+                self._cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                return entry[1]
+            self.cache_misses += 1
+        text = EncodedJson(to_json(build()))
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[cache_key] = (owner, text)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return text
@@ -0,0 +1,175 @@
+"""Line and block lookup for locating errors in Evidence pages."""
+
+import bisect
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from .page_lexer import Token, lex_page
+
+
+class Block(NamedTuple):
+    """A SQL or code block, or a component, spanning [start, end) of a page."""
+
+    kind: str  # "sql", "code" or "component"
+    name: str  # query name, code block language, or component name
+    line: int
+    end_line: int
+    start: int
+    end: int
+
+
+class SourceLocation(NamedTuple):
+    """Where an error points: its line, surrounding lines and enclosing block."""
+
+    line: int
+    column: Optional[int]
+    source_line: str
+    context: str  # numbered lines around the error, marked with ">"
+    block: Optional[Block]
+
+
+def _blocks(tokens: list[Token]) -> list[Block]:
+    """Blocks of a page, with components spanning from open to matching close tag."""
+    blocks = []
+    open_tags: list[Token] = []
+    for token in tokens:
+        if token.kind == "fence":
+            if token.name == "sql":
+                kind, name = "sql", token.info.split()[0] if token.info else ""
+            else:
+                kind, name = "code", token.name
+            end_line = token.line if token.end_line is None else token.end_line
+            blocks.append(Block(kind, name, token.line, end_line, token.start, token.end))
+        elif token.kind == "self_close":
+            blocks.append(
+                Block("component", token.name, token.line, token.end_line, token.start, token.end)
+            )
+        elif token.kind == "open":
+            open_tags.append(token)
+        elif token.kind == "close":
+            # Match the nearest open tag of the same name; tags left open inside it
+            # never get a span
+            for i in range(len(open_tags) - 1, -1, -1):
+                if open_tags[i].name == token.name:
+                    tag = open_tags[i]
+                    del open_tags[i:]
+                    blocks.append(
+                        Block("component", tag.name, tag.line, token.line, tag.start, token.end)
+                    )
+                    break
+    blocks.sort(key=lambda block: (block.start, -block.end))
+    return blocks
+
+
+class LineIndex:
+    """Line start offsets and block spans of a page, for O(log n) error lookup.
+
+    Blocks are sorted by start offset, and each block records the nearest
+    earlier block that contains it. The innermost block around an offset is
+    found by bisecting to the last block starting at or before it, then
+    walking up its containers: the walk is bounded by the nesting depth.
+    """
+
+    def __init__(self, content: str, tokens: Optional[list[Token]] = None):
+        """Build the index.
+
+        Args:
+            content: Page content
+            tokens: Tokens from lex_page for the content (lexed if omitted)
+        """
+        self.content = content
+        self.tokens = list(lex_page(content)) if tokens is None else tokens
+        self.line_starts = [0]
+        find = content.find
+        pos = find("\n")
+        while pos != -1:
+            self.line_starts.append(pos + 1)
+            pos = find("\n", pos + 1)
+
+        self.blocks = _blocks(self.tokens)
+        self._block_starts = [block.start for block in self.blocks]
+        # Index of the closest enclosing block, or -1
+        self._parents: list[int] = []
+        stack: list[int] = []
+        for i, block in enumerate(self.blocks):
+            while stack and self.blocks[stack[-1]].end <= block.start:
+                stack.pop()
+            self._parents.append(stack[-1] if stack else -1)
+            stack.append(i)
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the page."""
+        return len(self.line_starts)
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of a character offset."""
+        return bisect.bisect_right(self.line_starts, offset)
+
+    def line_text(self, line: int) -> str:
+        """Text of a 1-based line, without its newline."""
+        start = self.line_starts[line - 1]
+        end = self.line_starts[line] - 1 if line < len(self.line_starts) else len(self.content)
+        return self.content[start:end]
+
+    def offset(self, line: int, column: Optional[int] = None) -> int:
+        """Character offset of a 1-based line and column.
+
+        Without a column, this is the line's first non-blank character.
+        """
+        line = min(max(line, 1), len(self.line_starts))
+        start = self.line_starts[line - 1]
+        text = self.line_text(line)
+        if column is None:
+            return start + len(text) - len(text.lstrip())
+        return start + min(max(column - 1, 0), len(text))
+
+    def enclosing_block(self, offset: int) -> Optional[Block]:
+        """Innermost block containing a character offset."""
+        i = bisect.bisect_right(self._block_starts, offset) - 1
+        while i >= 0:
+            block = self.blocks[i]
+            if block.end > offset:
+                return block
+            i = self._parents[i]
+        return None
+
+    def locate(
+        self, line: int, column: Optional[int] = None, context: int = 2
+    ) -> Optional[SourceLocation]:
+        """Resolve an error position.
+
+        Args:
+            line: 1-based line number
+            column: 1-based column, if known; clamped to the line, one past its end at most
+            context: Lines to include before and after the error line
+
+        Returns:
+            The location, or None if the line is outside the page
+        """
+        if not 1 <= line <= len(self.line_starts):
+            return None
+        if column is not None:
+            column = min(max(column, 1), len(self.line_text(line)) + 1)
+        first = max(1, line - context)
+        last = min(len(self.line_starts), line + context)
+        width = len(str(last))
+        rows = []
+        for number in range(first, last + 1):
+            marker = ">" if number == line else " "
+            rows.append(f"{marker} {number:>{width}} | {self.line_text(number)}".rstrip())
+            if number == line and column is not None:
+                rows.append(f"  {'':>{width}} | {' ' * (column - 1)}^")
+        return SourceLocation(
+            line,
+            column,
+            self.line_text(line),
+            "\n".join(rows),
+            self.enclosing_block(self.offset(line, column)),
+        )
+
+
+@lru_cache(maxsize=8)
+def get_line_index(content: str) -> LineIndex:
+    """Index of a page, cached so a batch of errors on one page shares it."""
+    return LineIndex(content)
@@ -0,0 +1,335 @@
+"""Per-tool call metrics and cache statistics, with Prometheus text export.
+
+With several worker processes, each worker shares its metrics through a
+directory (see Metrics.share), the same way prometheus_client's multiprocess
+mode does: every worker writes a snapshot file there, and the Prometheus
+export of whichever worker is scraped sums all of them.
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets; a final +Inf bucket is implied
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+PREFIX = "evidence_mcp"
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts are per bucket and made cumulative on export."""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def add(self, counts: list[int], total: float) -> None:
+        """Add the bucket counts and sum of another histogram with the same bounds."""
+        for i, bucket_count in enumerate(counts):
+            self.counts[i] += bucket_count
+        self.total += total
+        self.count += sum(counts)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating within its bucket.
+
+        Values in the +Inf bucket are reported as the largest finite bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.bounds[-1]
+
+
+class ToolStats:
+    """Counters of one tool."""
+
+    __slots__ = ("calls", "errors", "latency", "size")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+
+    def to_dict(self) -> dict:
+        """The counters as JSON-compatible data, for sharing between workers."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency": [self.latency.counts, self.latency.total],
+            "size": [self.size.counts, self.size.total],
+        }
+
+    def add(self, data: dict) -> None:
+        """Add counters produced by to_dict."""
+        self.calls += data["calls"]
+        self.errors += data["errors"]
+        self.latency.add(*data["latency"])
+        self.size.add(*data["size"])
+
+
+class Metrics:
+    """Tool call metrics and registered cache statistics.
+
+    Tool calls are recorded from the server's event loop thread only, so the
+    counters are updated without locks. Cache statistics are not recorded at
+    all: registered callbacks read the services' own hit/miss counters when
+    the metrics are exported.
+
+    Once shared, the metrics are written to this worker's snapshot file at
+    most once per flush interval after a tool call, so the Prometheus export
+    lags other workers' calls by up to that interval. Snapshots of workers
+    that exited are still counted, which keeps the counters monotonic.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """Initialize the metrics.
+
+        Args:
+            clock: Clock for the uptime
+        """
+        self._clock = clock
+        self.started = clock()
+        self.tools: dict[str, ToolStats] = {}
+        self._caches: dict[str, Callable[[], Optional[dict]]] = {}
+        # Set by share(): the directory of worker snapshots and this worker's file
+        self.shared_dir: Optional[Path] = None
+        self._shared_path: Optional[Path] = None
+        self.flush_interval = 1.0
+        self._last_flush = 0.0
+        self._flush_pending = False
+
+    def record(self, tool: str, seconds: float, size: int, error: bool = False) -> None:
+        """Record a tool call.
+
+        Args:
+            tool: Tool name
+            seconds: Call latency
+            size: Response size in bytes
+            error: Whether the call failed or returned an error
+        """
+        stats = self.tools.get(tool)
+        if stats is None:
+            stats = self.tools[tool] = ToolStats()
+        stats.calls += 1
+        if error:
+            stats.errors += 1
+        stats.latency.observe(seconds)
+        stats.size.observe(size)
+        if self._shared_path is not None and not self._flush_pending:
+            self._schedule_flush()
+
+    def register_cache(self, name: str, info: Callable[[], Optional[dict]]) -> None:
+        """Register a cache whose statistics are read on export.
+
+        Args:
+            name: Cache name
+            info: Returns a dict with 'hits' and 'misses' (and optionally 'size'),
+                or None while the cache does not exist yet
+        """
+        self._caches[name] = info
+
+    @property
+    def uptime(self) -> float:
+        """Seconds since the metrics were created."""
+        return self._clock() - self.started
+
+    def cache_stats(self) -> dict[str, dict]:
+        """Current statistics of each registered cache that exists.
+
+        Returns:
+            Cache name -> hits, misses, hit_ratio (None before any lookup) and size
+        """
+        stats = {}
+        for name, info_fn in self._caches.items():
+            info = info_fn()
+            if info is None:
+                continue
+            hits, misses = info.get("hits", 0), info.get("misses", 0)
+            stats[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else None,
+                "size": info.get("size"),
+            }
+        return stats
+
+    def share(self, directory: Path, name: Optional[str] = None, interval: float = 1.0) -> None:
+        """Share these metrics with other worker processes through a directory.
+
+        Args:
+            directory: Directory holding one snapshot file per worker
+            name: This worker's file name (default: worker-<pid>.json)
+            interval: Seconds between writes of this worker's snapshot
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        self.shared_dir = directory
+        self._shared_path = directory / (name or f"worker-{os.getpid()}.json")
+        self.flush_interval = interval
+        self.flush()
+
+    def _schedule_flush(self) -> None:
+        delay = self._last_flush + self.flush_interval - self._clock()
+        if delay <= 0:
+            self.flush()
+            return
+        try:
+            asyncio.get_running_loop().call_later(delay, self.flush)
+        except RuntimeError:
+            # No event loop (tests, scripts): write now
+            self.flush()
+            return
+        self._flush_pending = True
+
+    def flush(self) -> None:
+        """Write this worker's snapshot file, if the metrics are shared."""
+        self._flush_pending = False
+        if self._shared_path is None:
+            return
+        self._last_flush = self._clock()
+        snapshot = {
+            "started": time.time() - self.uptime,
+            "tools": {name: stats.to_dict() for name, stats in self.tools.items()},
+            "caches": {
+                name: {key: info[key] for key in ("hits", "misses", "size")}
+                for name, info in self.cache_stats().items()
+            },
+        }
+        tmp_path = self._shared_path.with_name(f".{self._shared_path.name}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+            os.replace(tmp_path, self._shared_path)
+        except OSError as e:
+            logger.warning(f"Could not write metrics snapshot {self._shared_path}: {e}")
+
+    def _read_shared(self) -> tuple[float, dict[str, ToolStats], dict[str, dict]]:
+        """Uptime, tool counters and cache statistics summed over all workers' snapshots."""
+        started = time.time() - self.uptime
+        tools: dict[str, ToolStats] = {}
+        caches: dict[str, dict] = {}
+        for path in sorted(self.shared_dir.glob("*.json")):
+            try:
+                snapshot = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable metrics snapshot {path}: {e}")
+                continue
+            started = min(started, snapshot["started"])
+            for name, data in snapshot["tools"].items():
+                tools.setdefault(name, ToolStats()).add(data)
+            for name, info in snapshot["caches"].items():
+                total = caches.setdefault(name, {"hits": 0, "misses": 0, "size": None})
+                total["hits"] += info["hits"]
+                total["misses"] += info["misses"]
+                if info["size"] is not None:
+                    total["size"] = (total["size"] or 0) + info["size"]
+        for info in caches.values():
+            lookups = info["hits"] + info["misses"]
+            info["hit_ratio"] = info["hits"] / lookups if lookups else None
+        return time.time() - started, tools, caches
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Shared metrics are summed over the snapshots of every worker.
+        """
+        if self._shared_path is None:
+            return _render_prometheus(self.uptime, self.tools, self.cache_stats())
+        self.flush()
+        return _render_prometheus(*self._read_shared())
+
+
+def _render_prometheus(
+    uptime: float, tool_stats: dict[str, ToolStats], cache_stats: dict[str, dict]
+) -> str:
+    """Render uptime, tool counters and cache statistics as Prometheus text."""
+    lines = [
+        f"# HELP {PREFIX}_uptime_seconds Seconds since the server started.",
+        f"# TYPE {PREFIX}_uptime_seconds gauge",
+        f"{PREFIX}_uptime_seconds {uptime:.3f}",
+    ]
+    tools = sorted(tool_stats.items())
+
+    for metric, help_text, attr in (
+        ("tool_calls_total", "Tool calls.", "calls"),
+        ("tool_errors_total", "Tool calls that raised or returned an error.", "errors"),
+    ):
+        lines.append(f"# HELP {PREFIX}_{metric} {help_text}")
+        lines.append(f"# TYPE {PREFIX}_{metric} counter")
+        for name, stats in tools:
+            lines.append(f'{PREFIX}_{metric}{{tool="{_escape(name)}"}} {getattr(stats, attr)}')
+
+    for metric, help_text, attr in (
+        ("tool_latency_seconds", "Tool call latency.", "latency"),
+        ("tool_response_bytes", "Size of tool responses.", "size"),
+    ):
+        lines.append(f"# HELP {PREFIX}_{metric} {help_text}")
+        lines.append(f"# TYPE {PREFIX}_{metric} histogram")
+        for name, stats in tools:
+            hist = getattr(stats, attr)
+            label = f'tool="{_escape(name)}"'
+            cumulative = 0
+            for bound, count in zip(hist.bounds + (float("inf"),), hist.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f'{PREFIX}_{metric}_bucket{{{label},le="{le}"}} {cumulative}')
+            lines.append(f"{PREFIX}_{metric}_sum{{{label}}} {hist.total:g}")
+            lines.append(f"{PREFIX}_{metric}_count{{{label}}} {hist.count}")
+
+    caches = sorted(cache_stats.items())
+    for metric, help_text, key, kind in (
+        ("cache_hits_total", "Cache hits.", "hits", "counter"),
+        ("cache_misses_total", "Cache misses.", "misses", "counter"),
+        ("cache_hit_ratio", "Cache hits over lookups.", "hit_ratio", "gauge"),
+        ("cache_entries", "Entries held by the cache.", "size", "gauge"),
+    ):
+        rows = [(name, info[key]) for name, info in caches if info[key] is not None]
+        if not rows:
+            continue
+        lines.append(f"# HELP {PREFIX}_{metric} {help_text}")
+        lines.append(f"# TYPE {PREFIX}_{metric} {kind}")
+        for name, value in rows:
+            lines.append(f'{PREFIX}_{metric}{{cache="{_escape(name)}"}} {value:g}')
+
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def lru_cache_info(func) -> Callable[[], dict]:
+    """Statistics callback for a functools.lru_cache wrapped function."""
+
+    def info() -> dict:
+        cache_info = func.cache_info()
+        return {"hits": cache_info.hits, "misses": cache_info.misses, "size": cache_info.currsize}
+
+    return info
@@ -0,0 +1,149 @@
+"""Single-pass lexer for Evidence markdown pages."""
+
+import re
+from functools import lru_cache
+from typing import Iterator, NamedTuple, Optional
+
+# One alternation, tried at each position: the lexer never rescans text.
+# Every branch starts with a literal so the regex engine can skip ahead
+# quickly. Rows check that their pipe starts the line with a lookbehind, and
+# lex_page checks the indentation of fences; both are much cheaper than
+# anchoring a branch with ^. Outside quotes, a tag never spans a "<", so a
+# failed tag match cannot run past the start of a line that opens a tag.
+_TOKEN_RE = re.compile(
+    r"""
+    ```(?P<fence>[^\n`]*)$
+    | \|(?<![^\n]\|)(?P<row>[^\n]*\|[^\n]*\|)$
+    | <(?:
+        /(?P<close>\w+)[ \t]*>
+      | (?P<tag>\w+)
+        (?P<attrs>[^<>{}"'/]*(?:(?:/(?!\s*>)|\{(?:[^{}<]|\{[^{}<]*\})*\}|"[^"\n]*"|'[^'\n]*')[^<>{}"'/]*)*)
+        (?P<slash>/?)\s*>
+    )
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+_FENCE_CLOSE_RE = re.compile(r"^[ \t]*```[ \t]*$", re.MULTILINE)
+_PROP_RE = re.compile(
+    r"""([\w:.-]+)(?:\s*=\s*(\{(?:[^{}]|\{[^{}]*\})*\}|"[^"\n]*"|'[^'\n]*'|[^\s"'{}>/]+))?"""
+)
+
+
+class Prop(NamedTuple):
+    """A component prop; value is the raw text (quotes/braces kept), or None for flags."""
+
+    name: str
+    value: Optional[str]
+
+
+@lru_cache(maxsize=4096)
+def parse_props(attrs: str) -> tuple[Prop, ...]:
+    """Parse the attribute text of a tag into props."""
+    return tuple(Prop(name, value or None) for name, value in _PROP_RE.findall(attrs))
+
+
+class Token(NamedTuple):
+    """A lexical element of an Evidence page.
+
+    Kinds:
+        fence: a fenced code block; name is the language, info the text after it
+            (for SQL blocks, the query name), end_line the closing fence line or
+            None if the block is never closed
+        open / close / self_close: component or HTML tags; info is the raw
+            attribute text, parsed on demand by the props property
+        table_row: a markdown table row
+    """
+
+    kind: str
+    name: str
+    line: int
+    column: int
+    end_line: Optional[int]
+    start: int
+    end: int
+    info: str = ""
+
+    @property
+    def props(self) -> tuple[Prop, ...]:
+        """Props of a tag token (empty for other kinds)."""
+        if self.kind in ("open", "self_close") and self.info:
+            return parse_props(self.info)
+        return ()
+
+
+def lex_page(content: str, pos: int = 0, line: int = 1) -> Iterator[Token]:
+    """Tokenize Evidence markdown in one linear pass.
+
+    Code block contents are skipped, so SQL comparisons or example markup inside
+    fences never produce tags.
+
+    Args:
+        content: Page content
+        pos: Offset to start lexing from (must not fall inside a token)
+        line: Line number of pos (1-based)
+
+    Yields:
+        Tokens in document order, with 1-based line and column positions
+    """
+    line_start = content.rfind("\n", 0, pos) + 1
+    finditer = _TOKEN_RE.finditer
+    fence_close = _FENCE_CLOSE_RE.search
+    count = content.count
+    rfind = content.rfind
+    # Skip NamedTuple.__new__'s keyword handling: this runs once per token
+    new_token = tuple.__new__
+
+    while pos is not None:
+        resume = None
+        for match in finditer(content, pos):
+            start, end = match.span()
+            newlines = count("\n", pos, start)
+            if newlines:
+                line += newlines
+                line_start = rfind("\n", pos, start) + 1
+            pos = end
+            group = match.lastgroup
+
+            column = start - line_start + 1
+            if group == "close":
+                name = match.group("close")
+                yield new_token(Token, ("close", name, line, column, line, start, end, ""))
+            elif group == "slash":
+                tag, attrs, slash = match.group("tag", "attrs", "slash")
+                kind = "self_close" if slash else "open"
+                newlines = count("\n", start, end)
+                end_line = line + newlines
+                yield new_token(
+                    Token, (kind, tag, line, column, end_line, start, end, attrs.strip())
+                )
+                if newlines:
+                    line = end_line
+                    line_start = rfind("\n", start, end) + 1
+            elif group == "row":
+                yield new_token(Token, ("table_row", "", line, 1, line, start, end, ""))
+            elif not content[line_start:start].strip(" \t"):
+                # An opening fence (only whitespace may precede it on its line).
+                # Its contents are skipped, so lexing resumes after the closing fence.
+                lang, _, rest = match.group("fence").strip().partition(" ")
+                if "\t" in lang:
+                    lang, _, more = lang.partition("\t")
+                    rest = f"{more} {rest}"
+                closing = fence_close(content, end + 1)
+                if closing is None:
+                    yield Token(
+                        "fence", lang, line, 1, None, line_start, len(content), rest.strip()
+                    )
+                    return
+                end_line = line + count("\n", start, closing.start())
+                yield Token(
+                    "fence", lang, line, 1, end_line, line_start, closing.end(), rest.strip()
+                )
+                resume = closing.end()
+                line = end_line
+                line_start = closing.start()
+                break
+            else:
+                # Backticks inside a line; anything after them may still hold tags
+                resume = start + 3
+                break
+        pos = resume
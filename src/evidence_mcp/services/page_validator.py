@@ -0,0 +1,275 @@
+"""Validation rules for Evidence markdown pages."""
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from .page_lexer import Token, lex_page
+from .schema_index import SchemaIndex
+from .sql_refs import check_sql_references, extract_sql_references
+
+# Components that are commonly written without a closing tag
+KNOWN_SELF_CLOSING = frozenset({"Value", "BigValue", "Delta", "Sparkline"})
+
+
+def validate_tokens(tokens: Iterable[Token]) -> list[str]:
+    """Run all page checks over a token stream.
+
+    Args:
+        tokens: Tokens produced by lex_page, in document order
+
+    Returns:
+        List of warning messages
+    """
+    unbalanced_fence = False
+    unnamed_sql = False
+    markdown_table = False
+    quoted_data = False
+    # tag name -> line numbers of opening tags not yet matched by a close
+    open_tags: dict[str, list[int]] = {}
+
+    for token in tokens:
+        kind = token.kind
+        if kind == "open":
+            open_tags.setdefault(token.name, []).append(token.line)
+        elif kind == "close":
+            pending = open_tags.get(token.name)
+            if pending:
+                pending.pop()
+        elif kind == "fence":
+            if token.end_line is None:
+                unbalanced_fence = True
+            if token.name == "sql" and not token.info:
+                unnamed_sql = True
+        elif kind == "table_row":
+            markdown_table = True
+
+        # Only parse props when the raw attributes could hold a quoted reference
+        info = token.info
+        if not quoted_data and ("{'" in info or '{"' in info) and kind != "fence":
+            for prop in token.props:
+                if prop.name == "data" and prop.value and prop.value[:2] in ('{"', "{'"):
+                    quoted_data = True
+
+    warnings = []
+    if unbalanced_fence:
+        warnings.append("Unbalanced code fences detected (odd number of ```)")
+    if unnamed_sql:
+        warnings.append(
+            "Some SQL code blocks may be missing query names. "
+            "Use format: ```sql query_name"
+        )
+    if markdown_table:
+        warnings.append(
+            "Markdown table detected. Consider using <DataTable data={query} /> instead."
+        )
+    for tag, lines in open_tags.items():
+        if tag in KNOWN_SELF_CLOSING:
+            continue
+        for line in lines:
+            warnings.append(f"Potentially unclosed <{tag}> tag (line {line})")
+    if quoted_data:
+        warnings.append(
+            "Query references in data prop should not be quoted. "
+            "Use data={query_name} not data={'query_name'}"
+        )
+    return warnings
+
+
+def validate_evidence_content(
+    content: str, schema_index: Optional[SchemaIndex] = None
+) -> list[str]:
+    """Validate Evidence markdown content for common issues.
+
+    Args:
+        content: The Evidence markdown content to validate
+        schema_index: Project schema; when given, tables and columns used in
+            SQL blocks are checked against it
+
+    Returns:
+        List of warning messages
+    """
+    if schema_index is None:
+        return validate_tokens(lex_page(content))
+    tokens = list(lex_page(content))
+    return validate_tokens(tokens) + check_sql_references(
+        extract_sql_references(content, tokens), schema_index
+    )
+
+
+class ValidatedPage:
+    """A validated page: its content, token stream and warnings."""
+
+    __slots__ = ("content", "tokens", "warnings")
+
+    def __init__(self, content: str, tokens: list[Token], warnings: list[str]):
+        self.content = content
+        self.tokens = tokens
+        self.warnings = warnings
+
+    @classmethod
+    def from_content(cls, content: str) -> "ValidatedPage":
+        """Lex and validate a page from scratch."""
+        tokens = list(lex_page(content))
+        return cls(content, tokens, validate_tokens(tokens))
+
+    def revalidate(self, content: str) -> "ValidatedPage":
+        """Validate a new version of this page, re-lexing only the edited region.
+
+        Lexing restarts after the last tag before the first changed line and
+        stops as soon as it produces a token that the previous version also had
+        at the same place in the unchanged tail. Tokens outside that window are
+        reused, shifted to their new offsets and lines. The page checks are then
+        re-run over the merged token stream, which is cheap next to lexing.
+
+        Args:
+            content: New page content
+
+        Returns:
+            The validated new page (identical to ValidatedPage.from_content)
+        """
+        old = self.content
+        if content == old:
+            return self
+        old_tokens = self.tokens
+
+        # Changed region: [edit_start, old_tail) in old, [edit_start, new_tail) in new,
+        # both widened to whole lines
+        prefix = _common_prefix_length(old, content)
+        edit_start = old.rfind("\n", 0, prefix) + 1
+        suffix = _common_suffix_length(old, content, min(len(old), len(content)) - edit_start)
+        new_tail = len(content) - suffix
+        delta = len(content) - len(old)
+        if not (_at_line_start(content, new_tail) and _at_line_start(old, new_tail - delta)):
+            # Past the first character the tail is shared, so its next line
+            # start is a line start in both versions
+            new_tail = content.find("\n", new_tail) + 1 or len(content)
+        old_tail = new_tail - delta
+
+        # Restart at a tag that begins its line: no earlier match attempt can
+        # run past it (see page_lexer), so lexing from there matches a full pass
+        keep = bisect_right(old_tokens, edit_start, key=_token_end)
+        pos, line = 0, 1
+        while keep:
+            keep -= 1
+            token = old_tokens[keep]
+            line_start = token.start - token.column + 1
+            if token.kind in _TAG_KINDS and not old[line_start : token.start].strip():
+                pos, line = token.start, token.line
+                break
+
+        tokens = old_tokens[:keep]
+        tail_start = len(old_tokens)
+        for token in lex_page(content, pos, line):
+            if token.start >= new_tail:
+                # Lexing from the same offset of identical text gives the same
+                # tokens, so once the streams line up the rest is reusable
+                j = bisect_left(old_tokens, token.start - delta, key=_token_start)
+                if j < len(old_tokens) and old_tokens[j].start == token.start - delta:
+                    tail_start = j
+                    break
+            tokens.append(token)
+
+        tail = old_tokens[tail_start:]
+        line_delta = content.count("\n", edit_start, new_tail) - old.count(
+            "\n", edit_start, old_tail
+        )
+        if tail and (delta or line_delta):
+            tail = [_shift(token, delta, line_delta) for token in tail]
+        tokens.extend(tail)
+        return ValidatedPage(content, tokens, validate_tokens(tokens))
+
+
+class PageValidationCache:
+    """Recently validated versions of a page, keyed by content hash.
+
+    An exact repeat returns the cached warnings; any other content is
+    revalidated incrementally against the most recently validated version.
+    """
+
+    def __init__(self, max_size: int = 8):
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Number of page versions to keep
+        """
+        self.max_size = max_size
+        self._pages: OrderedDict[int, ValidatedPage] = OrderedDict()
+
+    def validate(self, content: str, schema_index: Optional[SchemaIndex] = None) -> list[str]:
+        """Validate content, reusing earlier work where possible.
+
+        Args:
+            content: The Evidence markdown content to validate
+            schema_index: Project schema to check SQL references against
+
+        Returns:
+            List of warning messages
+        """
+        key = hash(content)
+        page = self._pages.get(key)
+        if page is not None and page.content == content:
+            self._pages.move_to_end(key)
+        else:
+            if self._pages:
+                page = next(reversed(self._pages.values())).revalidate(content)
+            else:
+                page = ValidatedPage.from_content(content)
+            self._pages[key] = page
+            if len(self._pages) > self.max_size:
+                self._pages.popitem(last=False)
+
+        warnings = list(page.warnings)
+        if schema_index is not None:
+            # Extraction is cached per SQL block, so unchanged queries cost a lookup
+            refs = extract_sql_references(page.content, page.tokens)
+            warnings.extend(check_sql_references(refs, schema_index))
+        return warnings
+
+
+_TAG_KINDS = frozenset({"open", "close", "self_close"})
+
+
+def _token_start(token: Token) -> int:
+    return token.start
+
+
+def _token_end(token: Token) -> int:
+    return token.end
+
+
+def _shift(token: Token, delta: int, line_delta: int) -> Token:
+    kind, name, line, column, end_line, start, end, info = token
+    if end_line is not None:
+        end_line += line_delta
+    return tuple.__new__(
+        Token, (kind, name, line + line_delta, column, end_line, start + delta, end + delta, info)
+    )
+
+
+def _at_line_start(text: str, pos: int) -> bool:
+    return pos == 0 or text[pos - 1] == "\n"
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Length of the longest common prefix, found by bisecting slice comparisons."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Length of the longest common suffix, capped at limit."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid : len(a) - lo] == b[len(b) - mid : len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
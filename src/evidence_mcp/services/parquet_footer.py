@@ -0,0 +1,357 @@
+"""Parquet footer reader for row counts, sizes and column statistics.
+
+A Parquet file ends with its metadata (the footer), a 4-byte little-endian
+footer length and the magic bytes ``PAR1``. The footer is a Thrift
+compact-protocol ``FileMetaData`` struct holding the schema, the row count
+and, per row group and column, sizes and optional min/max/null statistics.
+Only those bytes are read, from a memory map of the file; row data is never
+touched.
+"""
+
+import datetime
+import decimal
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+MAGIC = b"PAR1"
+ENCRYPTED_MAGIC = b"PARE"
+
+# Parquet physical types
+BOOLEAN, INT32, INT64, INT96, FLOAT, DOUBLE, BYTE_ARRAY, FIXED_LEN_BYTE_ARRAY = range(8)
+PHYSICAL_TYPES = (
+    "BOOLEAN",
+    "INT32",
+    "INT64",
+    "INT96",
+    "FLOAT",
+    "DOUBLE",
+    "BYTE_ARRAY",
+    "FIXED_LEN_BYTE_ARRAY",
+)
+# Parquet converted types used to decode statistics
+_DECIMAL, _DATE, _TIMESTAMP_MILLIS, _TIMESTAMP_MICROS = 5, 6, 9, 10
+# LogicalType and TimeUnit union fields
+_LOGICAL_DECIMAL, _LOGICAL_DATE, _LOGICAL_TIMESTAMP = 5, 6, 8
+_MILLIS, _MICROS, _NANOS = 1, 2, 3
+
+# Longest string statistic reported; longer values are cut
+MAX_TEXT = 64
+# Nesting allowed in the footer, so a corrupt file cannot exhaust the stack
+_MAX_DEPTH = 64
+
+_EPOCH_DATE = datetime.date(1970, 1, 1)
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+# Thrift compact protocol types
+_STOP, _TRUE, _FALSE, _BYTE, _I16, _I32, _I64, _DOUBLE, _BINARY, _LIST, _SET, _MAP, _STRUCT = range(
+    13
+)
+
+
+class ColumnStats(NamedTuple):
+    """Statistics of one leaf column, over all row groups."""
+
+    name: str  # dotted path for nested columns
+    physical_type: str
+    null_count: Optional[int]  # None unless every row group reports it
+    min: Any
+    max: Any
+    compressed_size: int
+
+
+class ParquetFooter(NamedTuple):
+    """What a Parquet footer says about its file."""
+
+    num_rows: int
+    file_size: int
+    row_groups: int
+    created_by: Optional[str]
+    columns: list[ColumnStats]
+
+
+class _CompactReader:
+    """Decodes Thrift compact-protocol structs into {field id: value} dicts."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def varint(self) -> int:
+        result = shift = 0
+        data = self.data
+        while True:
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def zigzag(self) -> int:
+        n = self.varint()
+        return (n >> 1) ^ -(n & 1)
+
+    def binary(self) -> bytes:
+        length = self.varint()
+        start = self.pos
+        self.pos += length
+        if self.pos > len(self.data):
+            raise ValueError("binary field runs past the end of the footer")
+        return self.data[start : self.pos]
+
+    def value(self, kind: int, depth: int) -> Any:
+        if kind in (_I16, _I32, _I64):
+            return self.zigzag()
+        if kind == _BINARY:
+            return self.binary()
+        if kind == _STRUCT:
+            return self.struct(depth + 1)
+        if kind in (_LIST, _SET):
+            header = self.data[self.pos]
+            self.pos += 1
+            size = header >> 4
+            if size == 15:
+                size = self.varint()
+            item_kind = header & 0x0F
+            if item_kind in (_TRUE, _FALSE):
+                # Booleans inside collections take a byte each
+                items = [b == _TRUE for b in self.data[self.pos : self.pos + size]]
+                self.pos += size
+                return items
+            return [self.value(item_kind, depth + 1) for _ in range(size)]
+        if kind == _MAP:
+            size = self.varint()
+            if not size:
+                return {}
+            kinds = self.data[self.pos]
+            self.pos += 1
+            return {
+                self.value(kinds >> 4, depth + 1): self.value(kinds & 0x0F, depth + 1)
+                for _ in range(size)
+            }
+        if kind == _BYTE:
+            value = self.data[self.pos]
+            self.pos += 1
+            return value - 256 if value > 127 else value
+        if kind == _DOUBLE:
+            (value,) = struct.unpack_from("<d", self.data, self.pos)
+            self.pos += 8
+            return value
+        if kind in (_TRUE, _FALSE):
+            return kind == _TRUE
+        raise ValueError(f"unknown Thrift type {kind}")
+
+    def struct(self, depth: int = 0) -> dict[int, Any]:
+        if depth > _MAX_DEPTH:
+            raise ValueError("footer is nested too deeply")
+        fields: dict[int, Any] = {}
+        field_id = 0
+        while True:
+            header = self.data[self.pos]
+            self.pos += 1
+            kind = header & 0x0F
+            if kind == _STOP:
+                return fields
+            delta = header >> 4
+            field_id = field_id + delta if delta else self.zigzag()
+            fields[field_id] = self.value(kind, depth)
+
+
+def _leaf_columns(schema: list[dict]) -> list[tuple[tuple[str, ...], dict]]:
+    """(path, SchemaElement) of each leaf column, in schema order."""
+    leaves = []
+    # Depth-first over the flattened tree: (path prefix, children left to read)
+    stack = [((), schema[0].get(5, 0))] if schema else []
+    for element in schema[1:]:
+        while stack and stack[-1][1] == 0:
+            stack.pop()
+        if not stack:
+            break
+        prefix, remaining = stack.pop()
+        stack.append((prefix, remaining - 1))
+        path = prefix + (element.get(4, b"").decode("utf-8", "replace"),)
+        children = element.get(5)
+        if children:
+            stack.append((path, children))
+        else:
+            leaves.append((path, element))
+    return leaves
+
+
+def _decode_stat(raw: bytes, element: dict) -> Any:
+    """Decode a plain-encoded min/max statistic into a comparable Python value."""
+    physical = element.get(1)
+    converted = element.get(6)
+    logical = element.get(10) or {}
+    scale = element.get(7)
+    if _LOGICAL_DECIMAL in logical:
+        scale = logical[_LOGICAL_DECIMAL].get(1, scale)
+    is_decimal = converted == _DECIMAL or _LOGICAL_DECIMAL in logical
+
+    if physical == BOOLEAN:
+        return bool(raw[0]) if raw else None
+    if physical in (INT32, INT64):
+        value = int.from_bytes(raw, "little", signed=True)
+        if is_decimal:
+            return decimal.Decimal(value).scaleb(-(scale or 0))
+        try:
+            if converted == _DATE or _LOGICAL_DATE in logical:
+                return _EPOCH_DATE + datetime.timedelta(days=value)
+            if _LOGICAL_TIMESTAMP in logical:
+                unit = next(iter(logical[_LOGICAL_TIMESTAMP].get(2) or {}), _MICROS)
+            elif converted in (_TIMESTAMP_MILLIS, _TIMESTAMP_MICROS):
+                unit = _MILLIS if converted == _TIMESTAMP_MILLIS else _MICROS
+            else:
+                return value
+            if unit == _NANOS:
+                return _EPOCH + datetime.timedelta(microseconds=value // 1000)
+            return _EPOCH + datetime.timedelta(
+                microseconds=value * (1000 if unit == _MILLIS else 1)
+            )
+        except OverflowError:
+            pass
+        return value
+    if physical == FLOAT and len(raw) == 4:
+        return struct.unpack("<f", raw)[0]
+    if physical == DOUBLE and len(raw) == 8:
+        return struct.unpack("<d", raw)[0]
+    if physical in (BYTE_ARRAY, FIXED_LEN_BYTE_ARRAY):
+        if is_decimal:
+            return decimal.Decimal(int.from_bytes(raw, "big", signed=True)).scaleb(-(scale or 0))
+        try:
+            return raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return raw
+    # INT96 timestamps are deprecated and their statistics are not meaningful
+    return None
+
+
+def _json_value(value: Any) -> Any:
+    """Make a decoded statistic JSON-friendly."""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        text = "0x" + value.hex()
+        return text if len(text) <= MAX_TEXT else text[:MAX_TEXT] + "..."
+    if isinstance(value, str) and len(value) > MAX_TEXT:
+        return value[:MAX_TEXT] + "..."
+    return value
+
+
+def _min_max(values: list[Any], pick) -> Any:
+    try:
+        return pick(values) if values else None
+    except TypeError:
+        return None
+
+
+def parse_footer(data: bytes, file_size: int = 0) -> ParquetFooter:
+    """Decode a serialized FileMetaData struct.
+
+    Args:
+        data: Footer bytes, between the row data and the footer length
+        file_size: Size of the whole file in bytes
+
+    Raises:
+        ValueError: If the footer is malformed
+    """
+    try:
+        return _decode_footer(_CompactReader(data).struct(), file_size)
+    except (IndexError, KeyError, TypeError, AttributeError, struct.error) as e:
+        raise ValueError(f"Malformed Parquet footer: {e!r}") from e
+
+
+def _decode_footer(meta: dict[int, Any], file_size: int) -> ParquetFooter:
+    leaves = _leaf_columns(meta.get(2, []))
+    # Per leaf path: [null counts or None once a row group lacks one, mins, maxs, size]
+    totals: dict[tuple[str, ...], list] = {path: [0, [], [], 0] for path, _ in leaves}
+    elements = dict(leaves)
+    row_groups = meta.get(4, [])
+    for row_group in row_groups:
+        for chunk in row_group.get(1, []):
+            column = chunk.get(3)
+            if column is None:
+                continue
+            path = tuple(p.decode("utf-8", "replace") for p in column.get(3, []))
+            total = totals.get(path)
+            if total is None:
+                continue
+            total[3] += column.get(7, 0)
+            stats = column.get(12) or {}
+            null_count = stats.get(3)
+            total[0] = None if null_count is None or total[0] is None else total[0] + null_count
+            element = elements[path]
+            low, high = stats.get(6), stats.get(5)
+            if (
+                low is None
+                and high is None
+                and element.get(1) not in (BYTE_ARRAY, FIXED_LEN_BYTE_ARRAY)
+            ):
+                # Legacy min/max use signed comparison, which is only right for numbers
+                low, high = stats.get(2), stats.get(1)
+            if low is not None:
+                total[1].append(_decode_stat(low, element))
+            if high is not None:
+                total[2].append(_decode_stat(high, element))
+
+    columns = []
+    for path, element in leaves:
+        null_count, lows, highs, size = totals[path]
+        physical = element.get(1)
+        columns.append(
+            ColumnStats(
+                name=".".join(path),
+                physical_type=(
+                    PHYSICAL_TYPES[physical]
+                    if physical in range(len(PHYSICAL_TYPES))
+                    else "UNKNOWN"
+                ),
+                null_count=null_count,
+                min=_json_value(_min_max([v for v in lows if v is not None], min)),
+                max=_json_value(_min_max([v for v in highs if v is not None], max)),
+                compressed_size=size,
+            )
+        )
+    created_by = meta.get(6)
+    return ParquetFooter(
+        num_rows=meta.get(3, 0),
+        file_size=file_size,
+        row_groups=len(row_groups),
+        created_by=created_by.decode("utf-8", "replace") if created_by is not None else None,
+        columns=columns,
+    )
+
+
+def read_parquet_footer(path: Path) -> ParquetFooter:
+    """Read the footer of a Parquet file without reading its row data.
+
+    Args:
+        path: Parquet file
+
+    Raises:
+        ValueError: If the file is not a readable Parquet file
+        OSError: If the file cannot be opened
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < 12:
+            raise ValueError(f"Not a Parquet file: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic = mm[size - 4 :]
+            if magic == ENCRYPTED_MAGIC:
+                raise ValueError(f"Encrypted Parquet footer: {path}")
+            if magic != MAGIC or mm[:4] != MAGIC:
+                raise ValueError(f"Not a Parquet file: {path}")
+            footer_len = int.from_bytes(mm[size - 8 : size - 4], "little")
+            if footer_len > size - 12:
+                raise ValueError(f"Invalid Parquet footer length in {path}")
+            footer = mm[size - 8 - footer_len : size - 8]
+    try:
+        return parse_footer(footer, size)
+    except ValueError as e:
+        raise ValueError(f"{e} in {path}") from e
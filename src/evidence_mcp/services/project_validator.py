@@ -0,0 +1,158 @@
+"""Validation of every page in an Evidence project."""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from .page_lexer import lex_page
+from .page_validator import validate_tokens
+from .schema_index import SchemaIndex
+from .sql_refs import SqlReference, check_sql_references, extract_sql_references
+
+logger = logging.getLogger(__name__)
+
+# Below this many stale pages, validating inline beats shipping work to processes
+PARALLEL_THRESHOLD = 32
+# Pages handed to each worker task; amortizes pickling and scheduling overhead
+VALIDATE_BATCH_SIZE = 16
+
+
+def validate_files(paths: list[str]) -> list[tuple[list[str], list[SqlReference]]]:
+    """Read and validate a batch of pages (runs in worker processes).
+
+    Args:
+        paths: Absolute page paths
+
+    Returns:
+        (warnings, SQL references) for each page, in input order. References
+        are checked against the schema by the caller, so cached results stay
+        valid when only the schema changes.
+    """
+    results = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            results.append(([f"Could not read page: {e}"], []))
+            continue
+        tokens = list(lex_page(content))
+        results.append((validate_tokens(tokens), extract_sql_references(content, tokens)))
+    return results
+
+
+def scan_pages(pages_path: Path) -> dict[Path, tuple[int, int]]:
+    """Stat every markdown page under a directory.
+
+    Returns:
+        (mtime_ns, size) signature of each page, in sorted path order
+    """
+    pages = {}
+    for dirpath, dirnames, filenames in os.walk(pages_path):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".md"):
+                continue
+            path = Path(dirpath) / filename
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            pages[path] = (stat.st_mtime_ns, stat.st_size)
+    return pages
+
+
+class ProjectValidator:
+    """Validates all pages under an Evidence project's pages/ directory.
+
+    Results are cached per file and revalidated with (mtime_ns, size) stat
+    signatures, so a rerun only reads and validates pages that changed. Large
+    batches are spread across a process pool, which is created on first use
+    and kept for later runs.
+    """
+
+    def __init__(self, project_path: Path, workers: Optional[int] = None):
+        """Initialize the validator.
+
+        Args:
+            project_path: Path to the Evidence project directory
+            workers: Worker processes for large batches (defaults to the CPU count)
+        """
+        self.pages_path = project_path / "pages"
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        # page path -> (stat signature, warnings, SQL references)
+        self._cache: dict[Path, tuple[tuple[int, int], list[str], list[SqlReference]]] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Concurrent runs would validate the same stale pages twice
+        self._lock = threading.Lock()
+        self.files_validated = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers do not inherit the server's threads or locks
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _validate_stale(self, paths: list[Path]) -> list[tuple[list[str], list[SqlReference]]]:
+        """Validate pages, across the process pool when there are enough of them."""
+        names = [str(path) for path in paths]
+        if self.workers == 1 or len(names) < PARALLEL_THRESHOLD:
+            return validate_files(names)
+
+        batches = [
+            names[i : i + VALIDATE_BATCH_SIZE] for i in range(0, len(names), VALIDATE_BATCH_SIZE)
+        ]
+        results = []
+        for batch_results in self._get_executor().map(validate_files, batches):
+            results.extend(batch_results)
+        return results
+
+    def validate(self, schema_index: Optional[SchemaIndex] = None) -> dict[str, list[str]]:
+        """Validate every page, reusing cached results for unchanged files.
+
+        Args:
+            schema_index: Project schema to check SQL references against
+
+        Returns:
+            Warnings for each page, keyed by path relative to pages/ in sorted order
+        """
+        with self._lock:
+            return self._validate(schema_index)
+
+    def _validate(self, schema_index: Optional[SchemaIndex]) -> dict[str, list[str]]:
+        pages = scan_pages(self.pages_path)
+        stale = [
+            path
+            for path, signature in pages.items()
+            if path not in self._cache or self._cache[path][0] != signature
+        ]
+
+        if stale:
+            logger.info(f"Validating {len(stale)} of {len(pages)} page(s) in {self.pages_path}")
+            for path, (warnings, refs) in zip(stale, self._validate_stale(stale)):
+                self._cache[path] = (pages[path], warnings, refs)
+            self.files_validated += len(stale)
+
+        for path in list(self._cache):
+            if path not in pages:
+                del self._cache[path]
+
+        results = {}
+        for path in pages:
+            _, warnings, refs = self._cache[path]
+            if schema_index is not None and refs:
+                warnings = warnings + check_sql_references(refs, schema_index)
+            results[path.relative_to(self.pages_path).as_posix()] = warnings
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
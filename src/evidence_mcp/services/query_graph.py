@@ -0,0 +1,280 @@
+"""Query dependency graph of Evidence pages."""
+
+import difflib
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+from .page_lexer import Token, lex_page
+from .project_validator import scan_pages
+
+logger = logging.getLogger(__name__)
+
+_FRONTMATTER_RE = re.compile(r"\A---[ \t]*\n(.*?)\n---[ \t]*$", re.DOTALL | re.MULTILINE)
+_QUERIES_KEY_RE = re.compile(r"^queries:[ \t]*$", re.MULTILINE)
+# "- name: file.sql" or "- path/to/name.sql"
+_QUERY_FILE_RE = re.compile(
+    r"^[ \t]*-[ \t]*(?:([A-Za-z_]\w*)[ \t]*:[ \t]*)?(\S+?)(?:\.sql)?[ \t]*$"
+)
+_TEMPLATE_REF_RE = re.compile(r"\$\{\s*([A-Za-z_]\w*)")
+_DATA_REF_RE = re.compile(r"\{\s*([A-Za-z_]\w*)")
+
+# Page globals that look like query references but are not queries
+BUILTIN_NAMES = frozenset({"inputs", "params"})
+
+
+class QueryRef(NamedTuple):
+    """A use of a query: ${name} in another query, or data={name} on a component."""
+
+    name: str
+    line: int
+    user: str  # referencing query name, or component name
+    kind: str  # "query" or "component"
+
+
+class QueryIssue(NamedTuple):
+    """An undefined or cyclic query reference."""
+
+    kind: str  # "undefined" or "cycle"
+    name: str
+    line: Optional[int]
+    message: str
+    suggestion: Optional[str] = None
+
+
+def _frontmatter_queries(content: str) -> list[str]:
+    """Names of queries a page loads from SQL files via its frontmatter."""
+    match = _FRONTMATTER_RE.match(content)
+    if match is None:
+        return []
+    block = match.group(1)
+    key = _QUERIES_KEY_RE.search(block)
+    if key is None:
+        return []
+    names = []
+    for line in block[key.end() :].splitlines()[1:]:
+        if line and not line[0].isspace() and not line.startswith("-"):
+            break
+        item = _QUERY_FILE_RE.match(line)
+        if item:
+            name, path = item.groups()
+            names.append(name or path.rsplit("/", 1)[-1])
+    return names
+
+
+class PageQueryGraph:
+    """Query definitions, their ${...} dependencies and consuming components.
+
+    Nodes are the page's queries. Edges run from a query to the queries it
+    references; component uses are kept separately since nothing can depend
+    on a component.
+    """
+
+    def __init__(self, definitions: dict[str, Optional[int]], references: list[QueryRef]):
+        """Initialize the graph.
+
+        Args:
+            definitions: Query name -> definition line (None for frontmatter queries)
+            references: All query uses on the page, in document order
+        """
+        self.definitions = definitions
+        self.references = references
+        # Adjacency in both directions, built in one pass over the edges
+        self.dependencies: dict[str, list[str]] = {name: [] for name in definitions}
+        self._dependents: dict[str, list[str]] = {}
+        self._consumers: dict[str, list[QueryRef]] = {}
+        for ref in references:
+            if ref.kind == "component":
+                self._consumers.setdefault(ref.name, []).append(ref)
+            elif ref.user in self.dependencies and ref.name not in self.dependencies[ref.user]:
+                self.dependencies[ref.user].append(ref.name)
+                self._dependents.setdefault(ref.name, []).append(ref.user)
+        self._issues: Optional[list[QueryIssue]] = None
+        # query name / line -> position of the first issue about it
+        self._issues_by_name: dict[str, int] = {}
+        self._issues_by_line: dict[int, int] = {}
+
+    @classmethod
+    def from_content(
+        cls, content: str, tokens: Optional[Iterable[Token]] = None
+    ) -> "PageQueryGraph":
+        """Build the graph of a page.
+
+        Args:
+            content: Page content
+            tokens: Tokens from lex_page for the content (lexed if omitted)
+        """
+        definitions: dict[str, Optional[int]] = dict.fromkeys(_frontmatter_queries(content))
+        references: list[QueryRef] = []
+        for token in lex_page(content) if tokens is None else tokens:
+            if token.kind == "fence":
+                if token.name != "sql" or not token.info:
+                    continue
+                name = token.info.split()[0]
+                definitions[name] = token.line
+                body_start = content.find("\n", token.start, token.end) + 1
+                if not body_start:
+                    continue
+                body = content[body_start : token.end]
+                line, pos = token.line + 1, 0
+                for match in _TEMPLATE_REF_RE.finditer(body):
+                    line += body.count("\n", pos, match.start())
+                    pos = match.start()
+                    if match.group(1) not in BUILTIN_NAMES:
+                        references.append(QueryRef(match.group(1), line, name, "query"))
+            elif token.kind in ("open", "self_close") and "data" in token.info:
+                for prop in token.props:
+                    if prop.name == "data" and prop.value:
+                        match = _DATA_REF_RE.match(prop.value)
+                        if match and match.group(1) not in BUILTIN_NAMES:
+                            references.append(
+                                QueryRef(match.group(1), token.line, token.name, "component")
+                            )
+        return cls(definitions, references)
+
+    def consumers(self, name: str) -> list[QueryRef]:
+        """Components that use a query."""
+        return self._consumers.get(name, [])
+
+    def dependents(self, name: str) -> list[str]:
+        """Queries that reference a query."""
+        return self._dependents.get(name, [])
+
+    def undefined(self) -> list[QueryRef]:
+        """References to queries the page does not define."""
+        return [ref for ref in self.references if ref.name not in self.definitions]
+
+    def cycles(self) -> list[list[str]]:
+        """Find dependency cycles with an iterative depth-first search.
+
+        Returns:
+            Each cycle as a list of query names, starting and ending with the same name
+        """
+        state: dict[str, int] = {}  # 1 = on the current path, 2 = finished
+        cycles = []
+        for root in self.dependencies:
+            if root in state:
+                continue
+            path = [root]
+            stack = [iter(self.dependencies[root])]
+            state[root] = 1
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    state[path.pop()] = 2
+                    stack.pop()
+                elif child not in self.dependencies:
+                    continue
+                elif state.get(child) == 1:
+                    cycles.append(path[path.index(child) :] + [child])
+                elif child not in state:
+                    state[child] = 1
+                    path.append(child)
+                    stack.append(iter(self.dependencies[child]))
+        return cycles
+
+    def issues(self) -> list[QueryIssue]:
+        """Undefined references (with a closest-name suggestion) and cycles.
+
+        Computed once per graph; the returned list must not be modified.
+        """
+        if self._issues is None:
+            self._issues = self._find_issues()
+            for position, issue in enumerate(self._issues):
+                self._issues_by_name.setdefault(issue.name, position)
+                if issue.line is not None:
+                    self._issues_by_line.setdefault(issue.line, position)
+        return self._issues
+
+    def issue_named(self, names: Iterable[str]) -> Optional[QueryIssue]:
+        """The first issue about one of the given query names, in issues() order."""
+        issues = self.issues()
+        positions = [self._issues_by_name[n] for n in names if n in self._issues_by_name]
+        return issues[min(positions)] if positions else None
+
+    def issue_at(self, line: int) -> Optional[QueryIssue]:
+        """The first issue reported on a line."""
+        issues = self.issues()
+        position = self._issues_by_line.get(line)
+        return None if position is None else issues[position]
+
+    def _find_issues(self) -> list[QueryIssue]:
+        issues = []
+        names = list(self.definitions)
+        suggestions: dict[str, Optional[str]] = {}
+        for ref in self.undefined():
+            if ref.name not in suggestions:
+                matches = difflib.get_close_matches(ref.name, names, n=1)
+                suggestions[ref.name] = matches[0] if matches else None
+            suggestion = suggestions[ref.name]
+            where = f"in query '{ref.user}'" if ref.kind == "query" else f"by <{ref.user}>"
+            message = (
+                f"Query '{ref.name}' is referenced {where} (line {ref.line}) but never defined"
+            )
+            if suggestion:
+                message += f". Did you mean '{suggestion}'?"
+            issues.append(QueryIssue("undefined", ref.name, ref.line, message, suggestion))
+        for cycle in self.cycles():
+            issues.append(
+                QueryIssue(
+                    "cycle",
+                    cycle[0],
+                    self.definitions.get(cycle[0]),
+                    "Queries reference each other in a cycle: " + " -> ".join(cycle),
+                )
+            )
+        return issues
+
+
+class ProjectQueryGraph:
+    """Query graphs of every page in a project, rebuilt per page as pages change.
+
+    Pages are revalidated with (mtime_ns, size) stat signatures, so a refresh
+    only re-reads and re-lexes the pages that changed since the last one.
+    """
+
+    def __init__(self, project_path: Path):
+        """Initialize the graph.
+
+        Args:
+            project_path: Path to the Evidence project directory
+        """
+        self.pages_path = project_path / "pages"
+        # page path -> (stat signature, graph)
+        self._pages: dict[Path, tuple[tuple[int, int], PageQueryGraph]] = {}
+        # Refreshes run in worker threads; concurrent ones would mutate _pages together
+        self._lock = threading.Lock()
+        self.pages_parsed = 0
+
+    def refresh(self) -> dict[str, PageQueryGraph]:
+        """Rebuild the graphs of changed pages.
+
+        Returns:
+            Graph of each page, keyed by path relative to pages/ in sorted order
+        """
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> dict[str, PageQueryGraph]:
+        pages = scan_pages(self.pages_path)
+        for path, signature in pages.items():
+            cached = self._pages.get(path)
+            if cached is not None and cached[0] == signature:
+                continue
+            try:
+                content = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Could not read {path}: {e}")
+                content = ""
+            self._pages[path] = (signature, PageQueryGraph.from_content(content))
+            self.pages_parsed += 1
+
+        for path in list(self._pages):
+            if path not in pages:
+                del self._pages[path]
+
+        return {
+            path.relative_to(self.pages_path).as_posix(): self._pages[path][1] for path in pages
+        }
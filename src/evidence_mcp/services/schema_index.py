@@ -0,0 +1,160 @@
+"""Name index over tables and columns for filtered metadata lookups."""
+
+import re
+from array import array
+from functools import cached_property
+from typing import Optional
+
+from .schema_store import SchemaStore
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def compile_pattern(pattern: str) -> tuple[re.Pattern, set[str]]:
+    """Compile a name pattern into a matcher and the trigrams any match must contain.
+
+    Patterns are case-insensitive. ``*`` and ``?`` are wildcards; a pattern
+    without wildcards matches anywhere in the name (substring match).
+
+    Returns:
+        Tuple of (compiled regex, required trigrams)
+    """
+    pattern = pattern.lower()
+    literals = re.split(r"[*?]+", pattern)
+    if "*" in pattern or "?" in pattern:
+        regex = "".join(
+            ".*" if ch == "*" else "." if ch == "?" else re.escape(ch) for ch in pattern
+        )
+        matcher = re.compile(regex + r"\Z", re.DOTALL)
+    else:
+        matcher = re.compile(".*" + re.escape(pattern), re.DOTALL)
+
+    required: set[str] = set()
+    for literal in literals:
+        required |= _trigrams(literal)
+    return matcher, required
+
+
+class _TrigramIndex:
+    """Maps trigrams of lowercase names to the ids of names containing them."""
+
+    def __init__(self, names: list[str]):
+        self.names = names
+        self._postings: dict[str, set[int]] = {}
+        for i, name in enumerate(names):
+            for trigram in _trigrams(name):
+                self._postings.setdefault(trigram, set()).add(i)
+
+    def match(self, pattern: str) -> list[int]:
+        """Return the ids of all names matching a pattern, in id order."""
+        matcher, required = compile_pattern(pattern)
+        if required:
+            postings = sorted((self._postings.get(t, set()) for t in required), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            ids = sorted(candidates)
+        else:
+            ids = range(len(self.names))
+        return [i for i in ids if matcher.match(self.names[i])]
+
+
+class SchemaIndex:
+    """Precomputed name index over a normalized {"sources": ...} schema.
+
+    Tables and columns are held in a columnar SchemaStore, in schema order.
+    Trigram postings over "source.table" and column names narrow pattern
+    searches to a few candidates before the exact pattern check. Postings and
+    exact-lookup tables are built on first use, so answering an unfiltered
+    request only pays for the store.
+    """
+
+    def __init__(self, schema: dict):
+        """Build the index.
+
+        Args:
+            schema: Normalized schema as returned by EvidenceClient.get_schema_metadata
+        """
+        self.store = SchemaStore(schema)
+        self.table_names = self.store.table_names
+        self._source_tables: dict[str, set[int]] = {}
+        table_id = 0
+        for source_name, source_data in schema.get("sources", {}).items():
+            n_tables = len(source_data.get("tables", {}))
+            tables = self._source_tables.setdefault(source_name.lower(), set())
+            tables.update(range(table_id, table_id + n_tables))
+            table_id += n_tables
+
+    @cached_property
+    def _tables(self) -> _TrigramIndex:
+        return _TrigramIndex([name.lower() for name in self.table_names])
+
+    @cached_property
+    def _columns(self) -> _TrigramIndex:
+        return _TrigramIndex([name.lower() for name in self.store.column_names])
+
+    @cached_property
+    def _column_tables(self) -> array:
+        """Table id of each column."""
+        starts = self.store.column_starts
+        tables = array("L")
+        for table_id in range(len(self.table_names)):
+            tables.extend([table_id] * (starts[table_id + 1] - starts[table_id]))
+        return tables
+
+    @cached_property
+    def table_ids(self) -> dict[str, int]:
+        """Lowercase "source.table" -> table id."""
+        return {name.lower(): i for i, name in enumerate(self.table_names)}
+
+    @cached_property
+    def table_column_names(self) -> list[frozenset[str]]:
+        """Each table's lowercase column names."""
+        names = self.store.column_names
+        return [
+            frozenset(names[i].lower() for i in self.store.columns(table_id))
+            for table_id in range(len(self.table_names))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.table_names)
+
+    def filter(
+        self,
+        source: Optional[str] = None,
+        table_pattern: Optional[str] = None,
+        column_pattern: Optional[str] = None,
+    ) -> list[tuple[int, Optional[list[int]]]]:
+        """Find tables (and optionally columns) matching the given filters.
+
+        Args:
+            source: Only include tables from this source (case-insensitive)
+            table_pattern: Pattern matched against "source.table"
+            column_pattern: Pattern matched against column names; tables without
+                a matching column are excluded
+
+        Returns:
+            (table id, matching column offsets or None for all columns) in schema order
+        """
+        table_ids: Optional[set[int]] = None
+        if table_pattern:
+            table_ids = set(self._tables.match(table_pattern))
+        if source:
+            by_source = self._source_tables.get(source.lower(), set())
+            table_ids = by_source if table_ids is None else table_ids & by_source
+
+        if not column_pattern:
+            ids = range(len(self.table_names)) if table_ids is None else sorted(table_ids)
+            return [(i, None) for i in ids]
+
+        matched: dict[int, list[int]] = {}
+        starts = self.store.column_starts
+        for column_id in self._columns.match(column_pattern):
+            table_id = self._column_tables[column_id]
+            if table_ids is None or table_id in table_ids:
+                matched.setdefault(table_id, []).append(column_id - starts[table_id])
+        return sorted(matched.items())
+
+    def to_json(self, matches: list[tuple[int, Optional[list[int]]]]) -> list[dict]:
+        """Filter results as plain table dicts in the get_metadata JSON shape."""
+        return self.store.tables_json(matches)
@@ -0,0 +1,149 @@
+"""Compact columnar storage for normalized schemas.
+
+A schema with 100k+ columns is held as a few flat arrays instead of one dict
+per column: column names are interned strings in a single list, column types
+are small integer codes into a table of distinct type names, and each table
+is a slice of the column arrays given by an offset array. Tool responses are
+built from the arrays as plain dicts in the ``get_metadata`` JSON shape,
+without creating a pydantic model per table and column.
+
+EvidenceClient keeps each table's columns as a ColumnList, two tuples of
+interned strings that read as column dicts, so the schema it caches between
+refreshes holds no per-column objects either.
+"""
+
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, Iterator, Optional, Union
+
+
+class ColumnList(Sequence):
+    """A table's columns, stored as name and type tuples and read as column dicts.
+
+    Items are {"name": ..., "type": ...} dicts built on access, so a
+    ColumnList can stand in for the columns list of a normalized schema.
+    It compares equal to a list of the same dicts.
+    """
+
+    __slots__ = ("names", "types")
+
+    def __init__(self, names: Iterable[str] = (), types: Iterable[str] = ()):
+        """Create a column list.
+
+        Args:
+            names: Column names
+            types: Column types, one per name
+        """
+        intern = sys.intern
+        self.names = tuple(intern(name) for name in names)
+        self.types = tuple(intern(type_name) for type_name in types)
+
+    @classmethod
+    def from_dicts(cls, columns: Iterable[dict]) -> "ColumnList":
+        """Create a column list from {"name", "type"} dicts."""
+        columns = list(columns)
+        return cls(
+            (col.get("name", "") for col in columns),
+            (col.get("type", "unknown") for col in columns),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[dict, list[dict]]:
+        if isinstance(i, slice):
+            return [{"name": n, "type": t} for n, t in zip(self.names[i], self.types[i])]
+        return {"name": self.names[i], "type": self.types[i]}
+
+    def __iter__(self) -> Iterator[dict]:
+        return ({"name": n, "type": t} for n, t in zip(self.names, self.types))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnList):
+            return self.names == other.names and self.types == other.types
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ColumnList({list(self)!r})"
+
+
+class SchemaStore:
+    """Columnar copy of a normalized {"sources": ...} schema, in schema order."""
+
+    def __init__(self, schema: dict):
+        """Build the store.
+
+        Args:
+            schema: Normalized schema as returned by EvidenceClient.get_schema_metadata
+        """
+        self.table_names: list[str] = []
+        self.column_names: list[str] = []
+        # Columns of table i are [column_starts[i], column_starts[i + 1])
+        self.column_starts = array("L", [0])
+        self.column_types = array("H")
+        self.type_names: list[str] = []
+        type_codes: dict[str, int] = {}
+        intern = sys.intern
+
+        for source_name, source_data in schema.get("sources", {}).items():
+            for table_name, table_data in source_data.get("tables", {}).items():
+                self.table_names.append(f"{source_name}.{table_name}")
+                columns = table_data.get("columns", [])
+                if isinstance(columns, ColumnList):
+                    names, types = columns.names, columns.types
+                else:
+                    names = [intern(col.get("name", "")) for col in columns]
+                    types = [col.get("type", "unknown") for col in columns]
+                for type_name in types:
+                    code = type_codes.get(type_name)
+                    if code is None:
+                        code = type_codes[type_name] = len(self.type_names)
+                        self.type_names.append(type_name)
+                    self.column_types.append(code)
+                self.column_names.extend(names)
+                self.column_starts.append(len(self.column_names))
+
+    def __len__(self) -> int:
+        return len(self.table_names)
+
+    @property
+    def column_count(self) -> int:
+        """Number of columns over all tables."""
+        return len(self.column_names)
+
+    def columns(self, table_id: int) -> range:
+        """Column ids of a table."""
+        return range(self.column_starts[table_id], self.column_starts[table_id + 1])
+
+    def table_json(self, table_id: int, offsets: Optional[Iterable[int]] = None) -> dict:
+        """A table in the tool's JSON shape.
+
+        Args:
+            table_id: Table position in schema order
+            offsets: Positions of the columns to include (all if None)
+        """
+        start = self.column_starts[table_id]
+        ids = self.columns(table_id) if offsets is None else (start + i for i in offsets)
+        names, types, type_names = self.column_names, self.column_types, self.type_names
+        return {
+            "name": self.table_names[table_id],
+            "columns": [{"name": names[i], "type": type_names[types[i]]} for i in ids],
+        }
+
+    def tables_json(
+        self, matches: Optional[Iterable[tuple[int, Optional[list[int]]]]] = None
+    ) -> list[dict]:
+        """Tables in the tool's JSON shape.
+
+        Args:
+            matches: (table id, column offsets or None for all) pairs, as
+                returned by SchemaIndex.filter; every table if None
+        """
+        if matches is None:
+            return [self.table_json(table_id) for table_id in range(len(self.table_names))]
+        return [self.table_json(table_id, offsets) for table_id, offsets in matches]
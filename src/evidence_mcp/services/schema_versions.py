@@ -0,0 +1,163 @@
+"""Versioned snapshots of the normalized schema, for change feeds.
+
+Each snapshot maps table names to a content hash of their columns. A new
+version is recorded only when some table's hash changes, so polling an
+unchanged schema keeps the version stable. Diffs between versions compare
+hashes first and only look at the columns of tables whose hash differs.
+
+A version number is itself a hash of the table hashes. Every worker process
+serving the same project, and a restarted server, gives the same schema the
+same version; a version seen by another worker can be diffed here as long as
+this process also recorded that schema.
+"""
+
+import hashlib
+from typing import NamedTuple, Optional
+
+
+class SchemaSnapshot(NamedTuple):
+    """The schema at one version: table name -> (columns hash, columns)."""
+
+    version: int
+    tables: dict[str, tuple[str, list[dict]]]
+
+
+class TableDiff(NamedTuple):
+    """How a table's columns changed between two versions."""
+
+    name: str
+    added_columns: list[dict]
+    removed_columns: list[str]
+    changed_types: list[tuple[str, str, str]]  # (column, old type, new type)
+    reordered: bool
+
+
+class SchemaChanges(NamedTuple):
+    """Tables added, removed or altered since a version."""
+
+    version: int
+    added: list[tuple[str, list[dict]]]  # (table, columns)
+    removed: list[str]
+    altered: list[TableDiff]
+
+
+def table_hash(columns: list[dict]) -> str:
+    """Content hash of a table's columns (names, types and order)."""
+    digest = hashlib.blake2b(digest_size=8)
+    for column in columns:
+        digest.update(f"{column.get('name', '')}\t{column.get('type', '')}\n".encode())
+    return digest.hexdigest()
+
+
+def schema_version(tables: dict[str, tuple[str, list[dict]]]) -> int:
+    """Version number of a snapshot: a hash of its table names and hashes.
+
+    The number stays below 2**53, so JSON clients read it back exactly.
+    """
+    digest = hashlib.blake2b(digest_size=6)
+    for name in sorted(tables):
+        digest.update(f"{name}\t{tables[name][0]}\n".encode())
+    return int.from_bytes(digest.digest(), "big")
+
+
+def diff_columns(name: str, old: list[dict], new: list[dict]) -> TableDiff:
+    """Compare the columns of one table at two versions."""
+    old_types = {column.get("name", ""): column.get("type", "") for column in old}
+    new_types = {column.get("name", ""): column.get("type", "") for column in new}
+    added = [column for column in new if column.get("name", "") not in old_types]
+    removed = [column_name for column_name in old_types if column_name not in new_types]
+    changed = [
+        (column_name, old_types[column_name], new_type)
+        for column_name, new_type in new_types.items()
+        if column_name in old_types and old_types[column_name] != new_type
+    ]
+    kept_old = [column_name for column_name in old_types if column_name in new_types]
+    kept_new = [column_name for column_name in new_types if column_name in old_types]
+    return TableDiff(name, added, removed, changed, kept_old != kept_new)
+
+
+class SchemaVersions:
+    """Keeps the most recent schema snapshots and diffs them on request.
+
+    Versions are derived from content (see schema_version), not counted, so
+    they are not ordered: compare them for equality only.
+    """
+
+    def __init__(self, max_snapshots: int = 16):
+        """Initialize the snapshot history.
+
+        Args:
+            max_snapshots: Snapshots kept; changes since older versions need a full refresh
+        """
+        self.max_snapshots = max(2, max_snapshots)
+        self.snapshots: list[SchemaSnapshot] = []
+        # Last recorded schema dict, so re-recording a cached result is O(1)
+        self._last_schema: Optional[dict] = None
+
+    @property
+    def current(self) -> Optional[int]:
+        """Latest version, or None before the first snapshot."""
+        return self.snapshots[-1].version if self.snapshots else None
+
+    def record(self, schema: dict) -> int:
+        """Record a normalized schema ({"sources": ...}) if it changed.
+
+        Tables whose columns list is the same object as in the latest snapshot
+        reuse its hash, so unchanged tables of a cached schema are not rehashed.
+
+        Returns:
+            The schema's version
+        """
+        if schema is self._last_schema and self.snapshots:
+            return self.snapshots[-1].version
+        previous = self.snapshots[-1].tables if self.snapshots else {}
+
+        tables: dict[str, tuple[str, list[dict]]] = {}
+        for source_name, source in schema.get("sources", {}).items():
+            for table_name, table in source.get("tables", {}).items():
+                name = f"{source_name}.{table_name}"
+                columns = table.get("columns", [])
+                entry = previous.get(name)
+                if entry is None or entry[1] is not columns:
+                    entry = (table_hash(columns), columns)
+                tables[name] = entry
+
+        self._last_schema = schema
+        if self.snapshots and self._same_hashes(previous, tables):
+            # Keep the existing column lists, so the identity shortcut keeps working
+            self.snapshots[-1] = SchemaSnapshot(self.snapshots[-1].version, tables)
+            return self.snapshots[-1].version
+
+        version = schema_version(tables)
+        self.snapshots.append(SchemaSnapshot(version, tables))
+        del self.snapshots[: -self.max_snapshots]
+        return version
+
+    @staticmethod
+    def _same_hashes(old: dict, new: dict) -> bool:
+        return len(old) == len(new) and all(
+            name in old and old[name][0] == entry[0] for name, entry in new.items()
+        )
+
+    def changes(self, since: int) -> Optional[SchemaChanges]:
+        """Tables that changed between a version and the latest one.
+
+        Args:
+            since: A version returned earlier
+
+        Returns:
+            The changes, or None if the version is unknown or no longer kept
+        """
+        base = next((s for s in self.snapshots if s.version == since), None)
+        if base is None:
+            return None
+        latest = self.snapshots[-1]
+        old, new = base.tables, latest.tables
+        added = [(name, entry[1]) for name, entry in new.items() if name not in old]
+        removed = [name for name in old if name not in new]
+        altered = [
+            diff_columns(name, old[name][1], entry[1])
+            for name, entry in new.items()
+            if name in old and old[name][0] != entry[0]
+        ]
+        return SchemaChanges(latest.version, added, removed, altered)
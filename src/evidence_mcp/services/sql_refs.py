@@ -0,0 +1,219 @@
+"""Table and column references in the SQL blocks of Evidence pages."""
+
+import difflib
+import re
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Optional
+
+from .page_lexer import Token
+from .schema_index import SchemaIndex
+
+_IDENT = r'(?:[A-Za-z_][\w$]*|"(?:[^"]|"")*")'
+_SQL_TOKEN_RE = re.compile(
+    rf"""
+    (?P<skip>--[^\n]*|/\*.*?(?:\*/|\Z)|'(?:[^']|'')*'?)
+    | (?P<template>\$\{{[^}}]*\}})
+    | (?P<name>{_IDENT}(?:[ \t]*\.[ \t]*{_IDENT})*)
+    | (?P<punct>[(),;])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Keywords that end a FROM list or cannot be a table alias
+_CLAUSE_KEYWORDS = frozenset(
+    """
+    where group order having limit offset qualify window union intersect except
+    on using join inner left right full outer cross natural lateral positional asof
+    select from as with pivot unpivot sample tablesample returning
+    """.split()
+)
+_JOIN_KEYWORDS = frozenset({"from", "join"})
+# Keywords that make a parenthesis a subquery rather than a function call
+_QUERY_KEYWORDS = frozenset({"select", "with", "from"})
+# Keywords between a FROM item and the next JOIN
+_JOIN_MODIFIERS = frozenset(
+    {"inner", "left", "right", "full", "outer", "cross", "natural", "lateral", "positional", "asof"}
+)
+# Alias target of derived tables, CTEs and other queries, whose columns are not checked
+_DERIVED = ""
+
+
+class SqlReference(NamedTuple):
+    """A table (and optionally column) referenced by a SQL block."""
+
+    query: str
+    table: str
+    column: Optional[str]
+    line: int
+
+
+def _split_name(text: str) -> list[str]:
+    """Split a dotted identifier into lowercase parts, unquoting quoted parts."""
+    parts = []
+    for part in re.findall(_IDENT, text):
+        if part.startswith('"'):
+            part = part[1:-1].replace('""', '"')
+        parts.append(part.lower())
+    return parts
+
+
+@lru_cache(maxsize=1024)
+def _extract(sql: str) -> tuple[tuple[str, Optional[str], int], ...]:
+    """Extract (source.table, column or None, line offset) references from SQL.
+
+    Only two-part source.table names in FROM/JOIN position are treated as
+    tables; single names may be CTEs or other queries. Columns are only
+    recognized when qualified by a table name or alias, and not for names
+    that stand for a CTE, another query or a parenthesized subquery, even
+    when one shares its name with a table. FROM inside a function call's
+    parentheses, as in EXTRACT(year FROM t.day), is not a FROM clause.
+    """
+    refs: list[tuple[str, Optional[str], int]] = []
+    # alias or bare table name -> "source.table", or _DERIVED
+    aliases: dict[str, str] = {}
+    columns: list[tuple[list[str], int]] = []
+    line = 0
+    pos = 0
+    expect_table = False  # the next name is a FROM/JOIN item
+    in_from = False  # a comma introduces another FROM item
+    last_table: Optional[str] = None  # a table whose alias may follow
+    # One entry per open parenthesis: True for a subquery, False for anything
+    # else (function calls, expression groups) until SELECT/WITH/FROM opens it
+    parens: list[bool] = []
+    # Whether each open parenthesis is a FROM/JOIN item, so an alias may follow it
+    paren_items: list[bool] = []
+    paren_start = False  # the previous token was "("
+
+    for match in _SQL_TOKEN_RE.finditer(sql):
+        line += sql.count("\n", pos, match.start())
+        pos = match.start()
+        group = match.lastgroup
+        if group == "skip":
+            continue
+        text = match.group()
+
+        opened, paren_start = paren_start, text == "("
+        if group != "name":
+            # Punctuation, or a ${query} reference standing in for a table
+            last_table = _DERIVED if group == "template" and expect_table else None
+            if text == "(":
+                parens.append(False)
+                paren_items.append(expect_table)
+            elif text == ")" and parens:
+                subquery, item = parens.pop(), paren_items.pop()
+                if subquery and item:
+                    # A derived table: its alias hides any table of that name
+                    last_table = _DERIVED
+            elif text == ";":
+                in_from = False
+                parens.clear()
+                paren_items.clear()
+            expect_table = text == "," and in_from
+            continue
+
+        parts = _split_name(text)
+        keyword = parts[0] if len(parts) == 1 and not text.startswith('"') else None
+        if opened and keyword in _QUERY_KEYWORDS:
+            parens[-1] = True
+        in_call = bool(parens) and not parens[-1]
+        if in_call and keyword in _CLAUSE_KEYWORDS:
+            # FROM, AS etc. inside a function call: part of its arguments
+            last_table = None
+        elif keyword in _JOIN_KEYWORDS:
+            expect_table, in_from, last_table = True, True, None
+        elif keyword == "as" and last_table is not None:
+            pass
+        elif keyword in _CLAUSE_KEYWORDS:
+            expect_table, last_table = False, None
+            in_from = keyword in _JOIN_MODIFIERS
+        elif expect_table:
+            expect_table = False
+            if len(parts) == 2:
+                table = ".".join(parts)
+                refs.append((table, None, line))
+                aliases.setdefault(parts[1], table)
+                last_table = table
+            elif len(parts) == 1:
+                aliases[parts[0]] = last_table = _DERIVED
+        elif last_table is not None and len(parts) == 1:
+            aliases[parts[0]] = last_table
+            last_table = None
+        else:
+            last_table = None
+            if len(parts) >= 2:
+                columns.append((parts, line))
+
+    tables = {table for table, _, _ in refs}
+    for parts, column_line in columns:
+        if len(parts) >= 3 and ".".join(parts[:2]) in tables:
+            refs.append((".".join(parts[:2]), parts[2], column_line))
+        elif aliases.get(parts[0], _DERIVED) != _DERIVED:
+            refs.append((aliases[parts[0]], parts[1], column_line))
+    refs.sort(key=lambda ref: ref[2])
+    return tuple(refs)
+
+
+def extract_sql_references(content: str, tokens: Iterable[Token]) -> list[SqlReference]:
+    """Extract table and column references from a page's SQL blocks.
+
+    Args:
+        content: Page content
+        tokens: Tokens produced by lex_page for the content
+
+    Returns:
+        References with 1-based page line numbers
+    """
+    refs = []
+    for token in tokens:
+        if token.kind != "fence" or token.name != "sql":
+            continue
+        body_start = content.find("\n", token.start, token.end) + 1
+        if not body_start:
+            continue
+        if token.end_line is None:
+            body_end = token.end
+        else:
+            body_end = content.rfind("\n", body_start, token.end) + 1 or body_start
+        query = token.info.split()[0] if token.info else ""
+        first_line = token.line + 1
+        for table, column, offset in _extract(content[body_start:body_end]):
+            refs.append(SqlReference(query, table, column, first_line + offset))
+    return refs
+
+
+def check_sql_references(refs: Iterable[SqlReference], index: SchemaIndex) -> list[str]:
+    """Check references against a schema index.
+
+    Args:
+        refs: References from extract_sql_references
+        index: Name index over the project schema
+
+    Returns:
+        Warnings for unknown tables and columns
+    """
+    if not len(index):
+        return []
+    warnings = []
+    for ref in refs:
+        where = f" in query '{ref.query}'" if ref.query else ""
+        table_id = index.table_ids.get(ref.table)
+        if table_id is None:
+            if ref.column is None:
+                warnings.append(
+                    f"Unknown table '{ref.table}'{where} (line {ref.line})"
+                    + _suggest(ref.table, index.table_ids)
+                )
+            continue
+        if ref.column is not None:
+            names = index.table_column_names[table_id]
+            if ref.column not in names:
+                warnings.append(
+                    f"Unknown column '{ref.column}' in table '{ref.table}'{where} "
+                    f"(line {ref.line})" + _suggest(ref.column, names)
+                )
+    return warnings
+
+
+def _suggest(name: str, candidates: Iterable[str]) -> str:
+    matches = difflib.get_close_matches(name, list(candidates), n=1)
+    return f". Did you mean '{matches[0]}'?" if matches else ""
@@ -0,0 +1,340 @@
+"""Sample rows and column profiles from rendered Parquet files, via embedded DuckDB.
+
+DuckDB is an optional dependency (``pip install 'evidence-mcp[duckdb]'``) and
+is imported on first use. Queries run on a small pool of connections to one
+in-memory database, only ever as generated SELECT statements over
+``read_parquet``. Results are cached by file signature and query shape, so
+repeated calls on an unchanged file do not query at all.
+"""
+
+import contextlib
+import datetime
+import decimal
+import math
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+INSTALL_HINT = "DuckDB is not installed. Install it with: pip install 'evidence-mcp[duckdb]'"
+MAX_SAMPLE_ROWS = 100
+MAX_TOP_K = 100
+MAX_BINS = 50
+# Longest string value returned; longer values are cut
+MAX_TEXT = 200
+
+_NUMERIC_TYPES = (
+    "TINYINT",
+    "SMALLINT",
+    "INTEGER",
+    "BIGINT",
+    "HUGEINT",
+    "UTINYINT",
+    "USMALLINT",
+    "UINTEGER",
+    "UBIGINT",
+    "UHUGEINT",
+    "FLOAT",
+    "DOUBLE",
+    "DECIMAL",
+)
+
+
+def _duckdb():
+    try:
+        import duckdb
+    except ImportError as e:
+        raise RuntimeError(INSTALL_HINT) from e
+    return duckdb
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+def _json_value(value: Any) -> Any:
+    """Make a DuckDB result value JSON-friendly."""
+    if value is None or isinstance(value, (bool, int)):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else str(value)
+    if isinstance(value, str):
+        return value if len(value) <= MAX_TEXT else value[:MAX_TEXT] + "..."
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return _json_value("0x" + bytes(value).hex())
+    if isinstance(value, (list, tuple)):
+        return [_json_value(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _json_value(item) for key, item in value.items()}
+    if isinstance(value, (uuid.UUID, datetime.timedelta)):
+        return str(value)
+    return _json_value(str(value))
+
+
+class ConnectionPool:
+    """Connections to one in-memory DuckDB database, handed out one per thread.
+
+    The database is created on first use. Up to ``size`` connections are
+    opened; further callers wait for one to be returned.
+    """
+
+    def __init__(self, size: int = 4, threads: Optional[int] = None):
+        """Initialize the pool.
+
+        Args:
+            size: Maximum number of connections
+            threads: DuckDB worker threads per query (DuckDB's default if None)
+        """
+        self.size = max(1, size)
+        self.threads = threads
+        self._db = None
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                if self._db is None:
+                    config = {"threads": self.threads} if self.threads else {}
+                    self._db = _duckdb().connect(":memory:", config=config)
+                self._opened += 1
+                return self._db.cursor()
+        return self._idle.get()
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection for the duration of a with block."""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close idle connections and the database."""
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            self._opened = 0
+
+
+class TableDataReader:
+    """Samples rows and profiles columns of Parquet files, with a result cache."""
+
+    def __init__(self, pool_size: int = 4, threads: Optional[int] = None, cache_size: int = 256):
+        """Initialize the reader.
+
+        Args:
+            pool_size: Maximum concurrent DuckDB connections
+            threads: DuckDB worker threads per query (DuckDB's default if None)
+            cache_size: Query results kept in memory (0 disables caching)
+        """
+        self.pool = ConnectionPool(pool_size, threads)
+        self.cache_size = cache_size
+        # (path, file signature, query kind, arguments) -> result
+        self._cache: OrderedDict[tuple, Any] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_info(self) -> dict:
+        """Return statistics for the result cache."""
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self._cache)}
+
+    def close(self) -> None:
+        """Close the connection pool."""
+        self.pool.close()
+
+    def _cached(self, path: Path, shape: tuple, compute) -> Any:
+        """Return a cached result for a query shape on the current file, or compute it."""
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size) + shape
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return self._cache[key]
+            self.cache_misses += 1
+        result = compute()
+        if self.cache_size > 0:
+            with self._cache_lock:
+                self._cache[key] = result
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _query(self, path: Path, sql: str) -> tuple[list[str], list[tuple]]:
+        """Run a query, returning column names and rows."""
+        duckdb = _duckdb()
+        with self.pool.connection() as conn:
+            try:
+                cursor = conn.execute(sql)
+                rows = cursor.fetchall()
+            except duckdb.Error as e:
+                raise ValueError(f"Could not read {path.name}: {e}") from e
+            return [column[0] for column in cursor.description], rows
+
+    @staticmethod
+    def _source(path: Path) -> str:
+        return f"read_parquet({_quote_literal(str(path))})"
+
+    def columns(self, path: Path) -> list[tuple[str, str]]:
+        """(name, DuckDB type) of each column of a Parquet file."""
+        return self._cached(
+            path,
+            ("describe",),
+            lambda: [
+                (row[0], row[1])
+                for row in self._query(path, f"DESCRIBE SELECT * FROM {self._source(path)}")[1]
+            ],
+        )
+
+    def _column_types(self, path: Path, names: list[str]) -> dict[str, str]:
+        """Types of the requested columns.
+
+        Raises:
+            ValueError: If a column does not exist
+        """
+        types = dict(self.columns(path))
+        missing = [name for name in names if name not in types]
+        if missing:
+            raise ValueError(
+                f"Unknown column(s) {', '.join(missing)}. Available: {', '.join(types)}"
+            )
+        return {name: types[name] for name in names}
+
+    def sample(self, path: Path, n: int = 10, columns: Optional[list[str]] = None) -> dict:
+        """Sample rows of a Parquet file.
+
+        The sample is a reservoir sample with a fixed seed, so it is spread over
+        the whole file rather than taken from its first rows.
+
+        Args:
+            path: Parquet file
+            n: Rows to return (at most MAX_SAMPLE_ROWS)
+            columns: Columns to include (all if None)
+
+        Returns:
+            Dict with 'columns', 'rows' (lists of values) and 'total_rows'
+
+        Raises:
+            ValueError: If a column does not exist or the file cannot be read
+            RuntimeError: If DuckDB is not installed
+        """
+        n = min(max(n, 1), MAX_SAMPLE_ROWS)
+        names = list(columns) if columns else [name for name, _ in self.columns(path)]
+        self._column_types(path, names)
+
+        def compute() -> dict:
+            select = ", ".join(_quote_identifier(name) for name in names)
+            source = self._source(path)
+            _, rows = self._query(
+                path,
+                f"SELECT {select} FROM {source} USING SAMPLE reservoir({n} ROWS) REPEATABLE (42)",
+            )
+            _, count = self._query(path, f"SELECT count(*) FROM {source}")
+            return {
+                "columns": names,
+                "rows": [[_json_value(value) for value in row] for row in rows],
+                "total_rows": count[0][0],
+            }
+
+        return self._cached(path, ("sample", n, tuple(names)), compute)
+
+    def profile(self, path: Path, column: str, top_k: int = 10, bins: int = 10) -> dict:
+        """Profile a column: counts, range, most frequent values and a histogram.
+
+        Args:
+            path: Parquet file
+            column: Column name
+            top_k: Most frequent values to return (at most MAX_TOP_K)
+            bins: Equal-width histogram bins for numeric columns (at most MAX_BINS)
+
+        Returns:
+            Dict with 'type', 'row_count', 'null_count', 'distinct_count', 'min',
+            'max', 'top_values' and 'histogram' (None for non-numeric columns)
+
+        Raises:
+            ValueError: If the column does not exist or the file cannot be read
+            RuntimeError: If DuckDB is not installed
+        """
+        top_k = min(max(top_k, 1), MAX_TOP_K)
+        bins = min(max(bins, 1), MAX_BINS)
+        column_type = self._column_types(path, [column])[column]
+
+        def compute() -> dict:
+            col = _quote_identifier(column)
+            source = self._source(path)
+            _, summary = self._query(
+                path,
+                f"SELECT count(*), count({col}), count(DISTINCT {col}), min({col}), max({col}) "
+                f"FROM {source}",
+            )
+            row_count, non_null, distinct, low, high = summary[0]
+            _, top = self._query(
+                path,
+                f"SELECT {col}, count(*) AS n FROM {source} WHERE {col} IS NOT NULL "
+                f"GROUP BY {col} ORDER BY n DESC, {col} LIMIT {top_k}",
+            )
+            histogram = None
+            if column_type.split("(")[0] in _NUMERIC_TYPES and non_null:
+                histogram = self._histogram(path, col, float(low), float(high), bins)
+            return {
+                "type": column_type,
+                "row_count": row_count,
+                "null_count": row_count - non_null,
+                "distinct_count": distinct,
+                "min": _json_value(low),
+                "max": _json_value(high),
+                "top_values": [{"value": _json_value(value), "count": n} for value, n in top],
+                "histogram": histogram,
+            }
+
+        return self._cached(path, ("profile", column, top_k, bins), compute)
+
+    def _histogram(
+        self, path: Path, col: str, low: float, high: float, bins: int
+    ) -> Optional[list[dict]]:
+        """Equal-width histogram of a numeric column's finite values."""
+        if not (math.isfinite(low) and math.isfinite(high)):
+            return None
+        if low == high:
+            bins = 1
+        width = (high - low) / bins or 1.0
+        value = f"CAST({col} AS DOUBLE)"
+        _, rows = self._query(
+            path,
+            f"SELECT least(CAST(floor(({value} - {low!r}) / {width!r}) AS BIGINT), {bins - 1}) "
+            f"AS bin, count(*) FROM {self._source(path)} "
+            f"WHERE {col} IS NOT NULL AND isfinite({value}) GROUP BY bin ORDER BY bin",
+        )
+        counts = dict(rows)
+        return [
+            {
+                "lower": low + i * width,
+                "upper": high if i == bins - 1 else low + (i + 1) * width,
+                "count": counts.get(i, 0),
+            }
+            for i in range(bins)
+        ]
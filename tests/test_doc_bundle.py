@@ -0,0 +1,97 @@
+"""Tests for the precompiled documentation bundle."""
+
+import pytest
+
+from evidence_mcp.services.doc_bundle import DocBundle, build_bundle
+from evidence_mcp.services.doc_registry import DocRegistry
+
+
+LINE_CHART = "components/charts/line-chart/index.md"
+
+
+@pytest.fixture
+def temp_docs(tmp_path):
+    """Create a minimal docs tree with one component page."""
+    docs = tmp_path / "docs"
+    (docs / "components" / "charts" / "line-chart").mkdir(parents=True)
+    (docs / LINE_CHART).write_text(
+        """---
+title: LineChart
+related: [BarChart]
+---
+
+# LineChart
+
+Display data over time.
+"""
+    )
+    return docs
+
+
+@pytest.fixture
+def bundle_path(temp_docs, tmp_path):
+    """Build a bundle for the temporary docs tree."""
+    path = tmp_path / "docs.bundle"
+    build_bundle(temp_docs, path, [LINE_CHART, "missing/index.md"])
+    return path
+
+
+def test_build_and_read_bundle(bundle_path):
+    """Test that bundled documents round-trip through the bundle file."""
+    bundle = DocBundle(bundle_path)
+
+    assert len(bundle) == 1
+    doc = bundle.get(LINE_CHART)
+    assert doc.title == "LineChart"
+    assert doc.related == ["BarChart"]
+    assert "Display data over time" in doc.content
+    assert bundle.get("missing/index.md") is None
+    bundle.close()
+
+
+def test_open_invalid_bundle(tmp_path):
+    """Test that invalid or missing bundles are ignored."""
+    bad = tmp_path / "bad.bundle"
+    bad.write_bytes(b"not a bundle at all")
+
+    assert DocBundle.open(bad) is None
+    assert DocBundle.open(tmp_path / "missing.bundle") is None
+
+
+def test_registry_serves_from_bundle(temp_docs, bundle_path):
+    """Test that the registry uses the bundle when the source file is gone."""
+    (temp_docs / LINE_CHART).unlink()
+    registry = DocRegistry(docs_path=temp_docs, bundle_path=bundle_path)
+
+    result = registry.lookup("charts", "LineChart")
+
+    assert result.title == "LineChart"
+    assert "Display data over time" in result.content
+
+
+def test_registry_falls_back_when_bundle_stale(temp_docs, bundle_path):
+    """Test that a changed source file wins over the stale bundle entry."""
+    (temp_docs / LINE_CHART).write_text("---\ntitle: LineChart (edited)\n---\n\nNew body.\n")
+    registry = DocRegistry(docs_path=temp_docs, bundle_path=bundle_path)
+
+    result = registry.lookup("charts", "LineChart")
+
+    assert result.title == "LineChart (edited)"
+    assert "New body" in result.content
+
+
+def test_bundle_is_current(temp_docs, bundle_path):
+    """Test that added, changed and removed files make the bundle out of date."""
+    bundle = DocBundle(bundle_path)
+    paths = [LINE_CHART, "missing/index.md"]
+
+    assert bundle.is_current(temp_docs, paths)
+    (temp_docs / "missing").mkdir()
+    (temp_docs / "missing" / "index.md").write_text("# Added\n")
+    assert not bundle.is_current(temp_docs, paths)
+    assert bundle.is_current(temp_docs, [LINE_CHART])
+    (temp_docs / LINE_CHART).write_text("# Changed\n")
+    assert not bundle.is_current(temp_docs, [LINE_CHART])
+    (temp_docs / LINE_CHART).unlink()
+    assert not bundle.is_current(temp_docs, [LINE_CHART])
+    bundle.close()
@@ -2,20 +2,19 @@
 
 import pytest
 
-from evidence_mcp.services.doc_registry import DocRegistry
+from evidence_mcp.services.doc_registry import DocRegistry, build_heading_index
 
 
 @pytest.fixture
 def temp_docs(tmp_path):
     """Create temporary documentation files for testing."""
-    # Create directory structure
-    charts_dir = tmp_path / "charts"
-    charts_dir.mkdir()
-    components_dir = tmp_path / "components"
-    components_dir.mkdir()
+    # Create directory structure matching DOC_REGISTRY paths
+    charts_dir = tmp_path / "components" / "charts"
+    line_chart_dir = charts_dir / "line-chart"
+    line_chart_dir.mkdir(parents=True)
 
     # Create index file
-    (charts_dir / "_index.md").write_text(
+    (charts_dir / "index.md").write_text(
         """---
 title: Charts Overview
 category: charts
@@ -28,7 +27,7 @@ Overview of chart components.
     )
 
     # Create component file
-    (charts_dir / "LineChart.md").write_text(
+    (line_chart_dir / "index.md").write_text(
         """---
 title: LineChart
 category: charts
@@ -108,3 +107,122 @@ def test_related_docs_extraction(registry):
     assert isinstance(result.related_docs, list)
     assert "BarChart" in result.related_docs
     assert "AreaChart" in result.related_docs
+
+
+def test_lookup_cache_hit(registry):
+    """Test that repeated lookups are served from the parsed-document cache."""
+    first = registry.lookup("charts", "LineChart")
+    second = registry.lookup("charts", "LineChart")
+
+    assert second is first
+    assert registry.cache_info()["hits"] == 1
+    assert registry.cache_info()["misses"] == 1
+
+
+def test_lookup_cache_invalidated_on_change(registry, temp_docs):
+    """Test that editing a doc file invalidates its cached entry."""
+    registry.lookup("charts", "LineChart")
+
+    doc_file = temp_docs / "components" / "charts" / "line-chart" / "index.md"
+    doc_file.write_text("---\ntitle: LineChart v2\n---\n\nUpdated content with a new size.\n")
+
+    result = registry.lookup("charts", "LineChart")
+
+    assert result.title == "LineChart v2"
+    assert registry.cache_info()["misses"] == 2
+
+
+def test_lookup_cache_lru_eviction(temp_docs):
+    """Test that the least recently used entry is evicted when the cache is full."""
+    registry = DocRegistry(docs_path=temp_docs, cache_size=1)
+
+    registry.lookup("charts", "LineChart")
+    registry.lookup("charts", None)
+    registry.lookup("charts", "LineChart")
+
+    info = registry.cache_info()
+    assert info["size"] == 1
+    assert info["hits"] == 0
+    assert info["misses"] == 3
+
+
+def test_is_cached(registry, temp_docs):
+    """Test that only whole pages held in the cache count as cached."""
+    page = registry.lookup("charts", "LineChart")
+
+    assert registry.is_cached(page)
+    assert not registry.is_cached(registry.lookup("charts", "LineChart", max_chars=10))
+    assert not registry.is_cached(registry.lookup("maps", "USMap"))
+    assert not DocRegistry(docs_path=temp_docs, cache_size=0).is_cached(page)
+
+
+def test_lookup_section(registry):
+    """Test returning a single section of a page."""
+    result = registry.lookup("charts", "LineChart", section="basic usage")
+
+    assert result.section == "Basic Usage"
+    assert result.content.startswith("## Basic Usage")
+    assert "Display data over time" not in result.content
+    assert result.sections == ["LineChart", "Basic Usage"]
+
+
+def test_lookup_missing_section(registry):
+    """Test that an unknown section lists the available ones."""
+    result = registry.lookup("charts", "LineChart", section="Props")
+
+    assert result.section is None
+    assert "No section 'Props'" in result.content
+    assert "Basic Usage" in result.content
+
+
+def test_lookup_paginated(registry):
+    """Test reading a page in chunks with max_chars and cursor."""
+    full = registry.lookup("charts", "LineChart").content
+
+    chunks = []
+    cursor = None
+    while True:
+        page = registry.lookup("charts", "LineChart", max_chars=40, cursor=cursor)
+        assert page.total_chars == len(full)
+        chunks.append(page.content)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == full
+
+
+def test_build_heading_index_ignores_code_fences():
+    """Test that headings inside code fences are not indexed."""
+    content = "# Title\n\n```markdown\n# Not a heading\n```\n\n## Props\n\ntext\n\n# Next\n"
+
+    sections = build_heading_index(content)
+
+    assert [s.title for s in sections] == ["Title", "Props", "Next"]
+    props = sections[1]
+    assert content[props.start : props.end] == "## Props\n\ntext\n\n"
+
+
+def test_invalidate_changed_files(registry, temp_docs):
+    """Test that invalidate drops only cache entries affected by changed files."""
+    registry.lookup("charts", "LineChart")
+    registry.lookup("data", "DataTable")  # not found, never cached
+
+    changed = registry.invalidate([temp_docs / "components" / "charts" / "line-chart" / "index.md"])
+
+    assert changed == {"components/charts/line-chart/index.md"}
+    assert registry.cache_info()["size"] == 0
+
+
+def test_invalidate_added_file_affects_fallback(registry, temp_docs):
+    """Test that adding a component file invalidates lookups that fell back to the index."""
+    fallback = registry.lookup("charts", "BarChart")
+    assert "Overview" in fallback.title
+
+    bar_chart = temp_docs / "components" / "charts" / "bar-chart" / "index.md"
+    bar_chart.parent.mkdir()
+    bar_chart.write_text("---\ntitle: BarChart\n---\n\n# BarChart\n")
+    registry.invalidate([bar_chart])
+
+    assert registry.lookup("charts", "BarChart").title == "BarChart"
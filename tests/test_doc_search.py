@@ -0,0 +1,78 @@
+"""Tests for the documentation search index."""
+
+from evidence_mcp.services.doc_search import DocSearchIndex, tokenize
+
+
+def build_index():
+    """Build a small index with a few representative documents."""
+    return DocSearchIndex.build(
+        [
+            (
+                "charts",
+                "LineChart",
+                "line-chart",
+                "Line Chart",
+                "# Line Chart\n\nDisplay a series over time.\n\n"
+                "## Series colors\n\nUse seriesColors.",
+            ),
+            (
+                "charts",
+                "BarChart",
+                "bar-chart",
+                "Bar Chart",
+                "# Bar Chart\n\nCompare categories with bars.",
+            ),
+            (
+                "inputs",
+                "Dropdown",
+                "dropdown",
+                "Dropdown",
+                "# Dropdown\n\nSelect a value from a list. Set a defaultValue.",
+            ),
+        ]
+    )
+
+
+def test_tokenize_splits_camel_case():
+    """Test that CamelCase words are indexed whole and by part."""
+    terms = tokenize("LineChart data")
+
+    assert "linechart" in terms
+    assert "line" in terms
+    assert "chart" in terms
+    assert "data" in terms
+
+
+def test_search_ranks_title_matches_first():
+    """Test that documents matching in the title outrank body-only matches."""
+    results = build_index().search("line chart")
+
+    assert results[0].component == "LineChart"
+    assert results[0].score > results[1].score
+
+
+def test_search_returns_snippet():
+    """Test that results include a snippet around the matched term."""
+    results = build_index().search("defaultValue")
+
+    assert len(results) == 1
+    assert results[0].component == "Dropdown"
+    assert "defaultValue" in results[0].snippet
+
+
+def test_search_limit_and_no_match():
+    """Test result limiting and queries without matches."""
+    index = build_index()
+
+    assert len(index.search("chart", limit=1)) == 1
+    assert index.search("nonexistentterm") == []
+    assert index.search("") == []
+
+
+def test_remove_document():
+    """Test that removed documents no longer match."""
+    index = build_index()
+    index.remove_document("dropdown")
+
+    assert index.search("dropdown") == []
+    assert len(index) == 2
@@ -0,0 +1,132 @@
+"""Tests for the debug_code error rule engine."""
+
+import json
+
+import pytest
+
+from evidence_mcp.services.error_rules import (
+    DEFAULT_RULES_PATH,
+    ErrorRuleEngine,
+    load_rules,
+    parse_rules,
+)
+
+
+def _rule(name, keywords, **extra):
+    return {
+        "name": name,
+        "keywords": keywords,
+        "category": "test",
+        "description": f"{name} description",
+        "fix": f"{name} fix",
+        **extra,
+    }
+
+
+class TestErrorRuleEngine:
+    """Tests for ErrorRuleEngine."""
+
+    def test_all_keywords_required(self):
+        """Test that a rule applies only when every keyword starts a word of the message."""
+        engine = ErrorRuleEngine(parse_rules([_rule("query", ["undefined", "query"])]))
+
+        assert engine.classify("Undefined query 'orders'").rule.name == "query"
+        assert engine.classify("undefined variable") is None
+        assert engine.classify("queryundefined") is None
+
+    def test_keywords_match_word_prefixes(self):
+        """Test that keywords match compounds and plurals but count once per rule."""
+        engine = ErrorRuleEngine(parse_rules([_rule("props", ["required", "prop"])]))
+
+        assert engine.classify("Missing required props x,y").rule.name == "props"
+        assert engine.classify("Required properties are missing").rule.name == "props"
+        assert engine.classify("prop props properties") is None
+
+    def test_earlier_rules_win(self):
+        """Test that table order decides between rules that both apply."""
+        engine = ErrorRuleEngine(
+            parse_rules([_rule("parser", ["parser", "error"]), _rule("syntax", ["syntax"])])
+        )
+
+        assert engine.classify("Parser Error: syntax error at end").rule.name == "parser"
+        assert engine.classify("Syntax problem").rule.name == "syntax"
+
+    def test_pattern_fills_templates(self):
+        """Test that pattern groups fill the templates and a failed pattern skips the rule."""
+        rules = parse_rules(
+            [
+                _rule(
+                    "tag",
+                    ["left", "open"],
+                    pattern=r"<(?P<tag>\w+)> was left open",
+                    description="<{tag}> is never closed",
+                    fix="Close it with </{tag}> ({message}) {{#if}}",
+                ),
+                _rule("fallback", ["open"]),
+            ]
+        )
+        engine = ErrorRuleEngine(rules)
+
+        match = engine.classify("<Details> was left open")
+        assert match.description == "<Details> is never closed"
+        assert match.fix == "Close it with </Details> (<Details> was left open) {#if}"
+        assert engine.classify("the door was left open").rule.name == "fallback"
+
+    def test_invalid_rules(self):
+        """Test that malformed rules are reported with their position."""
+        with pytest.raises(ValueError, match="rule 0"):
+            parse_rules([{"name": "x", "keywords": ["a"]}])
+        with pytest.raises(ValueError, match="bad"):
+            parse_rules([_rule("ok", ["a"]), _rule("bad", ["b"], pattern="(")])
+        with pytest.raises(ValueError, match="keyword"):
+            parse_rules([_rule("empty", ["..."])])
+
+    def test_from_files_priority(self, tmp_path):
+        """Test that rules from earlier files take priority over the built-ins."""
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps([_rule("custom", ["syntax"])]))
+
+        engine = ErrorRuleEngine.from_files(path, None, DEFAULT_RULES_PATH)
+
+        assert engine.classify("syntax error").rule.name == "custom"
+        assert len(engine.rules) == len(load_rules(DEFAULT_RULES_PATH)) + 1
+
+    @pytest.mark.parametrize(
+        "message, name",
+        [
+            ("Catalog Error: Table with name orders does not exist!", "duckdb-table-not-found"),
+            (
+                'Binder Error: Referenced column "amt" not found in FROM clause!',
+                "duckdb-column-not-found",
+            ),
+            ("Conversion Error: Could not convert string 'x' to INT32", "duckdb-conversion"),
+            ("Cannot read properties of undefined (reading 'value')", "property-of-undefined"),
+            ("<Details> was left open", "tag-left-open"),
+            ("Error in Bar Chart: Dataset is required", "dataset-required"),
+            ("Unknown error", None),
+        ],
+    )
+    def test_builtin_rules(self, message, name):
+        """Test classification of common messages with the built-in table."""
+        match = ErrorRuleEngine.from_files(DEFAULT_RULES_PATH).classify(message)
+
+        assert (match.rule.name if match else None) == name
+
+    @pytest.mark.parametrize(
+        "message, name",
+        [
+            ("SyntaxError: bad", "syntax-error"),
+            ("Syntax error near 'from'", "syntax-error"),
+            ("Unexpected token", "unexpected-token"),
+            ("Missing required props x,y", "required-prop"),
+            ("Missing required prop: data", "required-prop"),
+            ("Query orders is undefined", "query-undefined"),
+            ("queries undefined", "query-undefined"),
+        ],
+    )
+    def test_baseline_messages(self, message, name):
+        """Test that messages the earlier substring checks caught still get their rule."""
+        match = ErrorRuleEngine.from_files(DEFAULT_RULES_PATH).classify(message)
+
+        assert match is not None
+        assert match.rule.name == name
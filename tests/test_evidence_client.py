@@ -0,0 +1,284 @@
+"""Tests for the EvidenceClient service."""
+
+import json
+
+import httpx
+import pytest
+
+from evidence_mcp.services.evidence_client import EvidenceClient
+from evidence_mcp.services.schema_store import ColumnList
+
+
+def write_table(data_dir, source, table, columns):
+    """Write a per-table schema file in Evidence's layout."""
+    table_dir = data_dir / source / table
+    table_dir.mkdir(parents=True, exist_ok=True)
+    (table_dir / f"{table}.schema.json").write_text(
+        json.dumps([{"name": name, "evidenceType": kind} for name, kind in columns])
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create an Evidence project with two tables in one source."""
+    data_dir = tmp_path / "static" / "data"
+    data_dir.mkdir(parents=True)
+    (data_dir / "manifest.json").write_text(
+        json.dumps(
+            {
+                "renderedFiles": {
+                    "mydb": [
+                        "static/data/mydb/orders/orders.parquet",
+                        "static/data/mydb/customers/customers.parquet",
+                    ]
+                }
+            }
+        )
+    )
+    write_table(data_dir, "mydb", "orders", [("id", "number"), ("placed_at", "date")])
+    write_table(data_dir, "mydb", "customers", [("id", "number"), ("name", "string")])
+    return tmp_path
+
+
+@pytest.fixture
+def client(project):
+    """Create an EvidenceClient pointed at the test project."""
+    return EvidenceClient(evidence_project_path=project)
+
+
+def test_parse_schema_files(client, project):
+    """Test parsing Evidence's manifest and per-table schema files."""
+    result = client._parse_evidence_schema_files(project / "static" / "data")
+
+    tables = result["sources"]["mydb"]["tables"]
+    assert set(tables) == {"orders", "customers"}
+    assert isinstance(tables["orders"]["columns"], ColumnList)
+    assert tables["orders"]["columns"] == [
+        {"name": "id", "type": "Float64"},
+        {"name": "placed_at", "type": "Date"},
+    ]
+
+
+def test_schema_cache_hit(client, project):
+    """Test that unchanged files are not re-parsed."""
+    data_dir = project / "static" / "data"
+    first = client._parse_evidence_schema_files(data_dir)
+    second = client._parse_evidence_schema_files(data_dir)
+
+    assert second is first
+    info = client.schema_cache_info()
+    assert info["hits"] == 1
+    assert info["files_parsed"] == 2
+
+
+def test_schema_cache_reparses_only_changed_files(client, project):
+    """Test that only a changed schema file is re-parsed."""
+    data_dir = project / "static" / "data"
+    client._parse_evidence_schema_files(data_dir)
+
+    columns = [("id", "number"), ("total", "number"), ("x", "string")]
+    write_table(data_dir, "mydb", "orders", columns)
+    result = client._parse_evidence_schema_files(data_dir)
+
+    assert [c["name"] for c in result["sources"]["mydb"]["tables"]["orders"]["columns"]] == [
+        "id",
+        "total",
+        "x",
+    ]
+    assert client.schema_cache_info()["files_parsed"] == 3
+
+
+def test_invalidate_schema(client, project):
+    """Test that invalidating a schema file forces it to be re-parsed."""
+    data_dir = project / "static" / "data"
+    client._parse_evidence_schema_files(data_dir)
+
+    client.invalidate_schema([data_dir / "mydb" / "orders" / "orders.schema.json"])
+    client._parse_evidence_schema_files(data_dir)
+
+    info = client.schema_cache_info()
+    assert info["files_parsed"] == 3
+    assert info["misses"] == 2
+
+
+def test_missing_manifest(tmp_path):
+    """Test that a data directory without a manifest yields no sources."""
+    client = EvidenceClient(evidence_project_path=tmp_path)
+
+    assert client._parse_evidence_schema_files(tmp_path) == {"sources": {}}
+
+
+def test_parallel_parse_matches_serial(tmp_path, monkeypatch):
+    """Test that batched parsing on the worker pool preserves table order and content."""
+    monkeypatch.setattr("evidence_mcp.services.evidence_client.SCHEMA_PARSE_BATCH_SIZE", 2)
+    data_dir = tmp_path / "static" / "data"
+    data_dir.mkdir(parents=True)
+    tables = [f"t{i}" for i in range(7)]
+    (data_dir / "manifest.json").write_text(
+        json.dumps({"renderedFiles": {"db": [f"static/data/db/{t}/{t}.parquet" for t in tables]}})
+    )
+    for i, table in enumerate(tables):
+        write_table(data_dir, "db", table, [(f"c{i}", "string")])
+
+    parallel = EvidenceClient(evidence_project_path=tmp_path, parse_workers=4)
+    serial = EvidenceClient(evidence_project_path=tmp_path, parse_workers=1)
+
+    result = parallel._parse_evidence_schema_files(data_dir)
+    assert result == serial._parse_evidence_schema_files(data_dir)
+    assert list(result["sources"]["db"]["tables"]) == tables
+    assert result["sources"]["db"]["tables"]["t3"]["columns"] == [{"name": "c3", "type": "String"}]
+
+
+async def test_get_schema_metadata_from_files(project):
+    """Test the async metadata load falls back to the project files."""
+    client = EvidenceClient(base_url="http://127.0.0.1:9", evidence_project_path=project)
+    try:
+        result = await client.get_schema_metadata()
+    finally:
+        await client.close()
+
+    assert set(result["sources"]["mydb"]["tables"]) == {"orders", "customers"}
+
+
+async def test_get_schema_index_reused(client):
+    """Test that the schema index is rebuilt only when the schema changes."""
+    client.base_url = "http://127.0.0.1:9"
+    try:
+        first = await client.get_schema_index()
+        second = await client.get_schema_index()
+    finally:
+        await client.close()
+
+    assert second is first
+    assert len(first) == 2
+
+
+async def test_schema_changes_after_rerun(client, project):
+    """Test that a rewritten schema file yields a new version and a column diff."""
+    data_dir = project / "static" / "data"
+    try:
+        await client.get_schema_metadata()
+        since = client.schema_version
+        await client.get_schema_metadata()
+        assert client.schema_version == since
+
+        write_table(data_dir, "mydb", "orders", [("id", "string"), ("total", "number")])
+        changes = await client.get_schema_changes(since)
+    finally:
+        await client.close()
+
+    assert changes.version not in (None, since)
+    assert (changes.added, changes.removed) == ([], [])
+    (orders,) = changes.altered
+    assert orders.name == "mydb.orders"
+    assert orders.added_columns == [{"name": "total", "type": "Float64"}]
+    assert orders.removed_columns == ["placed_at"]
+    assert orders.changed_types == [("id", "Float64", "String")]
+
+
+def mock_dev_server(client, handler):
+    """Route the client's HTTP requests to a handler instead of the network."""
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def test_schema_from_dev_server(tmp_path):
+    """Test loading schema through the dev server manifest when no project files exist."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/_evidence/manifest.json":
+            return httpx.Response(
+                200, json={"renderedFiles": {"db": ["static/data/db/orders/orders.parquet"]}}
+            )
+        if request.url.path == "/data/db/orders/orders.schema.json":
+            return httpx.Response(200, json=[{"name": "id", "evidenceType": "number"}])
+        return httpx.Response(404)
+
+    client = EvidenceClient(evidence_project_path=tmp_path)
+    mock_dev_server(client, handler)
+
+    result = await client.get_schema_metadata()
+    await client.get_schema_metadata()
+
+    assert result["sources"]["db"]["tables"]["orders"]["columns"] == [
+        {"name": "id", "type": "Float64"}
+    ]
+    # The manifest is reused within its TTL and schema files are not refetched
+    assert requests == ["/_evidence/manifest.json", "/data/db/orders/orders.schema.json"]
+    assert client.health.status == "up"
+
+
+async def test_partial_dev_server_schema_is_not_kept(tmp_path):
+    """Test that tables whose schema file failed are refetched on the next call."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/_evidence/manifest.json":
+            return httpx.Response(
+                200, json={"renderedFiles": {"db": ["static/data/db/orders/orders.parquet"]}}
+            )
+        if requests.count(request.url.path) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=[{"name": "id", "evidenceType": "number"}])
+
+    client = EvidenceClient(evidence_project_path=tmp_path)
+    mock_dev_server(client, handler)
+
+    first = await client.get_schema_metadata()
+    second = await client.get_schema_metadata()
+
+    assert first["sources"]["db"]["tables"]["orders"]["columns"] == []
+    assert second["sources"]["db"]["tables"]["orders"]["columns"] == [
+        {"name": "id", "type": "Float64"}
+    ]
+    assert requests.count("/data/db/orders/orders.schema.json") == 2
+
+
+async def test_dev_server_down_is_not_retried(tmp_path):
+    """Test that connection failures open the breaker and skip further requests."""
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.url.path)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = EvidenceClient(evidence_project_path=tmp_path)
+    mock_dev_server(client, handler)
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            await client.get_schema_metadata()
+    assert await client.check_health() is False
+
+    assert len(attempts) == 1
+    assert client.health.status == "down"
+
+
+async def test_table_stats_from_parquet_footers(client, project):
+    """Test reading table statistics from footers, cached until the file changes."""
+    from .test_parquet_footer import write_parquet
+
+    path = write_parquet(project / "static" / "data" / "mydb" / "orders" / "orders.parquet")
+
+    stats = await client.get_table_stats(["mydb.orders", "mydb.customers", "other.table"])
+    await client.get_table_stats(["mydb.orders"])
+
+    assert list(stats) == ["mydb.orders"]
+    assert stats["mydb.orders"].num_rows == 150
+    assert client.footer_cache_info() == {"hits": 1, "misses": 1, "size": 1}
+
+    write_parquet(path, body=b"\x00" * 128)
+    stats = await client.get_table_stats(["mydb.orders"])
+
+    assert stats["mydb.orders"].file_size == path.stat().st_size
+    assert client.footer_cache_info()["misses"] == 2
+
+
+async def test_table_stats_unreadable_file(client, project):
+    """Test that a corrupt Parquet file is skipped."""
+    path = project / "static" / "data" / "mydb" / "orders" / "orders.parquet"
+    path.write_bytes(b"not parquet")
+
+    assert await client.get_table_stats(["mydb.orders"]) == {}
@@ -0,0 +1,47 @@
+"""Tests for the polling file watcher."""
+
+from evidence_mcp.services.file_watcher import FileWatcher
+
+
+async def test_poll_reports_changes(tmp_path):
+    """Test that added, modified and removed files are reported after the baseline."""
+    kept = tmp_path / "kept.md"
+    removed = tmp_path / "removed.md"
+    kept.write_text("original")
+    removed.write_text("soon gone")
+    (tmp_path / "ignored.txt").write_text("not watched")
+
+    calls = []
+    watcher = FileWatcher()
+    watcher.watch(tmp_path, calls.append, suffixes=(".md",))
+
+    await watcher.poll()
+    assert calls == []
+
+    kept.write_text("modified content")
+    removed.unlink()
+    added = tmp_path / "sub" / "added.md"
+    added.parent.mkdir()
+    added.write_text("new")
+    (tmp_path / "ignored.txt").write_text("still not watched")
+
+    await watcher.poll()
+    assert calls == [{kept, removed, added}]
+
+    await watcher.poll()
+    assert len(calls) == 1
+
+
+async def test_poll_missing_root(tmp_path):
+    """Test that a root that does not exist yet is picked up once created."""
+    root = tmp_path / "later"
+    calls = []
+    watcher = FileWatcher()
+    watcher.watch(root, calls.append)
+
+    await watcher.poll()
+    root.mkdir()
+    (root / "file.json").write_text("{}")
+    await watcher.poll()
+
+    assert calls == [{root / "file.json"}]
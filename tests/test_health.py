@@ -0,0 +1,63 @@
+"""Tests for the dev server health breaker."""
+
+from evidence_mcp.services.health import DevServerHealth
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_starts_half_open_with_single_probe():
+    """Test that the first request is a probe and concurrent ones are held back."""
+    health = DevServerHealth(clock=FakeClock())
+
+    assert health.status == "half-open"
+    assert health.allow_request() is True
+    assert health.allow_request() is False
+
+    health.record_success()
+    assert health.status == "up"
+    assert health.allow_request() is True
+
+
+def test_exponential_backoff():
+    """Test that consecutive failures double the backoff up to the maximum."""
+    clock = FakeClock()
+    health = DevServerHealth(base_backoff=1.0, max_backoff=3.0, clock=clock)
+
+    health.allow_request()
+    health.record_failure()
+    assert health.status == "down"
+    assert health.allow_request() is False
+
+    clock.now += 1.0
+    assert health.status == "half-open"
+    assert health.allow_request() is True
+    health.record_failure()
+
+    clock.now += 1.5
+    assert health.status == "down"
+    clock.now += 0.5
+    assert health.allow_request() is True
+    health.record_failure()
+    assert health.info()["retry_in"] == 3.0
+
+
+def test_recovery_resets_failures():
+    """Test that a successful probe closes the breaker."""
+    clock = FakeClock()
+    health = DevServerHealth(clock=clock)
+
+    health.allow_request()
+    health.record_failure()
+    clock.now += 1.0
+    health.allow_request()
+    health.record_success()
+
+    assert health.info() == {"status": "up", "consecutive_failures": 0, "retry_in": 0.0}
@@ -0,0 +1,84 @@
+"""Tests for one-pass tool response encoding."""
+
+import pydantic_core
+import pytest
+
+from evidence_mcp.models.schemas import DocResponse, SearchResponse, SearchResult
+from evidence_mcp.services import json_encoding
+from evidence_mcp.services.json_encoding import EncodedJson, ResponseEncoder, to_json
+
+
+def fastmcp_text(result):
+    """The text FastMCP produces for a dumped tool result."""
+    if hasattr(result, "model_dump"):
+        result = result.model_dump()
+    return pydantic_core.to_json(result, fallback=str, indent=2).decode()
+
+
+RESPONSE = SearchResponse(
+    query="line chart",
+    results=[
+        SearchResult(
+            doc_type="charts",
+            component="LineChart",
+            title="Line Chart – Évidence",
+            score=1.5,
+            snippet="x and y",
+        )
+    ],
+)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "result",
+    [
+        RESPONSE,
+        {"error": "Page not found: x", "queries": [], "issues": []},
+        {"tables": [{"name": "db.t", "columns": [{"name": "ä", "type": "Date"}]}], "n": None},
+        {"nested": RESPONSE, "big": 2**70, "path": pytest},
+    ],
+)
+def test_matches_fastmcp_output(result, use_orjson, monkeypatch):
+    """Test that encoding gives the same text as dumping and FastMCP's conversion."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_encoding, "_orjson", None)
+
+    assert to_json(result) == fastmcp_text(result)
+
+
+class TestResponseEncoder:
+    """Tests for the encoded-response cache."""
+
+    def test_cached_by_owner_and_key(self):
+        """Test that results are built once per owner object and key."""
+        encoder = ResponseEncoder()
+        owner = DocResponse(doc_type="charts", title="Charts", content="...")
+        builds = []
+
+        def build():
+            builds.append(1)
+            return owner
+
+        first = encoder.cached(owner, build, 1)
+        assert encoder.cached(owner, build, 1) is first
+        encoder.cached(owner, build, 2)
+        encoder.cached(owner.model_copy(), build, 1)
+
+        assert isinstance(first, EncodedJson)
+        assert first == to_json(owner)
+        assert len(builds) == 3
+        assert encoder.cache_info() == {"hits": 1, "misses": 3, "size": 3}
+
+    def test_eviction(self):
+        """Test that the least recently used results are dropped."""
+        encoder = ResponseEncoder(cache_size=1)
+        a, b = object(), object()
+
+        encoder.cached(a, dict)
+        encoder.cached(b, dict)
+        encoder.cached(a, dict)
+
+        assert encoder.cache_info() == {"hits": 0, "misses": 3, "size": 1}
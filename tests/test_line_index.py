@@ -0,0 +1,89 @@
+"""Tests for the page line and block index."""
+
+from evidence_mcp.services.line_index import Block, LineIndex, get_line_index
+
+PAGE = """# Sales
+
+```sql orders
+select amount
+from sales.orders
+```
+
+<Grid cols=2>
+  <DataTable data={orders}>
+    <Column id=amount/>
+  </DataTable>
+</Grid>
+
+```python
+print("hi")
+"""
+
+
+class TestLineIndex:
+    """Tests for LineIndex."""
+
+    def test_lines_and_offsets(self):
+        """Test converting between offsets and line/column positions."""
+        index = LineIndex(PAGE)
+
+        assert index.line_count == PAGE.count("\n") + 1
+        for offset in (0, 5, PAGE.index("select"), len(PAGE) - 1):
+            line = index.line_of(offset)
+            assert line == PAGE.count("\n", 0, offset) + 1
+            assert index.offset(line, offset - index.line_starts[line - 1] + 1) == offset
+        assert index.line_text(4) == "select amount"
+        assert index.offset(9) == PAGE.index("<DataTable")
+
+    def test_blocks(self):
+        """Test block spans of fences and matched component tags."""
+        index = LineIndex(PAGE)
+
+        assert [(b.kind, b.name, b.line, b.end_line) for b in index.blocks] == [
+            ("sql", "orders", 3, 6),
+            ("component", "Grid", 8, 12),
+            ("component", "DataTable", 9, 11),
+            ("component", "Column", 10, 10),
+            ("code", "python", 14, 14),
+        ]
+
+    def test_enclosing_block(self):
+        """Test that the innermost block around an offset is found."""
+        index = LineIndex(PAGE)
+
+        def name(offset):
+            block = index.enclosing_block(offset)
+            return block.name if isinstance(block, Block) else None
+
+        assert name(PAGE.index("amount")) == "orders"
+        assert name(PAGE.index("<Column")) == "Column"
+        assert name(PAGE.index("</DataTable")) == "DataTable"
+        assert name(PAGE.index("</Grid") - 1) == "Grid"
+        assert name(0) is None
+        assert name(PAGE.index("print")) == "python"
+
+    def test_locate(self):
+        """Test the source line, context and block of an error position."""
+        location = LineIndex(PAGE).locate(4, 8, context=1)
+
+        assert location.source_line == "select amount"
+        assert location.context == (
+            "  3 | ```sql orders\n> 4 | select amount\n    |        ^\n  5 | from sales.orders"
+        )
+        assert location.block.name == "orders"
+        assert LineIndex(PAGE).locate(100) is None
+
+    def test_locate_clamps_column(self):
+        """Test that an out-of-range column puts the caret at the line's ends."""
+        index = LineIndex(PAGE)
+
+        past_end = index.locate(4, 10**9, context=0)
+        assert past_end.column == len("select amount") + 1
+        assert past_end.context == "> 4 | select amount\n    | " + " " * 13 + "^"
+        before_start = index.locate(4, -5, context=0)
+        assert before_start.column == 1
+        assert before_start.context == "> 4 | select amount\n    | ^"
+
+    def test_cached_by_content(self):
+        """Test that the same content reuses its index."""
+        assert get_line_index(PAGE) is get_line_index(PAGE[:-1] + "\n")
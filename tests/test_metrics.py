@@ -0,0 +1,134 @@
+"""Tests for tool and cache metrics."""
+
+from functools import lru_cache
+
+from evidence_mcp.services.metrics import Histogram, Metrics, lru_cache_info
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_observe_and_quantile(self):
+        """Test bucketing on upper bounds and interpolated quantiles."""
+        hist = Histogram((1.0, 2.0, 4.0))
+        for value in (0.5, 1.0, 1.5, 3.0, 10.0):
+            hist.observe(value)
+
+        assert hist.counts == [2, 1, 1, 1]
+        assert hist.count == 5
+        assert hist.total == 16.0
+        assert hist.quantile(0.4) == 1.0
+        assert hist.quantile(0.5) == 1.5
+        assert hist.quantile(1.0) == 4.0
+        assert Histogram((1.0,)).quantile(0.5) is None
+
+
+class TestMetrics:
+    """Tests for Metrics."""
+
+    def test_record(self):
+        """Test per-tool counters."""
+        metrics = Metrics()
+        metrics.record("read_docs", 0.002, 1000)
+        metrics.record("read_docs", 0.02, 3000, error=True)
+
+        stats = metrics.tools["read_docs"]
+        assert (stats.calls, stats.errors) == (2, 1)
+        assert stats.size.total == 4000
+        assert stats.latency.count == 2
+
+    def test_cache_stats(self):
+        """Test that registered caches are read on demand and absent caches skipped."""
+
+        @lru_cache(maxsize=4)
+        def square(x):
+            return x * x
+
+        metrics = Metrics()
+        metrics.register_cache("square", lru_cache_info(square))
+        metrics.register_cache("missing", lambda: None)
+        assert metrics.cache_stats()["square"]["hit_ratio"] is None
+
+        square(2)
+        square(2)
+        square(3)
+        assert metrics.cache_stats() == {
+            "square": {"hits": 1, "misses": 2, "hit_ratio": 1 / 3, "size": 2}
+        }
+
+    def test_render_prometheus(self):
+        """Test the Prometheus text format, with cumulative buckets."""
+        clock = iter([10.0, 12.5])
+        metrics = Metrics(clock=lambda: next(clock))
+        metrics.record('edit "page"', 0.003, 100)
+        metrics.register_cache("docs", lambda: {"hits": 3, "misses": 1, "size": 2})
+
+        text = metrics.render_prometheus()
+        lines = text.splitlines()
+
+        assert "evidence_mcp_uptime_seconds 2.500" in lines
+        assert 'evidence_mcp_tool_calls_total{tool="edit \\"page\\""} 1' in lines
+        assert "# TYPE evidence_mcp_tool_latency_seconds histogram" in lines
+        assert (
+            'evidence_mcp_tool_latency_seconds_bucket{tool="edit \\"page\\"",le="0.0025"} 0'
+            in lines
+        )
+        assert (
+            'evidence_mcp_tool_latency_seconds_bucket{tool="edit \\"page\\"",le="0.005"} 1' in lines
+        )
+        assert (
+            'evidence_mcp_tool_latency_seconds_bucket{tool="edit \\"page\\"",le="+Inf"} 1' in lines
+        )
+        assert 'evidence_mcp_tool_response_bytes_sum{tool="edit \\"page\\""} 100' in lines
+        assert 'evidence_mcp_cache_hit_ratio{cache="docs"} 0.75' in lines
+        assert text.endswith("\n")
+
+
+class TestSharedMetrics:
+    """Tests for metrics shared between worker processes."""
+
+    def test_render_sums_workers(self, tmp_path, caplog):
+        """Test that the export sums the tool and cache counters of every worker."""
+        worker_a, worker_b = Metrics(), Metrics()
+        worker_a.register_cache("docs", lambda: {"hits": 3, "misses": 1, "size": 2})
+        worker_b.register_cache("docs", lambda: {"hits": 1, "misses": 3, "size": None})
+        worker_a.share(tmp_path, "worker-1.json")
+        worker_b.share(tmp_path, "worker-2.json")
+        (tmp_path / "worker-3.json").write_text("{")
+
+        worker_a.record("read_docs", 0.002, 100)
+        worker_b.record("read_docs", 0.02, 100, error=True)
+        worker_b.record("get_metadata", 0.2, 100)
+        lines = worker_a.render_prometheus().splitlines()
+
+        assert 'evidence_mcp_tool_calls_total{tool="read_docs"} 2' in lines
+        assert 'evidence_mcp_tool_errors_total{tool="read_docs"} 1' in lines
+        assert 'evidence_mcp_tool_calls_total{tool="get_metadata"} 1' in lines
+        assert 'evidence_mcp_tool_latency_seconds_count{tool="read_docs"} 2' in lines
+        assert 'evidence_mcp_tool_response_bytes_sum{tool="read_docs"} 200' in lines
+        assert 'evidence_mcp_cache_hits_total{cache="docs"} 4' in lines
+        assert 'evidence_mcp_cache_hit_ratio{cache="docs"} 0.5' in lines
+        assert 'evidence_mcp_cache_entries{cache="docs"} 2' in lines
+        assert "worker-3.json" in caplog.text
+
+    async def test_snapshot_writes_are_throttled(self, tmp_path):
+        """Test that calls within the flush interval are written once, after it."""
+        now = [100.0]
+        metrics = Metrics(clock=lambda: now[0])
+        metrics.share(tmp_path, "worker-1.json", interval=60.0)
+        reader = Metrics()
+        reader.share(tmp_path, "worker-2.json")
+
+        metrics.record("read_docs", 0.002, 100)
+        metrics.record("read_docs", 0.002, 100)
+
+        assert "read_docs" not in reader.render_prometheus()
+        metrics.flush()
+        assert 'evidence_mcp_tool_calls_total{tool="read_docs"} 2' in (
+            reader.render_prometheus().splitlines()
+        )
+        now[0] += 60.0
+        metrics.record("read_docs", 0.002, 100)
+        assert 'evidence_mcp_tool_calls_total{tool="read_docs"} 3' in (
+            reader.render_prometheus().splitlines()
+        )
@@ -0,0 +1,81 @@
+"""Tests for the Evidence page lexer."""
+
+from evidence_mcp.services.page_lexer import Prop, lex_page
+
+
+def test_lex_fences_and_tags():
+    """Test token kinds, names and positions."""
+    content = """# Title
+
+```sql orders
+select * from t where a < b
+```
+
+<Grid cols=2>
+  <LineChart data={orders} x=date/>
+</Grid>
+"""
+    tokens = list(lex_page(content))
+
+    assert [(t.kind, t.name, t.line) for t in tokens] == [
+        ("fence", "sql", 3),
+        ("open", "Grid", 7),
+        ("self_close", "LineChart", 8),
+        ("close", "Grid", 9),
+    ]
+    fence = tokens[0]
+    assert fence.info == "orders"
+    assert fence.end_line == 5
+    assert tokens[2].column == 3
+    assert tokens[2].props == (Prop("data", "{orders}"), Prop("x", "date"))
+
+
+def test_lex_multiline_tag():
+    """Test that tags spanning lines report their start and end lines."""
+    content = '<LineChart\n    data={q}\n    title="a / b"\n/>\n<Value/>\n'
+
+    tokens = list(lex_page(content))
+
+    assert [(t.kind, t.line, t.end_line) for t in tokens] == [
+        ("self_close", 1, 4),
+        ("self_close", 5, 5),
+    ]
+    assert tokens[0].props[1] == Prop("title", '"a / b"')
+
+
+def test_lex_unclosed_fence_and_table_row():
+    """Test markdown table rows and a fence that is never closed."""
+    content = "| a | b |\n\n```sql\nselect 1\n"
+
+    tokens = list(lex_page(content))
+
+    assert [(t.kind, t.line) for t in tokens] == [("table_row", 1), ("fence", 3)]
+    assert tokens[1].end_line is None
+    assert tokens[1].info == ""
+
+
+def test_lex_props_with_braces_and_flags():
+    """Test props with nested braces, quoted values and bare flags."""
+    content = '<DataTable data={rows.filter(r => r.x > 1)} search rows=10 title="A">'
+
+    (token,) = lex_page(content)
+
+    assert token.kind == "open"
+    assert token.props == (
+        Prop("data", "{rows.filter(r => r.x > 1)}"),
+        Prop("search", None),
+        Prop("rows", "10"),
+        Prop("title", '"A"'),
+    )
+
+
+def test_lex_line_start_rules():
+    """Test that rows and fences only count at line start, without hiding tags."""
+    content = "a | <Value data={q}/> | b |\n| x | y |\nsee ```js``` and <Tab/>\n"
+    tokens = list(lex_page(content))
+
+    assert [(t.kind, t.name, t.line) for t in tokens] == [
+        ("self_close", "Value", 1),
+        ("table_row", "", 2),
+        ("self_close", "Tab", 3),
+    ]
@@ -0,0 +1,119 @@
+"""Tests for incremental page validation."""
+
+import random
+
+from evidence_mcp.services.page_validator import PageValidationCache, ValidatedPage
+
+PAGE = """# Sales
+
+```sql orders
+select * from sales where amount > 10
+```
+
+<Grid cols=2>
+    <LineChart
+        data={orders}
+        x=date
+    />
+    <BigValue data={orders} value=total/>
+</Grid>
+
+| a | b |
+|---|---|
+
+<Tabs>
+    <Tab label="One">
+        Text with <b>bold</b>
+    </Tab>
+</Tabs>
+"""
+
+SNIPPETS = [
+    "<Grid cols=2>\n",
+    "</Grid>\n",
+    "```sql q\n",
+    "```\n",
+    "| x | y |\n",
+    "<Value data={q}/>\n",
+    "<Tabs\n",
+    "  id=1>\n",
+    '<A label="<b>" x={a}\n',
+    "\n",
+]
+
+
+def assert_same_as_full(page: ValidatedPage, content: str) -> ValidatedPage:
+    updated = page.revalidate(content)
+    full = ValidatedPage.from_content(content)
+    assert updated.tokens == full.tokens
+    assert updated.warnings == full.warnings
+    return updated
+
+
+def test_revalidate_matches_full_validation():
+    """Test targeted edits: new tags, removed closes and fences that swallow the rest."""
+    page = ValidatedPage.from_content(PAGE)
+    edits = [
+        PAGE.replace("</Grid>\n", ""),
+        PAGE.replace("<Tabs>", "<Tabs>\n<Extra>"),
+        PAGE.replace("| a | b |\n", "```sql broken\n"),
+        PAGE.replace("x=date", "x=date\n        y=total"),
+        PAGE.replace("amount > 10", "amount > 10 and <Grid>"),
+        "<Intro>\n" + PAGE,
+        PAGE + "<Footer>\n",
+        PAGE[: len(PAGE) // 2],
+        "",
+    ]
+    for content in edits:
+        assert_same_as_full(page, content)
+
+
+def test_revalidate_random_edits():
+    """Test chains of random line edits against full validation."""
+    rng = random.Random(0)
+    page = ValidatedPage.from_content(PAGE * 5)
+    for _ in range(300):
+        lines = page.content.splitlines(keepends=True)
+        i = rng.randrange(len(lines) + 1)
+        roll = rng.random()
+        if roll < 0.4:
+            lines.insert(i, rng.choice(SNIPPETS))
+        elif roll < 0.7 and lines:
+            del lines[min(i, len(lines) - 1)]
+        elif lines:
+            k = min(i, len(lines) - 1)
+            c = rng.randrange(len(lines[k]) + 1)
+            lines[k] = lines[k][:c] + rng.choice("<>`|{}\n'\"x") + lines[k][c:]
+        page = assert_same_as_full(page, "".join(lines))
+
+
+def test_revalidate_shifts_reused_tokens():
+    """Test that tokens after an edit keep correct offsets and line numbers."""
+    page = ValidatedPage.from_content(PAGE)
+    updated = page.revalidate("<!-- new -->\n\n" + PAGE)
+
+    tabs = [t for t in updated.tokens if t.name == "Tabs"][0]
+    assert tabs.line == 20
+    assert updated.content[tabs.start : tabs.end] == "<Tabs>"
+
+
+class TestPageValidationCache:
+    """Tests for PageValidationCache."""
+
+    def test_repeat_returns_cached_warnings(self):
+        """Test that an identical page is served from the cache."""
+        cache = PageValidationCache()
+        first = cache.validate("<Grid>\n")
+        first.append("mutated")
+
+        assert cache.validate("<Grid>\n") == ["Potentially unclosed <Grid> tag (line 1)"]
+
+    def test_edits_revalidate_incrementally(self):
+        """Test that successive versions produce the same warnings as a full pass."""
+        cache = PageValidationCache(max_size=2)
+        cache.validate(PAGE)
+        content = PAGE.replace("</Tabs>\n", "")
+
+        assert cache.validate(content) == ValidatedPage.from_content(content).warnings
+        assert cache.validate(PAGE) == ValidatedPage.from_content(PAGE).warnings
+        assert len(cache._pages) == 2
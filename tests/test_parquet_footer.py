@@ -0,0 +1,275 @@
+"""Tests for the Parquet footer reader."""
+
+import struct
+
+import pytest
+
+from evidence_mcp.services.parquet_footer import (
+    BYTE_ARRAY,
+    DOUBLE,
+    INT32,
+    INT64,
+    parse_footer,
+    read_parquet_footer,
+)
+
+# Thrift compact types used by the writer below
+I32, I64, BINARY, LIST, STRUCT, TRUE = 5, 6, 8, 9, 12, 1
+
+
+def _varint(n):
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _zigzag(n):
+    return _varint((n << 1) ^ (n >> 63))
+
+
+def _value(kind, value):
+    if kind in (I32, I64):
+        return _zigzag(value)
+    if kind == BINARY:
+        value = value.encode() if isinstance(value, str) else value
+        return _varint(len(value)) + value
+    if kind == STRUCT:
+        return _struct(value)
+    item_kind, items = value
+    header = (
+        bytes([(len(items) << 4) | item_kind])
+        if len(items) < 15
+        else (bytes([0xF0 | item_kind]) + _varint(len(items)))
+    )
+    return header + b"".join(_value(item_kind, item) for item in items)
+
+
+def _struct(fields):
+    """Encode a struct from [(field id, kind, value)] in increasing field order."""
+    out = bytearray()
+    last = 0
+    for field_id, kind, value in fields:
+        if kind == TRUE and value is False:
+            kind = 2
+        delta = field_id - last
+        if 0 < delta <= 15:
+            out.append((delta << 4) | kind)
+        else:
+            out.append(kind)
+            out += _zigzag(field_id)
+        if kind not in (1, 2):
+            out += _value(kind, value)
+        last = field_id
+    out.append(0)
+    return bytes(out)
+
+
+def schema_element(name, physical=None, children=None, converted=None, logical=None):
+    """A SchemaElement struct."""
+    fields = []
+    if physical is not None:
+        fields.append((1, I32, physical))
+    fields.append((4, BINARY, name))
+    if children is not None:
+        fields.append((5, I32, children))
+    if converted is not None:
+        fields.append((6, I32, converted))
+    if logical is not None:
+        fields.append((10, STRUCT, logical))
+    return fields
+
+
+def column_chunk(path, physical, size, null_count=None, low=None, high=None):
+    """A ColumnChunk struct with its ColumnMetaData and statistics."""
+    stats = []
+    if null_count is not None:
+        stats.append((3, I64, null_count))
+    if high is not None:
+        stats.append((5, BINARY, high))
+    if low is not None:
+        stats.append((6, BINARY, low))
+    meta = [
+        (1, I32, physical),
+        (3, LIST, (BINARY, path)),
+        (7, I64, size),
+        (12, STRUCT, stats),
+    ]
+    return [(2, I64, 4), (3, STRUCT, meta)]
+
+
+def row_group(rows, chunks):
+    """A RowGroup struct."""
+    return [(1, LIST, (STRUCT, chunks)), (3, I64, rows)]
+
+
+def i32(n):
+    return struct.pack("<i", n)
+
+
+def i64(n):
+    return struct.pack("<q", n)
+
+
+def f64(x):
+    return struct.pack("<d", x)
+
+
+def make_footer(row_groups, num_rows):
+    """A FileMetaData struct for a table of id, amount, name, day and address.city."""
+    schema = [
+        schema_element("duckdb_schema", children=5),
+        schema_element("id", INT64),
+        schema_element("amount", DOUBLE),
+        schema_element("name", BYTE_ARRAY, converted=0),
+        schema_element("day", INT32, converted=6),
+        schema_element("address", children=1),
+        schema_element("city", BYTE_ARRAY, logical=[(1, STRUCT, [])]),
+    ]
+    return _struct(
+        [
+            (1, I32, 1),
+            (2, LIST, (STRUCT, schema)),
+            (3, I64, num_rows),
+            (4, LIST, (STRUCT, row_groups)),
+            (6, BINARY, "DuckDB"),
+        ]
+    )
+
+
+FOOTER = make_footer(
+    [
+        row_group(
+            100,
+            [
+                column_chunk(["id"], INT64, 400, 0, i64(1), i64(100)),
+                column_chunk(["amount"], DOUBLE, 800, 3, f64(-2.5), f64(99.0)),
+                column_chunk(["name"], BYTE_ARRAY, 300, 0, b"alice", b"mallory"),
+                column_chunk(["day"], INT32, 200, 1, i32(19723), i32(19730)),
+                column_chunk(["address", "city"], BYTE_ARRAY, 90, 5, b"Berlin", b"Oslo"),
+            ],
+        ),
+        row_group(
+            50,
+            [
+                column_chunk(["id"], INT64, 200, 0, i64(101), i64(150)),
+                column_chunk(["amount"], DOUBLE, 400, 2, f64(0.0), f64(120.25)),
+                column_chunk(["name"], BYTE_ARRAY, 150, 0, b"bob", b"zoe"),
+                column_chunk(["day"], INT32, 100, 0, i32(19700), i32(19725)),
+                column_chunk(["address", "city"], BYTE_ARRAY, 45),
+            ],
+        ),
+    ],
+    150,
+)
+
+
+def write_parquet(path, footer=FOOTER, body=b"\x00" * 64):
+    """Write a Parquet file: magic, (fake) row data, footer, footer length, magic."""
+    path.write_bytes(b"PAR1" + body + footer + struct.pack("<I", len(footer)) + b"PAR1")
+    return path
+
+
+class TestParseFooter:
+    """Tests for parse_footer."""
+
+    def test_file_level_fields(self):
+        """Test row counts, row groups and writer."""
+        footer = parse_footer(FOOTER, 1234)
+
+        assert footer.num_rows == 150
+        assert footer.row_groups == 2
+        assert footer.file_size == 1234
+        assert footer.created_by == "DuckDB"
+
+    def test_column_statistics(self):
+        """Test that statistics are combined over row groups and decoded by type."""
+        columns = {column.name: column for column in parse_footer(FOOTER).columns}
+
+        assert list(columns) == ["id", "amount", "name", "day", "address.city"]
+        assert columns["id"] == ("id", "INT64", 0, 1, 150, 600)
+        assert (columns["amount"].min, columns["amount"].max) == (-2.5, 120.25)
+        assert columns["amount"].null_count == 5
+        assert (columns["name"].min, columns["name"].max) == ("alice", "zoe")
+        assert (columns["day"].min, columns["day"].max) == ("2023-12-09", "2024-01-08")
+        assert columns["day"].physical_type == "INT32"
+
+    def test_missing_statistics(self):
+        """Test that a row group without statistics leaves null counts unknown."""
+        city = parse_footer(FOOTER).columns[-1]
+
+        assert city.null_count is None
+        assert (city.min, city.max) == ("Berlin", "Oslo")
+        assert city.compressed_size == 135
+
+    def test_empty_table(self):
+        """Test a file without row groups."""
+        footer = parse_footer(make_footer([], 0))
+
+        assert footer.num_rows == 0
+        assert footer.columns[0] == ("id", "INT64", 0, None, None, 0)
+
+    def test_logical_types(self):
+        """Test decoding of timestamp and decimal statistics."""
+        micros = [(8, STRUCT, [(1, TRUE, True), (2, STRUCT, [(2, STRUCT, [])])])]
+        schema = [
+            schema_element("root", children=2),
+            schema_element("at", INT64, logical=micros),
+            schema_element("price", INT32, converted=5) + [(7, I32, 2)],
+        ]
+        chunks = [
+            column_chunk(["at"], INT64, 10, 0, i64(1_700_000_000_000_000), i64(0)),
+            column_chunk(["price"], INT32, 10, 0, i32(-150), i32(12345)),
+        ]
+        footer = _struct(
+            [
+                (2, LIST, (STRUCT, schema)),
+                (3, I64, 2),
+                (4, LIST, (STRUCT, [row_group(2, chunks)])),
+            ]
+        )
+
+        at, price = parse_footer(footer).columns
+
+        assert (at.min, at.max) == ("2023-11-14T22:13:20", "1970-01-01T00:00:00")
+        assert (price.min, price.max) == (-1.5, 123.45)
+
+    def test_truncated_footer(self):
+        """Test that a cut-off footer raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_footer(FOOTER[: len(FOOTER) // 2])
+
+
+class TestReadParquetFooter:
+    """Tests for read_parquet_footer."""
+
+    def test_read_file(self, tmp_path):
+        """Test reading the footer of a file."""
+        path = write_parquet(tmp_path / "orders.parquet")
+
+        footer = read_parquet_footer(path)
+
+        assert footer.num_rows == 150
+        assert footer.file_size == path.stat().st_size
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b"PAR1 not a parquet file PAR2",
+            b"PAR1" + b"\x00" * 8 + struct.pack("<I", 10_000) + b"PAR1",
+            b"PAR1" + b"\x00" * 8 + struct.pack("<I", 4) + b"PARE",
+        ],
+    )
+    def test_invalid_files(self, tmp_path, content):
+        """Test that non-Parquet, truncated and encrypted files raise ValueError."""
+        path = tmp_path / "bad.parquet"
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError):
+            read_parquet_footer(path)
@@ -0,0 +1,94 @@
+"""Tests for production serving."""
+
+import os
+from pathlib import Path
+
+from starlette.testclient import TestClient
+
+from evidence_mcp import production, server
+
+
+class TestPrepareDocsBundle:
+    """Tests for prepare_docs_bundle."""
+
+    def test_builds_only_when_out_of_date(self, tmp_path, monkeypatch):
+        """Test that the bundle is built once and rebuilt after a doc changes."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "intro.md").write_text("---\ntitle: Intro\n---\n\nHello.\n")
+        monkeypatch.setattr(production, "registry_paths", lambda: ["intro.md"])
+        bundle_path = tmp_path / "docs.bundle"
+
+        assert production.prepare_docs_bundle(docs, bundle_path)
+        assert not production.prepare_docs_bundle(docs, bundle_path)
+        (docs / "intro.md").write_text("---\ntitle: Intro\n---\n\nHello again.\n")
+        assert production.prepare_docs_bundle(docs, bundle_path)
+
+    def test_unwritable_bundle(self, tmp_path, monkeypatch):
+        """Test that a bundle that cannot be written is skipped."""
+        monkeypatch.setattr(production, "registry_paths", list)
+
+        assert not production.prepare_docs_bundle(tmp_path, tmp_path / "missing" / "b.bundle")
+
+
+class TestCreateApp:
+    """Tests for create_app."""
+
+    def test_lifespan_closes_services(self, monkeypatch):
+        """Test that shutting the app down closes the services."""
+        closed = []
+
+        async def close_services():
+            closed.append(True)
+
+        monkeypatch.setattr(server, "close_services", close_services)
+        app = production.create_app()
+
+        with TestClient(app) as client:
+            assert client.get("/metrics").status_code == 200
+            assert not closed
+        assert closed == [True]
+
+
+class TestSharedMetrics:
+    """Tests for metrics with several workers."""
+
+    def test_worker_shares_metrics(self, tmp_path, monkeypatch):
+        """Test that a worker app writes its metrics to the configured directory."""
+        from evidence_mcp.services.metrics import Metrics
+
+        # A fresh server: a session manager only runs once
+        monkeypatch.setattr(server, "_mcp", None)
+        monkeypatch.setattr(server, "metrics", Metrics())
+        monkeypatch.setattr(production.settings, "metrics_dir", tmp_path)
+        (tmp_path / "worker-0.json").write_text(
+            '{"started": 0, "tools": {"read_docs": {"calls": 5, "errors": 0, '
+            '"latency": [[5], 0.0], "size": [[5], 0.0]}}, "caches": {}}'
+        )
+
+        with TestClient(production.create_app()) as client:
+            text = client.get("/metrics").text
+
+        assert 'evidence_mcp_tool_calls_total{tool="read_docs"} 5' in text.splitlines()
+        assert len(list(tmp_path.glob("worker-*.json"))) == 2
+
+    def test_serve_uses_temporary_metrics_dir(self, tmp_path, monkeypatch):
+        """Test that serving several workers shares metrics through a removed temp dir."""
+        import uvicorn
+
+        seen = {}
+
+        def run(app, **kwargs):
+            seen["dir"] = Path(os.environ["EVIDENCE_MCP_METRICS_DIR"])
+            seen["exists"] = seen["dir"].is_dir()
+
+        monkeypatch.setattr(uvicorn, "run", run)
+        monkeypatch.setattr(production, "prepare_docs_bundle", lambda *args: False)
+        monkeypatch.setattr(production.settings, "workers", 2)
+        monkeypatch.setattr(production.settings, "metrics_dir", None)
+        monkeypatch.delenv("EVIDENCE_MCP_METRICS_DIR", raising=False)
+
+        production.serve()
+
+        assert seen["exists"]
+        assert not seen["dir"].exists()
@@ -0,0 +1,101 @@
+"""Tests for project-wide page validation."""
+
+import os
+
+import pytest
+
+from evidence_mcp.services import project_validator
+from evidence_mcp.services.project_validator import ProjectValidator
+from evidence_mcp.services.schema_index import SchemaIndex
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create an Evidence project with a few pages."""
+    pages = tmp_path / "pages"
+    (pages / "sales").mkdir(parents=True)
+    (pages / "index.md").write_text("# Home\n\n<BigValue data={orders} value=total/>\n")
+    (pages / "sales" / "region.md").write_text("# Region\n\n<Grid cols=2>\n")
+    (pages / "sales" / "notes.txt").write_text("<Grid>\n")
+    return tmp_path
+
+
+def touch(path, content):
+    """Rewrite a file and move its mtime forward so the change is always visible."""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestProjectValidator:
+    """Tests for ProjectValidator."""
+
+    def test_validate_pages(self, project):
+        """Test that every markdown page is validated, keyed by relative path."""
+        validator = ProjectValidator(project, workers=1)
+
+        results = validator.validate()
+
+        assert results == {
+            "index.md": [],
+            "sales/region.md": ["Potentially unclosed <Grid> tag (line 3)"],
+        }
+
+    def test_rerun_only_validates_changed_pages(self, project):
+        """Test that unchanged pages are served from the cache."""
+        validator = ProjectValidator(project, workers=1)
+        validator.validate()
+        touch(project / "pages" / "sales" / "region.md", "<Grid cols=2>\n</Grid>\n")
+
+        results = validator.validate()
+
+        assert results["sales/region.md"] == []
+        assert validator.files_validated == 3
+
+    def test_deleted_pages_are_dropped(self, project):
+        """Test that removed pages disappear from results and the cache."""
+        validator = ProjectValidator(project, workers=1)
+        validator.validate()
+        (project / "pages" / "index.md").unlink()
+
+        assert list(validator.validate()) == ["sales/region.md"]
+        assert len(validator._cache) == 1
+
+    def test_sql_references_checked_against_schema(self, project):
+        """Test that cached pages are rechecked against the schema they are given."""
+        (project / "pages" / "orders.md").write_text(
+            "```sql q\nselect * from sales.orders\n```\n"
+        )
+        validator = ProjectValidator(project, workers=1)
+        schema = {"sources": {"finance": {"tables": {"budget": {"columns": []}}}}}
+
+        assert validator.validate()["orders.md"] == []
+        assert validator.validate(SchemaIndex(schema))["orders.md"] == [
+            "Unknown table 'sales.orders' in query 'q' (line 2)"
+        ]
+        assert validator.files_validated == 3
+
+    def test_unreadable_page(self, project):
+        """Test that undecodable pages are reported instead of failing the run."""
+        (project / "pages" / "broken.md").write_bytes(b"\xff\xfe\x00")
+        validator = ProjectValidator(project, workers=1)
+
+        warnings = validator.validate()["broken.md"]
+
+        assert len(warnings) == 1
+        assert warnings[0].startswith("Could not read page")
+
+    def test_process_pool_matches_inline(self, project, monkeypatch):
+        """Test that validating across worker processes gives the same results."""
+        pages = project / "pages"
+        for i in range(20):
+            (pages / f"page_{i:02}.md").write_text(f"<Tabs>\n<Tab label={i}>\n</Tab>\n")
+        expected = ProjectValidator(project, workers=1).validate()
+        monkeypatch.setattr(project_validator, "PARALLEL_THRESHOLD", 2)
+        monkeypatch.setattr(project_validator, "VALIDATE_BATCH_SIZE", 4)
+        validator = ProjectValidator(project, workers=2)
+
+        try:
+            assert validator.validate() == expected
+        finally:
+            validator.close()
@@ -0,0 +1,123 @@
+"""Tests for the query dependency graph."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from evidence_mcp.services.query_graph import PageQueryGraph, ProjectQueryGraph, QueryRef
+
+PAGE = """---
+title: Sales
+queries:
+  - targets: finance/targets.sql
+  - regions.sql
+---
+
+```sql orders
+select * from sales.orders
+```
+
+```sql monthly
+select * from ${orders} join ${targets} using (month)
+where region = '${inputs.region}'
+```
+
+<LineChart data={monthly} x=month y=total/>
+<DataTable data={ordrs}/>
+<BarChart data={regions}/>
+"""
+
+
+class TestPageQueryGraph:
+    """Tests for PageQueryGraph."""
+
+    def test_definitions_and_edges(self):
+        """Test definitions (including frontmatter queries), dependencies and consumers."""
+        graph = PageQueryGraph.from_content(PAGE)
+
+        assert graph.definitions == {"targets": None, "regions": None, "orders": 8, "monthly": 12}
+        assert graph.dependencies["monthly"] == ["orders", "targets"]
+        assert graph.dependents("orders") == ["monthly"]
+        assert graph.consumers("monthly") == [QueryRef("monthly", 17, "LineChart", "component")]
+
+    def test_undefined_reference_with_suggestion(self):
+        """Test that a typo is reported with the closest defined name."""
+        issues = PageQueryGraph.from_content(PAGE).issues()
+
+        assert len(issues) == 1
+        assert issues[0].kind == "undefined"
+        assert issues[0].name == "ordrs"
+        assert issues[0].line == 18
+        assert issues[0].suggestion == "orders"
+
+    def test_cycles(self):
+        """Test that each dependency cycle is reported once."""
+        content = (
+            "```sql a\nselect * from ${b}\n```\n"
+            "```sql b\nselect * from ${c}\n```\n"
+            "```sql c\nselect * from ${a}\n```\n"
+            "```sql d\nselect * from ${d}\n```\n"
+        )
+        graph = PageQueryGraph.from_content(content)
+
+        assert graph.cycles() == [["a", "b", "c", "a"], ["d", "d"]]
+        assert [issue.kind for issue in graph.issues()] == ["cycle", "cycle"]
+
+    def test_issues_computed_once_and_indexed(self, monkeypatch):
+        """Test that issues are found once per graph and looked up by name and line."""
+        from evidence_mcp.services import query_graph
+
+        content = "```sql orders\nselect 1\n```\n<Value data={ordrs}/>\n<Value data={ordrs}/>\n"
+        graph = PageQueryGraph.from_content(content)
+        calls = []
+        close_matches = query_graph.difflib.get_close_matches
+        monkeypatch.setattr(
+            query_graph.difflib,
+            "get_close_matches",
+            lambda *args, **kwargs: calls.append(args) or close_matches(*args, **kwargs),
+        )
+
+        assert graph.issues() is graph.issues()
+        assert len(calls) == 1
+        assert graph.issue_named({"Value", "ordrs"}) is graph.issues()[0]
+        assert graph.issue_at(5) is graph.issues()[1]
+        assert graph.issue_named({"orders"}) is None
+        assert graph.issue_at(1) is None
+
+
+class TestProjectQueryGraph:
+    """Tests for ProjectQueryGraph."""
+
+    def test_refresh_only_reparses_changed_pages(self, tmp_path):
+        """Test incremental rebuilds across the project."""
+        pages = tmp_path / "pages"
+        pages.mkdir()
+        (pages / "a.md").write_text("```sql q\nselect 1\n```\n<Value data={q}/>\n")
+        (pages / "b.md").write_text("<Value data={missing}/>\n")
+        graph = ProjectQueryGraph(tmp_path)
+
+        graphs = graph.refresh()
+        assert list(graphs) == ["a.md", "b.md"]
+        assert [issue.name for issue in graphs["b.md"].issues()] == ["missing"]
+
+        page = pages / "b.md"
+        stat = page.stat()
+        page.write_text("```sql missing\nselect 1\n```\n<Value data={missing}/>\n")
+        os.utime(page, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        graphs = graph.refresh()
+        assert graphs["b.md"].issues() == []
+        assert graph.pages_parsed == 3
+
+    def test_concurrent_refreshes_parse_pages_once(self, tmp_path):
+        """Test that refreshes from several threads do not parse the same page twice."""
+        pages = tmp_path / "pages"
+        pages.mkdir()
+        for i in range(20):
+            (pages / f"p{i}.md").write_text(f"```sql q{i}\nselect {i}\n```\n")
+        graph = ProjectQueryGraph(tmp_path)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: graph.refresh(), range(8)))
+
+        assert all(len(graphs) == 20 for graphs in results)
+        assert graph.pages_parsed == 20
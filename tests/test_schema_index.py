@@ -0,0 +1,78 @@
+"""Tests for the schema name index."""
+
+import pytest
+
+from evidence_mcp.services.schema_index import SchemaIndex
+
+
+@pytest.fixture
+def index():
+    """Build an index over two sources."""
+    return SchemaIndex(
+        {
+            "sources": {
+                "sales": {
+                    "tables": {
+                        "orders": {
+                            "columns": [
+                                {"name": "order_id", "type": "Float64"},
+                                {"name": "order_date", "type": "Date"},
+                                {"name": "customer_id", "type": "Float64"},
+                            ]
+                        },
+                        "fact_returns": {
+                            "columns": [{"name": "return_date", "type": "Date"}]
+                        },
+                    }
+                },
+                "crm": {
+                    "tables": {
+                        "customers": {
+                            "columns": [
+                                {"name": "customer_id", "type": "Float64"},
+                                {"name": "Name", "type": "String"},
+                            ]
+                        }
+                    }
+                },
+            }
+        }
+    )
+
+
+def names(index, matches):
+    return [index.table_names[table_id] for table_id, _ in matches]
+
+
+def test_filter_all(index):
+    """Test that no filters return every table in schema order."""
+    assert names(index, index.filter()) == ["sales.orders", "sales.fact_returns", "crm.customers"]
+
+
+def test_filter_by_source(index):
+    """Test filtering by source name, case-insensitively."""
+    assert names(index, index.filter(source="CRM")) == ["crm.customers"]
+
+
+def test_filter_table_substring_and_wildcard(index):
+    """Test substring and wildcard table patterns."""
+    assert names(index, index.filter(table_pattern="order")) == ["sales.orders"]
+    assert names(index, index.filter(table_pattern="sales.fact_*")) == ["sales.fact_returns"]
+    assert names(index, index.filter(table_pattern="*.c?stomers")) == ["crm.customers"]
+    assert index.filter(table_pattern="nothing") == []
+
+
+def test_filter_columns(index):
+    """Test that column patterns keep only matching columns."""
+    tables = index.to_json(index.filter(column_pattern="*_date"))
+
+    assert [t["name"] for t in tables] == ["sales.orders", "sales.fact_returns"]
+    assert [c["name"] for c in tables[0]["columns"]] == ["order_date"]
+
+
+def test_filter_combined(index):
+    """Test combining source and column filters."""
+    tables = index.to_json(index.filter(source="crm", column_pattern="name"))
+
+    assert [t["name"] for t in tables] == ["crm.customers"]
+    assert [c["name"] for c in tables[0]["columns"]] == ["Name"]
@@ -0,0 +1,81 @@
+"""Tests for the columnar schema store."""
+
+from evidence_mcp.models.schemas import MetadataResponse
+from evidence_mcp.services.schema_store import ColumnList, SchemaStore
+
+SCHEMA = {
+    "sources": {
+        "sales": {
+            "tables": {
+                "orders": {
+                    "columns": [
+                        {"name": "id", "type": "Float64"},
+                        {"name": "placed_at", "type": "Date"},
+                    ]
+                },
+                "empty": {"columns": []},
+            }
+        },
+        "crm": {"tables": {"customers": {"columns": [{"name": "id", "type": "Float64"}]}}},
+    }
+}
+
+
+def test_columnar_layout():
+    """Test that columns are stored as interned names and shared type codes."""
+    store = SchemaStore(SCHEMA)
+
+    assert store.table_names == ["sales.orders", "sales.empty", "crm.customers"]
+    assert list(store.column_starts) == [0, 2, 2, 3]
+    assert store.type_names == ["Float64", "Date"]
+    assert list(store.column_types) == [0, 1, 0]
+    assert store.column_names[0] is store.column_names[2]
+    assert list(store.columns(1)) == []
+
+
+def test_tables_json_matches_model_dump():
+    """Test that the store serializes to the same shape as the pydantic models."""
+    store = SchemaStore(SCHEMA)
+
+    payload = MetadataResponse.payload(store.tables_json())
+
+    assert payload == MetadataResponse.from_manifest(SCHEMA).model_dump()
+
+
+def test_tables_json_selected_columns():
+    """Test serializing filter matches with a subset of columns."""
+    store = SchemaStore(SCHEMA)
+
+    assert store.tables_json([(0, [1]), (2, None)]) == [
+        {"name": "sales.orders", "columns": [{"name": "placed_at", "type": "Date"}]},
+        {"name": "crm.customers", "columns": [{"name": "id", "type": "Float64"}]},
+    ]
+
+
+def test_column_list():
+    """Test that a column list reads and compares as a list of column dicts."""
+    columns = ColumnList.from_dicts(SCHEMA["sources"]["sales"]["tables"]["orders"]["columns"])
+
+    assert columns == SCHEMA["sources"]["sales"]["tables"]["orders"]["columns"]
+    assert columns == ColumnList(["id", "placed_at"], ["Float64", "Date"])
+    assert columns != ColumnList(["id"], ["Float64"])
+    assert columns[1] == {"name": "placed_at", "type": "Date"}
+    assert columns[:1] == [{"name": "id", "type": "Float64"}]
+    assert len(ColumnList()) == 0
+
+
+def test_store_from_column_lists():
+    """Test that a schema holding column lists builds the same store as one with dicts."""
+    schema = {
+        "sources": {
+            name: {
+                "tables": {
+                    table: {"columns": ColumnList.from_dicts(data["columns"])}
+                    for table, data in source["tables"].items()
+                }
+            }
+            for name, source in SCHEMA["sources"].items()
+        }
+    }
+
+    assert SchemaStore(schema).tables_json() == SchemaStore(SCHEMA).tables_json()
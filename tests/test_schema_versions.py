@@ -0,0 +1,123 @@
+"""Tests for versioned schema snapshots."""
+
+from evidence_mcp.services.schema_versions import (
+    SchemaVersions,
+    diff_columns,
+    schema_version,
+    table_hash,
+)
+
+
+def schema(**tables):
+    """A normalized schema with the given tables in source 'db'."""
+    return {
+        "sources": {
+            "db": {
+                "tables": {
+                    name: {"columns": [{"name": c, "type": t} for c, t in columns]}
+                    for name, columns in tables.items()
+                }
+            }
+        }
+    }
+
+
+ORDERS = [("id", "Int64"), ("total", "Float64")]
+CUSTOMERS = [("id", "Int64"), ("name", "String")]
+
+
+def test_table_hash():
+    """Test that hashes depend on names, types and order of columns."""
+    columns = [{"name": "id", "type": "Int64"}, {"name": "total", "type": "Float64"}]
+
+    assert table_hash(columns) == table_hash([dict(c) for c in columns])
+    assert table_hash(columns) != table_hash(columns[::-1])
+    assert table_hash(columns) != table_hash([columns[0], {"name": "total", "type": "Int64"}])
+
+
+def test_diff_columns():
+    """Test column additions, removals, type changes and reordering."""
+    old = [{"name": "a", "type": "Int64"}, {"name": "b", "type": "String"}]
+    new = [{"name": "b", "type": "Date"}, {"name": "c", "type": "Int64"}]
+
+    diff = diff_columns("db.t", old, new)
+
+    assert diff.added_columns == [{"name": "c", "type": "Int64"}]
+    assert diff.removed_columns == ["a"]
+    assert diff.changed_types == [("b", "String", "Date")]
+    assert not diff.reordered
+    assert diff_columns("db.t", old, old[::-1]).reordered
+
+
+class TestSchemaVersions:
+    """Tests for SchemaVersions."""
+
+    def test_unchanged_schema_keeps_version(self):
+        """Test that recording an equal schema does not create a version."""
+        versions = SchemaVersions()
+
+        first = versions.record(schema(orders=ORDERS))
+        second = versions.record(schema(orders=ORDERS))
+
+        assert first == second
+        assert len(versions.snapshots) == 1
+
+    def test_versions_derive_from_content(self):
+        """Test that separate histories (workers, restarts) agree on a schema's version."""
+        worker_a, worker_b = SchemaVersions(), SchemaVersions()
+        worker_a.record(schema(orders=ORDERS))
+        since = worker_a.record(schema(orders=ORDERS, customers=CUSTOMERS))
+
+        worker_b.record(schema(customers=CUSTOMERS, orders=ORDERS))
+        worker_b.record(schema(orders=ORDERS))
+
+        assert worker_b.snapshots[0].version == since
+        assert worker_b.changes(since).removed == ["db.customers"]
+        assert 0 <= since < 2**53
+        assert schema_version({}) != since
+
+    def test_changes(self):
+        """Test added, removed and altered tables between versions."""
+        versions = SchemaVersions()
+        since = versions.record(schema(orders=ORDERS, customers=CUSTOMERS))
+        current = versions.record(
+            schema(orders=ORDERS + [("placed_at", "Date")], products=[("sku", "String")])
+        )
+
+        changes = versions.changes(since)
+
+        assert current == changes.version != since
+        assert changes.added == [("db.products", [{"name": "sku", "type": "String"}])]
+        assert changes.removed == ["db.customers"]
+        assert [diff.name for diff in changes.altered] == ["db.orders"]
+        assert changes.altered[0].added_columns == [{"name": "placed_at", "type": "Date"}]
+        assert versions.changes(current) == (current, [], [], [])
+
+    def test_unchanged_tables_are_not_rehashed(self, monkeypatch):
+        """Test that tables sharing their columns list with the last snapshot reuse its hash."""
+        from evidence_mcp.services import schema_versions
+
+        versions = SchemaVersions()
+        first = schema(orders=ORDERS, customers=CUSTOMERS)
+        versions.record(first)
+        hashed = []
+        monkeypatch.setattr(
+            schema_versions, "table_hash", lambda columns: hashed.append(columns) or "h"
+        )
+
+        second = {"sources": {"db": {"tables": dict(first["sources"]["db"]["tables"])}}}
+        second["sources"]["db"]["tables"]["orders"] = {"columns": []}
+        versions.record(second)
+
+        assert hashed == [[]]
+
+    def test_old_and_unknown_versions(self):
+        """Test that versions no longer kept, or never issued, return None."""
+        versions = SchemaVersions(max_snapshots=2)
+        oldest = versions.record(schema(a=ORDERS))
+        kept = versions.record(schema(b=ORDERS))
+        versions.record(schema(c=ORDERS))
+
+        assert versions.changes(oldest) is None
+        assert versions.changes(kept) is not None
+        assert versions.changes(42) is None
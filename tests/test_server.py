@@ -1,7 +1,29 @@
 """Tests for the main server module."""
 
 
-from evidence_mcp.server import validate_evidence_content, analyze_error
+import json
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from evidence_mcp.server import (
+    analyze_error,
+    get_page_cache,
+    locate_error,
+    mcp,
+    metrics,
+    validate_evidence_content,
+)
+from evidence_mcp.services.json_encoding import to_json
+from evidence_mcp.services.line_index import LineIndex
+from evidence_mcp.services.query_graph import PageQueryGraph
+
+
+def response_json(result):
+    """Decode a tool function's result as the client receives it."""
+    return json.loads(result if isinstance(result, str) else to_json(result))
 
 
 class TestValidateEvidenceContent:
@@ -72,6 +94,43 @@ SELECT * FROM products
         warnings = validate_evidence_content(content)
         assert any("unclosed" in w.lower() for w in warnings)
 
+    def test_tags_inside_code_fences_ignored(self):
+        """Test that markup inside code blocks is not validated."""
+        content = """
+```sql filtered
+select * from orders where amount <total> 0
+```
+
+```markdown
+<Grid cols=2>
+```
+"""
+        warnings = validate_evidence_content(content)
+        assert warnings == []
+
+    def test_unclosed_tag_reports_line(self):
+        """Test that unclosed tag warnings include the line of the opening tag."""
+        content = "<Tabs>\n<Tab label=A>\n</Tab>\n"
+        warnings = validate_evidence_content(content)
+        assert warnings == ["Potentially unclosed <Tabs> tag (line 1)"]
+
+
+class TestGetPageCache:
+    """Tests for per-session page validation caches."""
+
+    def test_cache_per_session(self):
+        """Test that each session gets its own cache, reused across requests."""
+        class Session:
+            pass
+
+        session_a, session_b = Session(), Session()
+
+        cache = get_page_cache(SimpleNamespace(session=session_a))
+
+        assert cache is get_page_cache(SimpleNamespace(session=session_a))
+        assert cache is not get_page_cache(SimpleNamespace(session=session_b))
+        assert get_page_cache(None) is None
+
 
 class TestAnalyzeError:
     """Tests for the analyze_error function."""
@@ -91,6 +150,29 @@ class TestAnalyzeError:
         assert suggestion.error_index == 0
         assert "query" in suggestion.description.lower()
 
+    def test_query_reference_error_with_graph(self):
+        """Test that the query graph pinpoints the undefined reference."""
+        content = "```sql orders\nselect 1\n```\n\n<LineChart data={ordrs}/>\n"
+        error = {"message": "ordrs is not defined"}
+
+        suggestion = analyze_error(error, content, 0, PageQueryGraph.from_content(content))
+
+        assert suggestion is not None
+        assert "ordrs" in suggestion.description
+        assert suggestion.suggested_fix == "Replace 'ordrs' with 'orders'"
+        assert suggestion.line_range == (5, 5)
+
+    def test_unrelated_error_is_not_a_query_issue(self):
+        """Test that an error naming neither the query nor its line is not blamed on it."""
+        content = "```sql orders\nselect amount\n```\n\n<LineChart data={ordrs}/>\n"
+        error = {"message": 'Referenced column "amout" not found', "line": 2}
+
+        suggestion = analyze_error(error, content, 0, PageQueryGraph.from_content(content))
+
+        assert suggestion is not None
+        assert "ordrs" not in suggestion.description
+        assert suggestion.category != "query"
+
     def test_missing_prop_error(self):
         """Test analysis of missing required prop errors."""
         error = {
@@ -119,6 +201,17 @@ class TestAnalyzeError:
         assert suggestion is not None
         assert "syntax" in suggestion.description.lower()
 
+    def test_duckdb_error(self):
+        """Test that rule matches carry the category, doc link and captured names."""
+        error = {"message": "Catalog Error: Table with name sales.ordrs does not exist!"}
+
+        suggestion = analyze_error(error, "", 0)
+
+        assert suggestion is not None
+        assert suggestion.category == "sql"
+        assert "sales.ordrs" in suggestion.description
+        assert suggestion.doc_link.startswith("https://")
+
     def test_generic_error(self):
         """Test analysis of generic errors."""
         error = {
@@ -131,3 +224,416 @@ class TestAnalyzeError:
 
         assert suggestion is not None
         assert suggestion.error_index == 0
+
+
+class TestLocateError:
+    """Tests for the locate_error function."""
+
+    def test_error_line_and_block(self):
+        """Test that a suggestion gets its source line and enclosing block."""
+        content = "```sql orders\nselect amt\nfrom sales.orders\n```\n"
+        error = {"message": "Parser Error: syntax error", "line": 2, "column": 8}
+        suggestion = analyze_error(error, content, 0)
+
+        location = locate_error(LineIndex(content), error, suggestion)
+
+        assert location.source_line == "select amt"
+        assert location.block.kind == "sql"
+        assert location.block.name == "orders"
+        assert location.block.line_range == (1, 4)
+
+    def test_falls_back_to_suggestion_line(self):
+        """Test that errors without a line use the line the suggestion points at."""
+        content = "```sql orders\nselect 1\n```\n\n<LineChart data={ordrs}/>\n"
+        error = {"message": "ordrs is not defined"}
+        suggestion = analyze_error(error, content, 0, PageQueryGraph.from_content(content))
+
+        location = locate_error(LineIndex(content), error, suggestion)
+
+        assert location.line == 5
+        assert location.block.name == "LineChart"
+
+        suggestion.line_range = None
+        assert locate_error(LineIndex(content), {"line": "5"}, suggestion) is None
+
+
+class TestSchemaChecks:
+    """Tests for schema checks in page validation."""
+
+    async def test_corrupt_schema_file(self, tmp_path, monkeypatch, caplog):
+        """Test that a half-written schema file skips schema checks instead of failing."""
+        from evidence_mcp import server
+        from evidence_mcp.services.evidence_client import EvidenceClient
+
+        data_dir = tmp_path / "static" / "data"
+        (data_dir / "db" / "orders").mkdir(parents=True)
+        (data_dir / "manifest.json").write_text(
+            json.dumps({"renderedFiles": {"db": ["static/data/db/orders/orders.parquet"]}})
+        )
+        (data_dir / "db" / "orders" / "orders.schema.json").write_text('[{"name": "id"')
+        client = EvidenceClient(evidence_project_path=tmp_path)
+        monkeypatch.setattr(server, "_evidence_client", client)
+        monkeypatch.setattr(server.settings, "watch_files", False)
+
+        result = response_json(
+            await server.edit_page("Add query", "```sql q\nselect * from db.nope\n```\n")
+        )
+
+        assert result["success"] is True
+        assert result["warnings"] == []
+        assert "skipping schema checks" in caplog.text
+
+
+class TestToolMetrics:
+    """Tests for tool call instrumentation."""
+
+    async def test_calls_recorded(self):
+        """Test that tool calls record latency, response size and error results."""
+        before = metrics.tools["get_query_graph"].calls if "get_query_graph" in metrics.tools else 0
+
+        await mcp.call_tool("get_query_graph", {"page_content": "<LineChart data={orders}/>"})
+        await mcp.call_tool("get_query_graph", {"page": "missing"})
+
+        stats = metrics.tools["get_query_graph"]
+        assert stats.calls == before + 2
+        assert stats.errors >= 1
+        assert stats.size.total > 0
+        result = await mcp.call_tool("server_stats", {})
+        assert '"name": "get_query_graph"' in result[0].text
+
+    async def test_dev_server_health_reported(self, monkeypatch, tmp_path):
+        """Test that server_stats reports the dev server breaker once the client exists."""
+        from evidence_mcp import server
+        from evidence_mcp.services.evidence_client import EvidenceClient
+
+        monkeypatch.setattr(server, "_evidence_client", None)
+        assert response_json(await server.server_stats())["dev_server"] is None
+
+        client = EvidenceClient(evidence_project_path=tmp_path)
+        client.health.record_failure()
+        monkeypatch.setattr(server, "_evidence_client", client)
+        dev_server = response_json(await server.server_stats())["dev_server"]
+
+        assert dev_server["status"] == "down"
+        assert dev_server["consecutive_failures"] == 1
+        assert 0 < dev_server["retry_in"] <= client.health.base_backoff
+
+
+class TestResponseEncoding:
+    """Tests for encoding tool results in call_tool."""
+
+    async def test_read_docs_encoded_once(self, monkeypatch):
+        """Test that a whole doc page is encoded once and sent as its JSON text."""
+        from evidence_mcp import server
+        from evidence_mcp.services.json_encoding import ResponseEncoder
+
+        monkeypatch.setattr(server, "_response_encoder", ResponseEncoder())
+        arguments = {"doc_type": "charts", "component": "LineChart"}
+
+        first = await mcp.call_tool("read_docs", arguments)
+        second = await mcp.call_tool("read_docs", arguments)
+        partial = await mcp.call_tool("read_docs", {**arguments, "max_chars": 100})
+
+        page = server.get_doc_registry().lookup("charts", "LineChart")
+        assert first[0].text == second[0].text == to_json(page)
+        assert json.loads(partial[0].text)["next_cursor"] is not None
+        assert server._response_encoder.cache_info() == {"hits": 1, "misses": 1, "size": 1}
+
+    async def test_uncached_docs_are_not_kept(self, monkeypatch, tmp_path):
+        """Test that not-found pages and pages the registry does not cache are encoded anew."""
+        from evidence_mcp import server
+        from evidence_mcp.services.doc_registry import DocRegistry
+        from evidence_mcp.services.json_encoding import ResponseEncoder
+
+        monkeypatch.setattr(server, "_response_encoder", ResponseEncoder())
+        arguments = {"doc_type": "charts", "component": "LineChart"}
+        uncached = DocRegistry(server.get_settings().get_docs_path(), cache_size=0)
+        empty = DocRegistry(tmp_path)
+
+        for registry in (uncached, uncached, empty, empty):
+            monkeypatch.setattr(server, "_doc_registry", registry)
+            result = await mcp.call_tool("read_docs", arguments)
+
+        assert json.loads(result[0].text)["title"] == "Documentation not found"
+        assert server._response_encoder.cache_info() == {"hits": 0, "misses": 0, "size": 0}
+
+
+class TestLazyImports:
+    """Tests that importing the server defers services and their dependencies."""
+
+    def test_import_defers_services(self):
+        """Test that no service, frontmatter, settings or FastMCP server loads at import."""
+        code = (
+            "import sys, evidence_mcp.server\n"
+            "print(sorted(m for m in sys.modules if m.startswith('evidence_mcp.services.')))\n"
+            "print('frontmatter' in sys.modules, 'yaml' in sys.modules)\n"
+            "from evidence_mcp.config import get_settings\n"
+            "print(get_settings.cache_info().currsize, evidence_mcp.server._mcp)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        services, deps, loaded = result.stdout.splitlines()
+
+        assert services == "['evidence_mcp.services.metrics']"
+        assert deps == "False False"
+        assert loaded == "0 None"
+
+    def test_validate_evidence_content_export(self):
+        """Test that the lazily re-exported validator resolves on access."""
+        from evidence_mcp import server
+        from evidence_mcp.services.page_validator import validate_evidence_content
+
+        assert server.validate_evidence_content is validate_evidence_content
+
+
+class TestCloseServices:
+    """Tests for close_services."""
+
+    async def test_closes_and_resets_services(self, monkeypatch):
+        """Test that the watcher, client and validator pool are released."""
+        from evidence_mcp import server
+
+        calls = []
+
+        async def stop():
+            calls.append("watcher")
+
+        async def close():
+            calls.append("client")
+
+        monkeypatch.setattr(server, "_file_watcher", SimpleNamespace(stop=stop))
+        monkeypatch.setattr(server, "_evidence_client", SimpleNamespace(close=close))
+        monkeypatch.setattr(
+            server, "_project_validator", SimpleNamespace(close=lambda: calls.append("validator"))
+        )
+
+        await server.close_services()
+        await server.close_services()
+
+        assert calls == ["watcher", "client", "validator"]
+        assert server._evidence_client is None
+
+
+class TestGetMetadataStats:
+    """Tests for get_metadata with include_stats."""
+
+    async def test_include_stats(self, tmp_path, monkeypatch):
+        """Test that Parquet statistics are added for the returned tables only."""
+        from evidence_mcp import server
+        from evidence_mcp.services.evidence_client import EvidenceClient
+
+        from .test_parquet_footer import write_parquet
+
+        data_dir = tmp_path / "static" / "data"
+        (data_dir / "db" / "orders").mkdir(parents=True)
+        (data_dir / "manifest.json").write_text(
+            json.dumps({"renderedFiles": {"db": ["static/data/db/orders/orders.parquet"]}})
+        )
+        (data_dir / "db" / "orders" / "orders.schema.json").write_text(
+            json.dumps([{"name": "id", "evidenceType": "number"}])
+        )
+        write_parquet(data_dir / "db" / "orders" / "orders.parquet")
+        client = EvidenceClient(evidence_project_path=tmp_path)
+        monkeypatch.setattr(server, "_evidence_client", client)
+        monkeypatch.setattr(server.settings, "watch_files", False)
+
+        plain = response_json(await server.get_metadata())
+        result = response_json(
+            await server.get_metadata(table_pattern="orders", include_stats=True)
+        )
+
+        assert plain["stats"] is None
+        stats = result["stats"]["db.orders"]
+        assert stats["row_count"] == 150
+        assert stats["columns"][0] == {
+            "name": "id",
+            "null_count": 0,
+            "min": 1,
+            "max": 150,
+            "compressed_bytes": 600,
+        }
+
+
+class TestGetMetadataPaging:
+    """Tests for get_metadata's limit and cursor arguments."""
+
+    @pytest.fixture
+    def tables(self, tmp_path, monkeypatch):
+        """Serve a project with three tables from the server's client."""
+        from evidence_mcp import server
+        from evidence_mcp.services.evidence_client import EvidenceClient
+
+        from .test_evidence_client import write_table
+
+        data_dir = tmp_path / "static" / "data"
+        data_dir.mkdir(parents=True)
+        names = ["a", "b", "c"]
+        rendered = [f"static/data/db/{name}/{name}.parquet" for name in names]
+        (data_dir / "manifest.json").write_text(json.dumps({"renderedFiles": {"db": rendered}}))
+        for name in names:
+            write_table(data_dir, "db", name, [("id", "number")])
+        client = EvidenceClient(evidence_project_path=tmp_path)
+        monkeypatch.setattr(server, "_evidence_client", client)
+        monkeypatch.setattr(server.settings, "watch_files", False)
+        return [f"db.{name}" for name in names]
+
+    async def test_pages(self, tables):
+        """Test paging through the schema with limit and next_cursor."""
+        from evidence_mcp import server
+
+        first = response_json(await server.get_metadata(limit=2))
+        rest = response_json(await server.get_metadata(limit=2, cursor=first["next_cursor"]))
+
+        assert [t["name"] for t in first["tables"]] == tables[:2]
+        assert [t["name"] for t in rest["tables"]] == tables[2:]
+        assert first["total_tables"] == rest["total_tables"] == 3
+        assert rest["next_cursor"] is None
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    async def test_invalid_limit(self, tables, limit):
+        """Test that a limit below 1 is an error, not the whole schema."""
+        from evidence_mcp import server
+
+        result = response_json(await server.get_metadata(limit=limit))
+
+        assert "'limit' must be a positive number" in result["error"]
+        assert result["tables"] == []
+
+    @pytest.mark.parametrize("cursor", ["abc", "-1", "", "\u0663"])
+    async def test_invalid_cursor(self, tables, cursor):
+        """Test that an undecodable cursor is an error instead of restarting at the top."""
+        from evidence_mcp import server
+
+        result = response_json(await server.get_metadata(limit=1, cursor=cursor))
+
+        assert result["error"].startswith("Invalid cursor")
+        assert result["tables"] == []
+
+    async def test_cursor_without_limit(self, tables):
+        """Test that a cursor alone returns the rest of the tables."""
+        from evidence_mcp import server
+
+        result = response_json(await server.get_metadata(cursor="1"))
+
+        assert [t["name"] for t in result["tables"]] == tables[1:]
+        assert result["next_cursor"] is None
+
+
+class TestGetMetadataChanges:
+    """Tests for get_metadata_changes."""
+
+    async def test_changes_since_get_metadata(self, tmp_path, monkeypatch):
+        """Test that only the changed table is returned after a source rerun."""
+        from evidence_mcp import server
+        from evidence_mcp.services.evidence_client import EvidenceClient
+
+        from .test_evidence_client import write_table
+
+        data_dir = tmp_path / "static" / "data"
+        data_dir.mkdir(parents=True)
+        (data_dir / "manifest.json").write_text(
+            json.dumps(
+                {
+                    "renderedFiles": {
+                        "db": ["static/data/db/orders/o.parquet", "static/data/db/users/u.parquet"]
+                    }
+                }
+            )
+        )
+        write_table(data_dir, "db", "orders", [("id", "number")])
+        write_table(data_dir, "db", "users", [("id", "number")])
+        client = EvidenceClient(evidence_project_path=tmp_path)
+        monkeypatch.setattr(server, "_evidence_client", client)
+        monkeypatch.setattr(server.settings, "watch_files", False)
+
+        version = response_json(await server.get_metadata())["schema_version"]
+        unchanged = response_json(await server.get_metadata_changes(since_version=version))
+        write_table(data_dir, "db", "orders", [("id", "number"), ("total", "number")])
+        changed = response_json(await server.get_metadata_changes(since_version=version))
+
+        assert unchanged["version"] == version
+        assert unchanged["changed_tables"] == []
+        assert changed["version"] not in (None, version)
+        assert changed["added_tables"] == changed["removed_tables"] == []
+        assert changed["changed_tables"] == [
+            {
+                "name": "db.orders",
+                "added_columns": [{"name": "total", "type": "Float64"}],
+                "removed_columns": [],
+                "changed_columns": [],
+                "reordered": False,
+            }
+        ]
+
+    async def test_unknown_version(self, tmp_path, monkeypatch):
+        """Test that an unknown version asks for a full refresh."""
+        from evidence_mcp import server
+        from evidence_mcp.services.evidence_client import EvidenceClient
+
+        from .test_evidence_client import write_table
+
+        data_dir = tmp_path / "static" / "data"
+        data_dir.mkdir(parents=True)
+        (data_dir / "manifest.json").write_text(
+            json.dumps({"renderedFiles": {"db": ["static/data/db/orders/o.parquet"]}})
+        )
+        write_table(data_dir, "db", "orders", [("id", "number")])
+        client = EvidenceClient(evidence_project_path=tmp_path)
+        monkeypatch.setattr(server, "_evidence_client", client)
+        monkeypatch.setattr(server.settings, "watch_files", False)
+
+        current = response_json(await server.get_metadata_changes())
+        stale = response_json(await server.get_metadata_changes(since_version=1))
+
+        assert current["full_refresh"] is False
+        assert stale["full_refresh"] is True
+        assert stale["version"] == current["version"]
+
+
+class TestTableDataTools:
+    """Tests for sample_table and profile_column."""
+
+    async def test_unknown_table(self, tmp_path, monkeypatch):
+        """Test that a table without a local Parquet file returns an error."""
+        from evidence_mcp import server
+        from evidence_mcp.services.evidence_client import EvidenceClient
+
+        client = EvidenceClient(evidence_project_path=tmp_path)
+        monkeypatch.setattr(server, "_evidence_client", client)
+        monkeypatch.setattr(server.settings, "watch_files", False)
+
+        result = await server.sample_table("db.missing")
+
+        assert "No Parquet file found for table 'db.missing'" in result["error"]
+
+    async def test_sample_and_profile(self, tmp_path, monkeypatch):
+        """Test both tools on a rendered table."""
+        duckdb = pytest.importorskip("duckdb")
+        from evidence_mcp import server
+        from evidence_mcp.services.evidence_client import EvidenceClient
+
+        data_dir = tmp_path / "static" / "data"
+        (data_dir / "db" / "orders").mkdir(parents=True)
+        (data_dir / "manifest.json").write_text(
+            json.dumps({"renderedFiles": {"db": ["static/data/db/orders/orders.parquet"]}})
+        )
+        conn = duckdb.connect()
+        conn.execute(
+            "COPY (SELECT i AS id FROM range(20) t(i)) "
+            f"TO '{data_dir / 'db' / 'orders' / 'orders.parquet'}' (FORMAT PARQUET)"
+        )
+        conn.close()
+        client = EvidenceClient(evidence_project_path=tmp_path)
+        monkeypatch.setattr(server, "_evidence_client", client)
+        monkeypatch.setattr(server, "_table_data", None)
+        monkeypatch.setattr(server.settings, "watch_files", False)
+
+        sample = response_json(await server.sample_table("db.orders", n=3))
+        profile = response_json(await server.profile_column("db.orders", "id", bins=2))
+        await server.close_services()
+
+        assert sample["table"] == "db.orders"
+        assert len(sample["rows"]) == 3
+        assert profile["distinct_count"] == 20
+        assert [b["count"] for b in profile["histogram"]] == [10, 10]
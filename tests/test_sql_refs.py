@@ -0,0 +1,172 @@
+"""Tests for SQL reference extraction and schema checks."""
+
+from evidence_mcp.services.page_lexer import lex_page
+from evidence_mcp.services.page_validator import validate_evidence_content
+from evidence_mcp.services.schema_index import SchemaIndex
+from evidence_mcp.services.sql_refs import (
+    SqlReference,
+    check_sql_references,
+    extract_sql_references,
+)
+
+SCHEMA = {
+    "sources": {
+        "sales": {
+            "tables": {
+                "orders": {"columns": [{"name": "id"}, {"name": "amount"}, {"name": "cust_id"}]},
+                "customers": {"columns": [{"name": "id"}, {"name": "name"}]},
+            }
+        }
+    }
+}
+
+PAGE = """# Orders
+
+```sql orders
+-- from fake.table is ignored
+select o.amount, c.name, 'from x.y' as label
+from sales.orders as o
+left join sales.customers c on o.cust_id = c.id
+```
+
+```sql by_customer
+select * from ${orders} join sales.custmers using (id)
+```
+"""
+
+
+def refs_for(content):
+    return extract_sql_references(content, list(lex_page(content)))
+
+
+class TestExtractSqlReferences:
+    """Tests for extract_sql_references."""
+
+    def test_tables_and_aliased_columns(self):
+        """Test FROM/JOIN tables and alias-qualified columns with page line numbers."""
+        refs = refs_for(PAGE)
+
+        assert refs == [
+            SqlReference("orders", "sales.orders", "amount", 5),
+            SqlReference("orders", "sales.customers", "name", 5),
+            SqlReference("orders", "sales.orders", None, 6),
+            SqlReference("orders", "sales.customers", None, 7),
+            SqlReference("orders", "sales.orders", "cust_id", 7),
+            SqlReference("orders", "sales.customers", "id", 7),
+            SqlReference("by_customer", "sales.custmers", None, 11),
+        ]
+
+    def test_quoted_and_fully_qualified_names(self):
+        """Test quoted identifiers and source.table.column references."""
+        content = '```sql q\nselect "Sales"."Orders"."Amount" from "Sales"."Orders"\n```\n'
+
+        assert refs_for(content) == [
+            SqlReference("q", "sales.orders", None, 2),
+            SqlReference("q", "sales.orders", "amount", 2),
+        ]
+
+    def test_single_part_names_are_not_tables(self):
+        """Test that CTEs and other queries are not reported as tables."""
+        content = "```sql q\nwith recent as (select 1) select r.x from recent r\n```\n"
+
+        assert refs_for(content) == []
+
+    def test_from_inside_function_calls(self):
+        """Test that FROM in EXTRACT, TRIM and SUBSTRING arguments is not a FROM clause."""
+        content = (
+            "```sql q\n"
+            "select extract(year from o.order_date),\n"
+            "  trim(both ' ' from o.name),\n"
+            "  substring(o.code from 2 for 3)\n"
+            "from sales.orders o\n"
+            "```\n"
+        )
+
+        assert refs_for(content) == [
+            SqlReference("q", "sales.orders", "order_date", 2),
+            SqlReference("q", "sales.orders", "name", 3),
+            SqlReference("q", "sales.orders", "code", 4),
+            SqlReference("q", "sales.orders", None, 5),
+        ]
+
+    def test_subqueries_inside_parentheses(self):
+        """Test that FROM in a parenthesized subquery still names a table."""
+        content = (
+            "```sql q\n"
+            "select coalesce((select max(t.v) from sales.totals t), 0)\n"
+            "from sales.orders o where o.id in (select z.id from sales.refunds z)\n"
+            "```\n"
+        )
+
+        assert refs_for(content) == [
+            SqlReference("q", "sales.totals", None, 2),
+            SqlReference("q", "sales.totals", "v", 2),
+            SqlReference("q", "sales.orders", None, 3),
+            SqlReference("q", "sales.refunds", None, 3),
+            SqlReference("q", "sales.orders", "id", 3),
+            SqlReference("q", "sales.refunds", "id", 3),
+        ]
+
+    def test_derived_tables_and_ctes_hide_table_names(self):
+        """Test that columns of subqueries and CTEs named like a table are not checked."""
+        content = (
+            "```sql q\n"
+            "select orders.total from (select sum(amount) total from sales.orders) orders\n"
+            "```\n"
+            "```sql r\n"
+            "with orders as (select o.id from sales.orders o)\n"
+            "select orders.x, c.name from orders join sales.customers c using (id)\n"
+            "```\n"
+            "```sql s\n"
+            "select t.v, (select max(z.id) from sales.customers z) as t\n"
+            "from (select 1 v) as t, ${orders} orders\n"
+            "```\n"
+        )
+
+        assert refs_for(content) == [
+            SqlReference("q", "sales.orders", None, 2),
+            SqlReference("r", "sales.orders", None, 5),
+            SqlReference("r", "sales.orders", "id", 5),
+            SqlReference("r", "sales.customers", None, 6),
+            SqlReference("r", "sales.customers", "name", 6),
+            SqlReference("s", "sales.customers", None, 9),
+            SqlReference("s", "sales.customers", "id", 9),
+        ]
+        assert check_sql_references(refs_for(content), SchemaIndex(SCHEMA)) == []
+
+
+class TestCheckSqlReferences:
+    """Tests for check_sql_references."""
+
+    def test_unknown_table_and_column(self):
+        """Test warnings with line numbers and suggestions."""
+        refs = [
+            SqlReference("q", "sales.custmers", None, 4),
+            SqlReference("q", "sales.orders", "amout", 5),
+            SqlReference("q", "sales.orders", "amount", 5),
+        ]
+
+        warnings = check_sql_references(refs, SchemaIndex(SCHEMA))
+
+        assert warnings == [
+            "Unknown table 'sales.custmers' in query 'q' (line 4). "
+            "Did you mean 'sales.customers'?",
+            "Unknown column 'amout' in table 'sales.orders' in query 'q' (line 5). "
+            "Did you mean 'amount'?",
+        ]
+
+    def test_empty_schema_skips_checks(self):
+        """Test that nothing is reported when no schema is loaded."""
+        refs = [SqlReference("q", "sales.nope", None, 1)]
+
+        assert check_sql_references(refs, SchemaIndex({"sources": {}})) == []
+
+    def test_validate_with_schema(self):
+        """Test that page validation includes SQL reference warnings."""
+        warnings = validate_evidence_content(PAGE, SchemaIndex(SCHEMA))
+
+        assert warnings == [
+            "Unknown table 'sales.custmers' in query 'by_customer' (line 11). "
+            "Did you mean 'sales.customers'?"
+        ]
+        assert validate_evidence_content(PAGE) == []
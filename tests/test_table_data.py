@@ -0,0 +1,106 @@
+"""Tests for DuckDB-backed table sampling and column profiling."""
+
+import datetime
+import decimal
+import sys
+
+import pytest
+
+from evidence_mcp.services.table_data import INSTALL_HINT, TableDataReader, _json_value
+
+
+def test_json_value():
+    """Test conversion of DuckDB result values to JSON-friendly values."""
+    assert _json_value(datetime.date(2024, 1, 2)) == "2024-01-02"
+    assert _json_value(decimal.Decimal("1.50")) == 1.5
+    assert _json_value(b"\x01\xff") == "0x01ff"
+    assert _json_value(float("nan")) == "nan"
+    assert _json_value({"a": [1, datetime.time(12, 30)]}) == {"a": [1, "12:30:00"]}
+    assert _json_value("x" * 500).endswith("...")
+
+
+def test_missing_duckdb(tmp_path, monkeypatch):
+    """Test that a missing duckdb install raises RuntimeError with an install hint."""
+    monkeypatch.setitem(sys.modules, "duckdb", None)
+    path = tmp_path / "t.parquet"
+    path.write_bytes(b"PAR1")
+
+    with pytest.raises(RuntimeError, match="evidence-mcp\\[duckdb\\]"):
+        TableDataReader().sample(path)
+    assert "pip install" in INSTALL_HINT
+
+
+def test_result_cache(tmp_path):
+    """Test that results are cached per query shape until the file changes."""
+    reader = TableDataReader(cache_size=2)
+    path = tmp_path / "t.parquet"
+    path.write_bytes(b"v1")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert reader._cached(path, ("q",), compute) == 1
+    assert reader._cached(path, ("q",), compute) == 1
+    assert reader._cached(path, ("other",), compute) == 2
+    path.write_bytes(b"v2 changed")
+    assert reader._cached(path, ("q",), compute) == 3
+    assert reader.cache_info() == {"hits": 1, "misses": 3, "size": 2}
+
+
+@pytest.fixture
+def parquet_file(tmp_path):
+    """Write an orders table to a Parquet file with DuckDB."""
+    duckdb = pytest.importorskip("duckdb")
+    path = tmp_path / "orders.parquet"
+    conn = duckdb.connect()
+    conn.execute(
+        "COPY (SELECT i AS id, i % 3 AS region_id, "
+        "CASE WHEN i % 10 = 0 THEN NULL ELSE 'cat_' || (i % 4) END AS category, "
+        "DATE '2024-01-01' + i::INTEGER AS day FROM range(100) t(i)) "
+        f"TO '{path}' (FORMAT PARQUET)"
+    )
+    conn.close()
+    return path
+
+
+class TestTableDataReader:
+    """Tests for TableDataReader against real Parquet files."""
+
+    def test_sample(self, parquet_file):
+        """Test sampling selected columns."""
+        reader = TableDataReader()
+
+        result = reader.sample(parquet_file, n=5, columns=["id", "day"])
+
+        assert result["columns"] == ["id", "day"]
+        assert len(result["rows"]) == 5
+        assert result["total_rows"] == 100
+        assert isinstance(result["rows"][0][1], str)
+        assert reader.sample(parquet_file, n=5, columns=["id", "day"]) is result
+        reader.close()
+
+    def test_unknown_column(self, parquet_file):
+        """Test that unknown columns are reported with the available ones."""
+        with pytest.raises(ValueError, match="Available: id, region_id"):
+            TableDataReader().sample(parquet_file, columns=["nope"])
+
+    def test_profile_numeric(self, parquet_file):
+        """Test counts, top values and histogram of a numeric column."""
+        profile = TableDataReader().profile(parquet_file, "id", top_k=3, bins=4)
+
+        assert profile["row_count"] == 100
+        assert profile["distinct_count"] == 100
+        assert (profile["min"], profile["max"]) == (0, 99)
+        assert len(profile["top_values"]) == 3
+        assert [b["count"] for b in profile["histogram"]] == [25, 25, 25, 25]
+
+    def test_profile_text(self, parquet_file):
+        """Test null counts and top values of a text column without histogram."""
+        profile = TableDataReader().profile(parquet_file, "category")
+
+        assert profile["null_count"] == 10
+        assert profile["distinct_count"] == 4
+        assert profile["histogram"] is None
+        assert sum(v["count"] for v in profile["top_values"]) == 90